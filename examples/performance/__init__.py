@@ -7,6 +7,7 @@ profile and associated implications:
 * individual inserts, with or without transactions
 * fetching large numbers of rows
 * running lots of short queries
+* sharing the compiled cache among many threads
 
 All suites include a variety of use patterns illustrating both Core
 and ORM use, and are generally sorted in order of performance from worst
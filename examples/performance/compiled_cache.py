@@ -0,0 +1,85 @@
+"""This series of tests compares the throughput of the LRU caches used
+for the compiled cache of an :class:`_engine.Engine`, as the number of
+threads sharing the cache grows.
+
+Each thread performs a mix of hits and misses against a cache that's
+slightly smaller than the set of keys used, as is typical of the compiled
+cache under load.  Scaling with thread count depends on the interpreter in
+use; with the GIL enabled, the sharded cache is expected to be somewhat
+slower due to its additional hashing, and is only used by
+:class:`_engine.Engine` on free-threaded builds.
+
+"""
+import threading
+
+from sqlalchemy import util
+from . import Profiler
+
+
+CAPACITY = 500
+NUM_KEYS = 600
+
+keys = [("stmt", i, ("col%d" % i,)) for i in range(NUM_KEYS)]
+
+
+Profiler.init("compiled_cache", num=20000)
+
+
+def _run(cache, num_threads, n):
+    def worker(offset):
+        for i in range(n):
+            key = keys[(i * 7 + offset) % NUM_KEYS]
+            value = cache.get(key)
+            if value is None:
+                cache[key] = key
+            else:
+                assert value is key
+
+    threads = [
+        threading.Thread(target=worker, args=(i * 13,))
+        for i in range(num_threads)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+@Profiler.profile
+def test_lru_cache_1_thread(n):
+    """LRUCache, one thread."""
+    _run(util.LRUCache(CAPACITY), 1, n)
+
+
+@Profiler.profile
+def test_sharded_lru_cache_1_thread(n):
+    """ShardedLRUCache, one thread."""
+    _run(util.ShardedLRUCache(CAPACITY), 1, n)
+
+
+@Profiler.profile
+def test_lru_cache_16_threads(n):
+    """LRUCache, sixteen threads."""
+    _run(util.LRUCache(CAPACITY), 16, n)
+
+
+@Profiler.profile
+def test_sharded_lru_cache_16_threads(n):
+    """ShardedLRUCache, sixteen threads."""
+    _run(util.ShardedLRUCache(CAPACITY), 16, n)
+
+
+@Profiler.profile
+def test_lru_cache_64_threads(n):
+    """LRUCache, sixty-four threads."""
+    _run(util.LRUCache(CAPACITY), 64, n)
+
+
+@Profiler.profile
+def test_sharded_lru_cache_64_threads(n):
+    """ShardedLRUCache, sixty-four threads."""
+    _run(util.ShardedLRUCache(CAPACITY), 64, n)
+
+
+if __name__ == "__main__":
+    Profiler.main()
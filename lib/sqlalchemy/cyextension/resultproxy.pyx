@@ -128,3 +128,37 @@ def tuplegetter(*indexes):
         return it
     else:
         return lambda row: (it(row),)
+
+
+cdef class FusedProcessor:
+    cdef tuple _indexes
+    cdef tuple _processors
+
+    def __init__(self, tuple indexes, tuple processors):
+        self._indexes = indexes
+        self._processors = processors
+
+    def __call__(self, object row):
+        cdef list data = list(row)
+        cdef Py_ssize_t i
+        cdef Py_ssize_t index
+
+        for i in range(len(self._indexes)):
+            index = self._indexes[i]
+            data[index] = self._processors[i](data[index])
+        return tuple(data)
+
+
+def fused_processor(processors):
+    if not processors:
+        return None
+
+    indexes = tuple(
+        index for index, proc in enumerate(processors) if proc is not None
+    )
+    if not indexes:
+        return None
+
+    return FusedProcessor(
+        indexes, tuple(processors[index] for index in indexes)
+    )
@@ -42,6 +42,44 @@ def _distill_raw_params(object params):
     else:
         raise exc.ArgumentError("mapping or sequence expected for parameters")
 
+def _process_positional_parameters(
+    object compiled_parameters,
+    object getter,
+    tuple processors,
+    object execute_sequence_format,
+):
+    cdef list parameters = []
+    cdef list param
+    cdef Py_ssize_t index
+    cdef object processor
+
+    if not processors:
+        for compiled_params in compiled_parameters:
+            parameters.append(execute_sequence_format(getter(compiled_params)))
+        return parameters
+
+    for compiled_params in compiled_parameters:
+        param = list(getter(compiled_params))
+        for index, processor in processors:
+            param[index] = processor(param[index])
+        parameters.append(execute_sequence_format(param))
+    return parameters
+
+
+def _process_named_parameters(object compiled_parameters, tuple processors):
+    cdef list parameters = []
+    cdef dict param
+    cdef object key
+    cdef object processor
+
+    for compiled_params in compiled_parameters:
+        param = dict(compiled_params)
+        for key, processor in processors:
+            if key in param:
+                param[key] = processor(param[key])
+        parameters.append(param)
+    return parameters
+
 cdef class prefix_anon_map(dict):
     def __missing__(self, str key):
         cdef str derived
@@ -2689,6 +2689,13 @@ class MSDialect(default.DefaultDialect):
     implicit_returning = True
     full_returning = True
 
+    use_insertmanyvalues = True
+
+    # SQL Server allows at most 1000 rows in a VALUES clause and
+    # 2100 parameters in a statement
+    insertmanyvalues_page_size = 1000
+    insertmanyvalues_max_parameters = 2099
+
     colspecs = {
         sqltypes.DateTime: _MSDateTime,
         sqltypes.Date: _MSDate,
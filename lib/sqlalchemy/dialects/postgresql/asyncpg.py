@@ -429,6 +429,29 @@ class AsyncAdapt_asyncpg_cursor:
             except Exception as error:
                 self._handle_exception(error)
 
+    async def _copy_records(self, table_name, schema_name, columns, records):
+        adapt_connection = self._adapt_connection
+
+        async with adapt_connection._execute_mutex:
+            if not adapt_connection._started:
+                await adapt_connection._start_transaction()
+
+            try:
+                status = await self._connection.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=columns,
+                    schema_name=schema_name,
+                )
+            except Exception as error:
+                self._handle_exception(error)
+            else:
+                reg = re.match(r"COPY (\d+)", status or "")
+                if reg:
+                    self.rowcount = int(reg.group(1))
+                else:
+                    self.rowcount = -1
+
     def execute(self, operation, parameters=None):
         self._adapt_connection.await_(
             self._prepare_and_execute(operation, parameters)
@@ -439,6 +462,11 @@ class AsyncAdapt_asyncpg_cursor:
             self._executemany(operation, seq_of_parameters)
         )
 
+    def copy_records(self, table_name, schema_name, columns, records):
+        self._adapt_connection.await_(
+            self._copy_records(table_name, schema_name, columns, records)
+        )
+
     def setinputsizes(self, *inputsizes):
         raise NotImplementedError()
 
@@ -801,6 +829,7 @@ class PGDialect_asyncpg(PGDialect):
     supports_statement_cache = True
 
     supports_server_side_cursors = True
+    supports_copy_insert = True
 
     render_bind_cast = True
 
@@ -907,6 +936,25 @@ class PGDialect_asyncpg(PGDialect):
         else:
             return pool.AsyncAdaptedQueuePool
 
+    def _do_copy_insert(self, cursor, context, parameters):
+        compiled = context.compiled
+        table = compiled.statement.table
+        columns, param_keys = compiled._copy_insert_columns
+
+        schema = table.schema
+        if compiled.schema_translate_map:
+            schema_translate_map = context.execution_options.get(
+                "schema_translate_map", {}
+            )
+            schema = schema_translate_map.get(schema, schema)
+
+        cursor.copy_records(
+            table.name,
+            schema,
+            [c.name for c in columns],
+            list(context._copy_insert_rows(parameters)),
+        )
+
     def is_disconnect(self, e, connection, cursor):
         if connection:
             return connection._connection.is_closed()
@@ -474,6 +474,15 @@ class _PGJSONB(JSONB):
 class PGExecutionContext_psycopg2(_PGExecutionContext_common_psycopg):
     _psycopg2_fetched_rows = None
 
+    @util.memoized_property
+    def _use_copy_insert(self):
+        # rows are sent using COPY's text format, which is only used if
+        # each column's type has a known text representation
+        return (
+            super()._use_copy_insert
+            and self.compiled._copy_text_encoders is not None
+        )
+
     def post_exec(self):
         if (
             self._psycopg2_fetched_rows
@@ -511,6 +520,34 @@ class PGExecutionContext_psycopg2(_PGExecutionContext_common_psycopg):
         cursor.connection.notices[:] = []
 
 
+class _CopyTextStream:
+    """A file-like object delivering COPY text lines to
+    ``cursor.copy_expert()``.
+
+    """
+
+    def __init__(self, lines):
+        self._lines = lines
+        self._buf = ""
+
+    def read(self, size=-1):
+        buf = self._buf
+        if size is None or size < 0:
+            self._buf = ""
+            return buf + "".join(self._lines)
+
+        chunks = [buf]
+        length = len(buf)
+        for line in self._lines:
+            chunks.append(line)
+            length += len(line)
+            if length >= size:
+                break
+        buf = "".join(chunks)
+        self._buf = buf[size:]
+        return buf[:size]
+
+
 class PGCompiler_psycopg2(PGCompiler):
     pass
 
@@ -533,6 +570,7 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
 
     supports_statement_cache = True
     supports_server_side_cursors = True
+    supports_copy_insert = True
 
     default_paramstyle = "pyformat"
     # set to true based on psycopg2 version
@@ -577,6 +615,9 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
 
         if self.executemany_mode & EXECUTEMANY_VALUES:
             self.insert_executemany_returning = True
+            # execute_values() takes the place of the generic
+            # "insertmanyvalues" execution style
+            self.use_insertmanyvalues = False
 
         self.executemany_batch_page_size = executemany_batch_page_size
         self.executemany_values_page_size = executemany_values_page_size
@@ -708,6 +749,10 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
             return None
 
     def do_executemany(self, cursor, statement, parameters, context=None):
+        if context is not None and context._use_copy_insert:
+            self._do_copy_insert(cursor, context, parameters)
+            return
+
         if (
             self.executemany_mode & EXECUTEMANY_VALUES
             and context
@@ -751,6 +796,12 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
         else:
             cursor.executemany(statement, parameters)
 
+    def _do_copy_insert(self, cursor, context, parameters):
+        cursor.copy_expert(
+            context._copy_insert_statement(),
+            _CopyTextStream(context._copy_insert_text_lines(parameters)),
+        )
+
     def do_begin_twophase(self, connection, xid):
         connection.connection.tpc_begin(xid)
 
@@ -822,6 +822,7 @@ from ... import schema as sa_schema
 from ... import sql
 from ... import types as sqltypes
 from ... import util
+from ...engine import cursor as _cursor
 from ...engine import default
 from ...engine import processors
 from ...engine import reflection
@@ -1321,6 +1322,16 @@ class SQLiteCompiler(compiler.SQLCompiler):
     def visit_not_regexp_match_op_binary(self, binary, operator, **kw):
         return self._generate_generic_binary(binary, " NOT REGEXP ", **kw)
 
+    def returning_clause(self, stmt, returning_cols):
+        # SQLite 3.35 and above; columns within RETURNING may not be
+        # qualified with the table name
+        columns = [
+            self._label_returning_column(stmt, c, {"include_table": False})
+            for c in sql.expression._select_iterables(returning_cols)
+        ]
+
+        return "RETURNING " + ", ".join(columns)
+
     def _on_conflict_target(self, clause, **kw):
         if clause.constraint_target is not None:
             target_text = "(%s)" % clause.constraint_target
@@ -1795,6 +1806,23 @@ class SQLiteExecutionContext(default.DefaultExecutionContext):
         else:
             return colname, None
 
+    def post_exec(self):
+        if (
+            (self.isupdate or self.isdelete)
+            and self._is_explicit_returning
+            and self.cursor_fetch_strategy is _cursor._DEFAULT_FETCH
+        ):
+            # SQLite doesn't update cursor.rowcount for a statement with
+            # RETURNING until all rows have been fetched, so buffer the
+            # rows up front in order that rowcount is available
+            self.cursor_fetch_strategy = (
+                _cursor.FullyBufferedCursorFetchStrategy(
+                    self.cursor,
+                    self.cursor.description,
+                    initial_buffer=self.cursor.fetchall(),
+                )
+            )
+
 
 class SQLiteDialect(default.DefaultDialect):
     name = "sqlite"
@@ -1808,6 +1836,7 @@ class SQLiteDialect(default.DefaultDialect):
     supports_empty_insert = False
     supports_cast = True
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
     tuple_in_values = True
     supports_statement_cache = True
 
@@ -1909,6 +1938,14 @@ class SQLiteDialect(default.DefaultDialect):
                 self.dbapi.sqlite_version_info
                 >= (3, 7, 11)
             )
+            # https://www.sqlite.org/lang_returning.html
+            self.full_returning = self.dbapi.sqlite_version_info >= (
+                3,
+                35,
+            )
+            if self.dbapi.sqlite_version_info < (3, 32, 0):
+                # https://www.sqlite.org/limits.html
+                self.insertmanyvalues_max_parameters = 999
             # see https://www.sqlalchemy.org/trac/ticket/2568
             # as well as https://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = self.dbapi.sqlite_version_info < (
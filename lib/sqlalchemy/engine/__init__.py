@@ -23,6 +23,10 @@ from .base import NestedTransaction
 from .base import RootTransaction
 from .base import Transaction
 from .base import TwoPhaseTransaction
+from .cache import CacheStats
+from .cache import CompiledCache
+from .cache import PersistentCompiledCache
+from .cache import StatementCacheStats
 from .create import create_engine
 from .create import engine_from_config
 from .cursor import BaseCursorResult
@@ -38,6 +42,7 @@ from .interfaces import Compiled
 from .interfaces import CreateEnginePlugin
 from .interfaces import Dialect
 from .interfaces import ExceptionContext
+from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .interfaces import TypeCompiler
 from .mock import create_mock_engine
@@ -136,3 +136,28 @@ def tuplegetter(*indexes):
         return it
     else:
         return lambda row: (it(row),)
+
+
+def fused_processor(processors):
+    """Return a callable which applies the given per-column processors to
+    a row in one step, returning a tuple; columns with no processor are
+    passed through.  Returns None if there are no processors.
+
+    """
+    if not processors or not any(processors):
+        return None
+
+    env = {}
+    elements = []
+    for index, proc in enumerate(processors):
+        if proc is None:
+            elements.append("row[%d]" % index)
+        else:
+            env["proc_%d" % index] = proc
+            elements.append("proc_%d(row[%d])" % (index, index))
+
+    code = "def process_row(row):\n    return (%s, )\n" % (
+        ", ".join(elements)
+    )
+    exec(code, env)
+    return env["process_row"]
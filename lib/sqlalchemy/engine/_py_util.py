@@ -52,3 +52,42 @@ def _distill_raw_params(params):
         return [params]
     else:
         raise exc.ArgumentError("mapping or sequence expected for parameters")
+
+
+def _process_positional_parameters(
+    compiled_parameters, getter, processors, execute_sequence_format
+):
+    """Convert dictionaries of bind parameter values into sequences
+    of processed values for the DBAPI, given a plan from
+    ``SQLCompiler._get_bind_processing_plan()``.
+
+    """
+    if not processors:
+        return [
+            execute_sequence_format(getter(compiled_params))
+            for compiled_params in compiled_parameters
+        ]
+
+    parameters = []
+    for compiled_params in compiled_parameters:
+        param = list(getter(compiled_params))
+        for index, processor in processors:
+            param[index] = processor(param[index])
+        parameters.append(execute_sequence_format(param))
+    return parameters
+
+
+def _process_named_parameters(compiled_parameters, processors):
+    """Convert dictionaries of bind parameter values into dictionaries
+    of processed values for the DBAPI, given a plan from
+    ``SQLCompiler._get_bind_processing_plan()``.
+
+    """
+    parameters = []
+    for compiled_params in compiled_parameters:
+        param = dict(compiled_params)
+        for key, processor in processors:
+            if key in param:
+                param[key] = processor(param[key])
+        parameters.append(param)
+    return parameters
@@ -4,17 +4,28 @@
 #
 # This module is part of SQLAlchemy and is released under
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
+import collections
+from collections import abc as collections_abc
 import contextlib
+import itertools
 import sys
+import threading
+from time import perf_counter
 import typing
 from typing import Any
 from typing import Mapping
+from typing import MutableMapping
 from typing import Optional
 from typing import Union
 
+from . import cursor as _cursor
+from . import result as _result
+from .cache import _statement_stats
+from .cache import CacheStats
 from .interfaces import BindTyping
 from .interfaces import ConnectionEventsTarget
 from .interfaces import ExceptionContext
+from .interfaces import ExecuteStyle
 from .util import _distill_params_20
 from .util import _distill_raw_params
 from .util import TransactionalContext
@@ -77,6 +88,13 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     # a long time
     should_close_with_result = False
 
+    # driver pipeline in progress, see _begin_pipeline()
+    _pipeline = None
+
+    # no statement has been run within the current transaction; see
+    # _execute_context()
+    _transaction_is_unused = False
+
     def __init__(
         self,
         engine,
@@ -221,6 +239,21 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
           used by the ORM internally supersedes a cache dictionary
           specified here.
 
+        :param executemany_page_size: Available on:
+          :class:`_engine.Connection`, :class:`_engine.Engine`,
+          :class:`_sql.Executable`.
+
+          When an iterator of parameter sets, such as a generator, is passed
+          to :meth:`_engine.Connection.execute`, the number of parameter sets
+          consumed from the iterator and sent in each "executemany"
+          invocation.  Defaults to 1000.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`engine_executemany_iterator`
+
         :param logging_token: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`, :class:`_sql.Executable`.
 
@@ -282,6 +315,20 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 :meth:`_engine.Connection.get_isolation_level`
                 - view current level
 
+        :param pipeline: Available on: :class:`_engine.Connection`,
+          :class:`_engine.Engine`, :class:`_sql.Executable`.
+
+          When ``True``, INSERT, UPDATE and DELETE statements that don't
+          return rows are sent using the driver's pipeline mode, if the
+          dialect supports it, without waiting for each statement to
+          complete.  Results are received when the pipeline is synchronized.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`dbapi_pipeline`
+
         :param no_parameters: Available on: :class:`_engine.Connection`,
           :class:`_sql.Executable`.
 
@@ -565,6 +612,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         if self._still_open_and_dbapi_connection_is_valid:
             self._dbapi_connection.invalidate(exception)
         self._dbapi_connection = None
+        self._pipeline = None
 
     def detach(self):
         """Detach the underlying DB-API connection from its connection pool.
@@ -885,6 +933,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             self._log_info("BEGIN (implicit)")
 
         self.__in_begin = True
+        self._transaction_is_unused = True
 
         if self._has_events or self.engine._has_events:
             self.dispatch.begin(self)
@@ -897,6 +946,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             self.__in_begin = False
 
     def _rollback_impl(self):
+        if self._pipeline is not None:
+            self._sync_pipeline(discard=True)
+
         if self._has_events or self.engine._has_events:
             self.dispatch.rollback(self)
 
@@ -915,6 +967,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 self._handle_dbapi_exception(e, None, None, None, None)
 
     def _commit_impl(self):
+        if self._pipeline is not None:
+            self._sync_pipeline()
 
         if self._has_events or self.engine._has_events:
             self.dispatch.commit(self)
@@ -1112,6 +1166,16 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
          When a single dictionary is passed, the DBAPI ``cursor.execute()``
          method will be used.
 
+         An iterator of dictionaries, such as a generator, may also be
+         passed, in which case the parameter sets are consumed in pages,
+         each of which is sent using ``cursor.executemany()``, so that the
+         full collection of parameter sets need not be present in memory.
+         The size of each page is set using the ``executemany_page_size``
+         execution option.
+
+         .. versionadded:: 2.0 Added support for an iterator of parameter
+            sets.
+
         :param execution_options: optional dictionary of execution options,
          which will be associated with the statement execution.  This
          dictionary can provide a subset of the options that are accepted
@@ -1120,7 +1184,20 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         :return: a :class:`_engine.Result` object.
 
         """
-        distilled_parameters = _distill_params_20(parameters)
+        try:
+            distilled_parameters = _distill_params_20(parameters)
+        except exc.ArgumentError:
+            # an iterator of parameter sets is consumed page by page; this
+            # is checked only once the more common types have been ruled out
+            if not isinstance(parameters, collections_abc.Iterator):
+                raise
+            distilled_parameters = None
+
+        if distilled_parameters is None:
+            return self._execute_paged(
+                statement, parameters, execution_options
+            )
+
         try:
             meth = statement._execute_on_connection
         except AttributeError as err:
@@ -1132,6 +1209,61 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 execution_options or NO_OPTIONS,
             )
 
+    def _execute_paged(self, statement, parameters, execution_options):
+        """Execute a statement given an iterator of parameter sets, one
+        "executemany" invocation per page of parameter sets.
+
+        """
+        page_size = (
+            self._execution_options.merge_with(
+                getattr(statement, "_execution_options", None),
+                execution_options,
+            )
+        ).get("executemany_page_size", 1000)
+        if page_size < 1:
+            raise exc.ArgumentError(
+                "executemany_page_size must be a positive integer"
+            )
+
+        results = []
+        rowcount = 0
+        while True:
+            page = list(itertools.islice(parameters, page_size))
+            if not page:
+                break
+
+            result = self.execute(statement, page, execution_options)
+
+            if result.returns_rows:
+                # rows returned by each page are retained in the final
+                # result
+                results.append(result)
+            else:
+                # otherwise retain only the most recent result, so that
+                # memory use remains constant
+                results[:] = [result]
+                if rowcount < 0 or result.rowcount < 0:
+                    rowcount = -1
+                else:
+                    rowcount += result.rowcount
+
+            if len(page) < page_size:
+                break
+
+        if not results:
+            # an empty iterator executes nothing, as is the case for an
+            # empty "executemany" in the ORM
+            result = _result.null_result()
+            result.rowcount = 0
+            return result
+        elif len(results) > 1:
+            return results[0].merge(*results[1:])
+
+        result = results[0]
+        if not result.returns_rows:
+            result.rowcount = rowcount
+        return result
+
     def _execute_function(self, func, distilled_parameters, execution_options):
         """Execute a sql.FunctionElement object."""
 
@@ -1313,6 +1445,11 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             schema_translate_map=schema_translate_map,
             linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
         )
+        engine = self.engine
+        with engine._cache_stats_mutex:
+            engine._cache_counts[cache_hit] += 1
+        if cache_hit is dialect.CACHE_MISS:
+            engine._record_cache_miss(self, compiled_sql)
         ret = self._execute_context(
             dialect,
             dialect.execution_ctx_cls._init_compiled,
@@ -1501,8 +1638,30 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         if self._transaction is None:
             self._autobegin()
 
+        transaction_is_unused = self._transaction_is_unused
+        self._transaction_is_unused = False
+
+        if (
+            execution_options.get("pipeline", False)
+            and dialect.supports_pipeline
+            and (context.isinsert or context.isupdate or context.isdelete)
+            and not context._is_implicit_returning
+            and not context._is_explicit_returning
+            and not context._is_server_side
+            and context._allow_pipeline
+        ):
+            if self._pipeline is None:
+                self._begin_pipeline()
+            context._pipelined = True
+        elif self._pipeline is not None:
+            # statement needs its results right away
+            self._sync_pipeline()
+
         context.pre_exec()
 
+        if context.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            return self._exec_insertmany_context(dialect, context)
+
         if dialect.bind_typing is BindTyping.SETINPUTSIZES:
             context._set_input_sizes()
 
@@ -1593,9 +1752,205 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
             result = context._setup_result_proxy()
 
+        except BaseException as e:
+            # when the pool skipped the pre-ping for this connection, a
+            # disconnect on the first statement of the transaction is
+            # retried on a new connection, as nothing has been done within
+            # the transaction yet, whether it was begun explicitly or not
+            retry_on_disconnect = (
+                transaction_is_unused
+                and self._transaction is not None
+                and self._nested_transaction is None
+                and getattr(self._dbapi_connection, "_ping_skipped", False)
+                and not self._is_autocommit()
+            )
+            try:
+                self._handle_dbapi_exception(
+                    e, statement, parameters, cursor, context
+                )
+            except exc.DBAPIError as err:
+                if not (
+                    retry_on_disconnect
+                    and err.connection_invalidated
+                    and self.invalidated
+                ):
+                    raise
+                self.engine.logger.info(
+                    "Disconnect detected on connection which skipped "
+                    "pre-ping; reconnecting and retrying statement"
+                )
+                # the Transaction continues on the new DBAPI connection,
+                # so that those held by the application or a Session
+                # remain valid
+                self._dbapi_connection = self.engine.raw_connection()
+                self._transaction._connection_begin_impl()
+                return self._execute_context(
+                    dialect,
+                    constructor,
+                    statement,
+                    parameters,
+                    execution_options,
+                    *args,
+                    **kw,
+                )
+
+        return result
+
+    def _begin_pipeline(self):
+        """Place the DBAPI connection in pipeline mode, where statements
+        marked as ``_pipelined`` are sent without waiting for their results.
+
+        """
+        try:
+            pipeline = self.dialect.do_pipeline(self.connection)
+            pipeline.__enter__()
+        except BaseException as e:
+            self._handle_dbapi_exception(e, None, None, None, None)
+
+        self._pipeline = pipeline
+        self._pipeline_results = []
+
+    def _sync_pipeline(self, discard=False):
+        """Wait for all statements sent in pipeline mode to complete and
+        leave pipeline mode, delivering rowcounts to their results.
+
+        With ``discard=True``, errors are not raised, as is appropriate
+        when the transaction is being rolled back in any case.
+
+        """
+        pipeline = self._pipeline
+        if pipeline is None:
+            # connection was invalidated
+            return
+
+        self._pipeline = None
+        results, self._pipeline_results = self._pipeline_results, []
+
+        try:
+            pipeline.__exit__(None, None, None)
+        except BaseException as e:
+            for result in results:
+                result.context._pipelined = False
+                result._soft_close()
+            if not discard or not isinstance(e, Exception):
+                self._handle_dbapi_exception(e, None, None, None, None)
+            return
+
+        for result in results:
+            context = result.context
+            context._pipelined = False
+            context._rowcount = context.cursor.rowcount
+            result._soft_close()
+
+    def _exec_insertmany_context(self, dialect, context):
+        """continue the _execute_context() method for an "insertmanyvalues"
+        operation, which will invoke DBAPI cursor.execute() one or more
+        times, each with its own log and event hook calls, accumulating
+        RETURNING rows across all batches.
+
+        """
+        cursor = context.cursor
+        compiled = context.compiled
+
+        page_size = context.execution_options.get(
+            "insertmanyvalues_page_size", dialect.insertmanyvalues_page_size
+        )
+        has_events = self._has_events or self.engine._has_events
+
+        returning = bool(compiled.returning)
+        rows = []
+        cursor_description = None
+        rowcount = 0
+
+        sub_stmt, sub_params = context.statement, context.parameters
+
+        try:
+            for (
+                sub_stmt,
+                sub_params,
+                batchnum,
+                total_batches,
+            ) in compiled._deliver_insertmanyvalues_batches(
+                context.statement, context.parameters, page_size
+            ):
+                if has_events:
+                    for fn in self.dispatch.before_cursor_execute:
+                        sub_stmt, sub_params = fn(
+                            self,
+                            cursor,
+                            sub_stmt,
+                            sub_params,
+                            context,
+                            False,
+                        )
+
+                if self._echo:
+                    self._log_info(sub_stmt)
+
+                    stats = "%s (insertmanyvalues) %d/%d" % (
+                        context._get_cache_stats(),
+                        batchnum,
+                        total_batches,
+                    )
+
+                    if not self.engine.hide_parameters:
+                        self._log_info(
+                            "[%s] %r",
+                            stats,
+                            sql_util._repr_params(
+                                sub_params, batches=10, ismulti=False
+                            ),
+                        )
+                    else:
+                        self._log_info(
+                            "[%s] [SQL parameters hidden due to "
+                            "hide_parameters=True]" % (stats,)
+                        )
+
+                for fn in (
+                    ()
+                    if not dialect._has_events
+                    else dialect.dispatch.do_execute
+                ):
+                    if fn(cursor, sub_stmt, sub_params, context):
+                        break
+                else:
+                    dialect.do_execute(cursor, sub_stmt, sub_params, context)
+
+                if has_events:
+                    self.dispatch.after_cursor_execute(
+                        self,
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                        False,
+                    )
+
+                if returning:
+                    cursor_description = cursor.description
+                    rows.extend(cursor.fetchall())
+
+                if rowcount is not None and cursor.rowcount >= 0:
+                    rowcount += cursor.rowcount
+                else:
+                    rowcount = None
+
+            context._rowcount = rowcount
+            if returning:
+                context.cursor_fetch_strategy = (
+                    _cursor.FullyBufferedCursorFetchStrategy(
+                        cursor, cursor_description, initial_buffer=rows
+                    )
+                )
+
+            context.post_exec()
+
+            result = context._setup_result_proxy()
+
         except BaseException as e:
             self._handle_dbapi_exception(
-                e, statement, parameters, cursor, context
+                e, sub_stmt, sub_params, cursor, context
             )
 
         return result
@@ -2320,6 +2675,9 @@ class Engine(
         query_cache_size: int = 500,
         execution_options: Optional[Mapping[str, Any]] = None,
         hide_parameters: bool = False,
+        query_cache: Optional[MutableMapping[Any, Any]] = None,
+        cache_miss_storm_threshold: int = 100,
+        cache_miss_storm_interval: float = 10.0,
     ):
         self.pool = pool
         self.url = url
@@ -2328,12 +2686,37 @@ class Engine(
             self.logging_name = logging_name
         self.echo = echo
         self.hide_parameters = hide_parameters
-        if query_cache_size != 0:
-            self._compiled_cache = util.LRUCache(
+        if query_cache is not None:
+            self._compiled_cache = query_cache
+        elif query_cache_size != 0:
+            # with the GIL disabled, threads contend on the mutex and
+            # counter of a single LRUCache; otherwise the extra hashing
+            # done by the sharded cache isn't worth it
+            if util.freethreading:
+                lru_cls = util.ShardedLRUCache
+            else:
+                lru_cls = util.LRUCache
+            self._compiled_cache = lru_cls(
                 query_cache_size, size_alert=self._lru_size_alert
             )
         else:
             self._compiled_cache = None
+        self._cache_counts = collections.defaultdict(int)
+        self._cache_stats_mutex = threading.Lock()
+        if cache_miss_storm_threshold is not None and (
+            cache_miss_storm_threshold < 0
+        ):
+            raise exc.ArgumentError(
+                "cache_miss_storm_threshold must be a positive integer, "
+                "or 0 or None to disable cache miss storm detection"
+            )
+        elif cache_miss_storm_threshold:
+            self._cache_misses = collections.deque(
+                maxlen=cache_miss_storm_threshold
+            )
+        else:
+            self._cache_misses = None
+        self._cache_miss_storm_interval = cache_miss_storm_interval
         log.instance_logger(self, echoflag=echo)
         if execution_options:
             self.update_execution_options(**execution_options)
@@ -2347,6 +2730,75 @@ class Engine(
                 cache.capacity,
             )
 
+    def _record_cache_miss(self, connection, compiled):
+        misses = self._cache_misses
+        if misses is None:
+            return
+
+        now = perf_counter()
+        with self._cache_stats_mutex:
+            misses.append((now, compiled.string))
+            if len(misses) < misses.maxlen:
+                return
+            elapsed = now - misses[0][0]
+            if elapsed > self._cache_miss_storm_interval:
+                return
+            statements = [string for _, string in misses]
+            misses.clear()
+
+        if self._should_log_info():
+            self.logger.info(
+                "Compiled cache miss storm: %d statements were "
+                "compiled within %.2f seconds.  Statements "
+                "whose cache key differs on each execution, such as "
+                "those that embed literal values, may be the cause.",
+                len(statements),
+                elapsed,
+            )
+        connection.dispatch.cache_miss_storm(connection, statements, elapsed)
+
+    def cache_stats(self) -> CacheStats:
+        """Return a snapshot of statistics for the compiled cache of this
+        :class:`_engine.Engine`.
+
+        The returned :class:`.CacheStats` includes counts of cache hits,
+        misses and statements that could not be cached for statements
+        executed by this engine, the number of entries pruned from the cache,
+        and per-statement compile time, hit count and estimated size for
+        each statement currently in the cache.
+
+        Statements compiled on every execution, such as those which embed
+        literal values that vary, will show up as a large number of entries
+        with few hits, as well as a rising count of misses relative to hits.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_events.ConnectionEvents.cache_miss_storm`
+
+            :ref:`sql_caching`
+
+        """
+        with self._cache_stats_mutex:
+            counts = dict(self._cache_counts)
+        cache = self._compiled_cache
+
+        if cache is not None:
+            statements = _statement_stats(cache)
+            evictions = getattr(cache, "evictions", 0)
+        else:
+            statements = []
+            evictions = 0
+
+        return CacheStats(
+            counts.get(self.dialect.CACHE_HIT, 0),
+            counts.get(self.dialect.CACHE_MISS, 0),
+            counts.get(self.dialect.NO_CACHE_KEY, 0),
+            evictions,
+            statements,
+        )
+
     @property
     def engine(self):
         return self
@@ -2359,6 +2811,10 @@ class Engine(
         It will not impact any dictionary caches that were passed via the
         :paramref:`.Connection.execution_options.query_cache` parameter.
 
+        When a cache was passed using the
+        :paramref:`_sa.create_engine.query_cache` parameter, that cache is
+        cleared, which will affect all engines that share it.
+
         .. versionadded:: 1.4
 
         """
@@ -2628,6 +3084,10 @@ class OptionEngineMixin:
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self._cache_counts = proxied._cache_counts
+        self._cache_stats_mutex = proxied._cache_stats_mutex
+        self._cache_misses = proxied._cache_misses
+        self._cache_miss_storm_interval = proxied._cache_miss_storm_interval
         self.hide_parameters = proxied.hide_parameters
         log.instance_logger(self, echoflag=self.echo)
 
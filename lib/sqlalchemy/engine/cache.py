@@ -0,0 +1,859 @@
+# engine/cache.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+"""Compiled statement caches which may be shared among engines, as well
+as persisted across processes."""
+
+import enum
+import hashlib
+import io
+import operator
+import os
+import pickle
+import stat
+import sys
+import tempfile
+import threading
+from time import perf_counter
+import types
+import typing
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import IO
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import ValuesView
+import weakref
+
+from .interfaces import Compiled
+from .interfaces import Dialect
+from .. import util
+from ..sql import crud
+from ..sql.compiler import IdentifierPreparer
+from ..sql.elements import BindParameter
+from ..sql.schema import Column
+from ..sql.schema import Table
+from ..util import memoized_property
+
+if typing.TYPE_CHECKING:
+    from ..sql.schema import MetaData
+
+
+# rough per-object estimates used by the default weigher; these aren't
+# intended to be accurate, only to ensure that a statement with many
+# parameters or columns weighs more than a small one
+_COMPILED_OVERHEAD = 2000
+_BIND_WEIGHT = 400
+_COLUMN_WEIGHT = 300
+
+_scalar_types = (str, int, float, bool, type(None), enum.Enum)
+
+# per-dialect state that's not part of its configuration
+_TRANSIENT_DIALECT_ATTRS = frozenset(["_type_memos"])
+
+
+class StatementCacheStats(NamedTuple):
+    """Statistics for a single statement present in the compiled cache of
+    an :class:`_engine.Engine`.
+
+    Part of the :class:`.CacheStats` returned by
+    :meth:`_engine.Engine.cache_stats`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    sql: str
+    """The SQL string of the compiled statement."""
+
+    compile_time: Optional[float]
+    """Time in seconds taken to compile the statement."""
+
+    hits: int
+    """Number of times the compiled statement was retrieved from the
+    cache."""
+
+    size: int
+    """Estimated size of the compiled statement in bytes, as determined by
+    the weigher of a :class:`.CompiledCache`, or by the default weigher
+    for other caches."""
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of the statistics for the compiled cache of an
+    :class:`_engine.Engine`.
+
+    Returned by :meth:`_engine.Engine.cache_stats`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    hits: int
+    """Number of statements executed by the engine whose compiled form
+    was retrieved from the cache."""
+
+    misses: int
+    """Number of statements executed by the engine which were compiled
+    and then added to the cache."""
+
+    no_cache_key: int
+    """Number of statements executed by the engine which could not be
+    cached, as they were unable to produce a cache key."""
+
+    evictions: int
+    """Number of entries pruned from the cache.  If the cache is shared
+    among engines, this includes entries added by other engines."""
+
+    statements: List[StatementCacheStats]
+    """Statistics for each statement in the cache, ordered by number of
+    cache hits, descending."""
+
+
+def _estimate_compiled_size(key: Any, compiled: Any) -> int:
+    """Estimate the memory used by a :class:`.Compiled` object, in bytes."""
+
+    size = _COMPILED_OVERHEAD + sys.getsizeof(
+        getattr(compiled, "string", "")
+    )
+    size += _BIND_WEIGHT * len(getattr(compiled, "binds", ()))
+    size += _COLUMN_WEIGHT * len(getattr(compiled, "_result_columns", ()))
+    return size
+
+
+def _dialect_identity(dialect: Dialect) -> Tuple[Any, ...]:
+    """Return a hashable token that compares equal for two dialect
+    instances which will render SQL identically.
+
+    This is the dialect class along with each of the configuration values
+    of the dialect, including those established from the first database
+    connection, such as ``server_version_info``.  Values which aren't
+    scalars, such as a ``json_serializer`` function, are compared by
+    equality, which for most objects is identity, and dictionaries such as
+    ``colspecs`` are compared by their contents.  A dialect that has a
+    value which can't be compared gets a token of its own, so that it
+    doesn't share compiled forms with any other dialect.
+
+    """
+    items = []
+    for k, v in vars(dialect).items():
+        if k in _TRANSIENT_DIALECT_ATTRS:
+            continue
+        elif isinstance(v, _scalar_types) or (
+            isinstance(v, tuple)
+            and all(isinstance(elem, _scalar_types) for elem in v)
+        ):
+            items.append((k, v))
+        elif getattr(v, "dialect", None) is dialect:
+            # helpers such as the IdentifierPreparer, which are derived
+            # from the dialect class and its configuration
+            continue
+        elif isinstance(v, types.ModuleType):
+            # the DBAPI module
+            items.append((k, v.__name__))
+        else:
+            if isinstance(v, dict):
+                v = frozenset(v.items())
+            try:
+                hash(v)
+            except TypeError:
+                return (type(dialect), object())
+            items.append((k, v))
+
+    return (type(dialect),) + tuple(sorted(items))
+
+
+def _statement_stats(cache: Any) -> List[StatementCacheStats]:
+    """Return statistics for the compiled statements in the given compiled
+    cache, ordered by number of cache hits, descending."""
+
+    if isinstance(cache, CompiledCache):
+        entries = [
+            (value, weight)
+            for key, value, counter, weight in list(cache._data.values())
+        ]
+    else:
+        entries = [
+            (value, _estimate_compiled_size(None, value))
+            for value in list(cache.values())
+        ]
+
+    statements = [
+        StatementCacheStats(
+            compiled.string,
+            compiled._compile_time,
+            compiled._cache_hits,
+            weight,
+        )
+        for compiled, weight in entries
+        if isinstance(compiled, Compiled)
+    ]
+    statements.sort(key=operator.attrgetter("hits"), reverse=True)
+    return statements
+
+
+class CompiledCache(typing.MutableMapping[Any, Any]):
+    """A cache for compiled SQL constructs which may be shared among any
+    number of :class:`_engine.Engine` objects, and whose size is limited by
+    the estimated memory used by its entries, rather than by the number of
+    entries.
+
+    E.g.::
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.engine import CompiledCache
+
+        cache = CompiledCache(max_bytes=64 * 1024 * 1024)
+
+        engines = [
+            create_engine(url, query_cache=cache) for url in shard_urls
+        ]
+
+    Entries are keyed on the identity of the dialect in use, rather than on
+    the dialect object itself, so that engines with the same kind of dialect
+    connected to the same kind of database make use of the same compiled
+    forms.  The identity of a dialect consists of its class along with its
+    configuration values, such as ``paramstyle``, ``server_version_info``
+    and ``json_serializer``; non-scalar values such as functions are
+    compared by identity.
+
+    Like the default cache, least recently used entries are pruned when the
+    total weight of entries exceeds ``max_bytes`` plus ``max_bytes *
+    threshold``, down to ``max_bytes``.
+
+    The cache maintains counters ``hits``, ``misses`` and ``evictions``;
+    the estimated size of an individual entry is available using
+    :meth:`.CompiledCache.weight`.
+
+    :param max_bytes: target maximum for the total estimated size of
+     entries, in bytes.
+
+    :param threshold: fraction of ``max_bytes`` by which the cache may
+     grow before being pruned.
+
+    :param size_alert: optional callable that's invoked with the cache
+     as its argument when pruning occurs.
+
+    :param weigher: optional callable that receives a key and a value
+     and returns the estimated size of the entry in bytes.  The default
+     weigher estimates the size of a :class:`.Compiled` object based on the
+     length of its SQL string and its number of bound parameters and
+     result columns.
+
+    .. versionadded:: 2.0
+
+    """
+
+    __slots__ = (
+        "max_bytes",
+        "threshold",
+        "size_alert",
+        "weigher",
+        "hits",
+        "misses",
+        "evictions",
+        "_total_weight",
+        "_data",
+        "_counter",
+        "_mutex",
+        "_dialect_tokens",
+    )
+
+    max_bytes: int
+    threshold: float
+    size_alert: Optional[Callable[["CompiledCache"], None]]
+    weigher: Callable[[Any, Any], int]
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        threshold: float = 0.5,
+        size_alert: Optional[Callable[["CompiledCache"], None]] = None,
+        weigher: Optional[Callable[[Any, Any], int]] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.threshold = threshold
+        self.size_alert = size_alert
+        self.weigher = weigher or _estimate_compiled_size
+        self.hits = self.misses = self.evictions = 0
+        self._total_weight = 0
+        self._counter = 0
+        self._mutex = threading.Lock()
+        self._data: Dict[Any, Tuple[Any, Any, List[int], int]] = {}
+        self._dialect_tokens: "weakref.WeakKeyDictionary[Dialect, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _inc_counter(self) -> int:
+        self._counter += 1
+        return self._counter
+
+    def _key(self, key: Any) -> Any:
+        if type(key) is tuple and key and isinstance(key[0], Dialect):
+            dialect = key[0]
+            try:
+                token = self._dialect_tokens[dialect]
+            except KeyError:
+                token = self._dialect_tokens[dialect] = _dialect_identity(
+                    dialect
+                )
+            return (token,) + key[1:]
+        else:
+            return key
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        item = self._data.get(self._key(key))
+        if item is not None:
+            item[2][0] = self._inc_counter()
+            self.hits += 1
+            return item[1]
+        else:
+            self.misses += 1
+            return default
+
+    def __getitem__(self, key: Any) -> Any:
+        item = self._data[self._key(key)]
+        item[2][0] = self._inc_counter()
+        return item[1]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def values(self) -> ValuesView[Any]:
+        return typing.ValuesView({k: i[1] for k, i in self._data.items()})
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        weight = self.weigher(key, value)
+        key = self._key(key)
+        with self._mutex:
+            existing = self._data.get(key)
+            if existing is not None:
+                self._total_weight -= existing[3]
+            self._data[key] = (key, value, [self._inc_counter()], weight)
+            self._total_weight += weight
+        self._manage_size()
+
+    def __delitem__(self, key: Any) -> None:
+        key = self._key(key)
+        with self._mutex:
+            item = self._data.pop(key)
+            self._total_weight -= item[3]
+
+    def clear(self) -> None:
+        with self._mutex:
+            self._data.clear()
+            self._total_weight = 0
+
+    def weight(self, key: Any) -> int:
+        """Return the estimated size in bytes of the entry for the given
+        key.
+
+        Raises ``KeyError`` if the key is not present.
+
+        """
+        return self._data[self._key(key)][3]
+
+    @property
+    def total_weight(self) -> int:
+        """The total estimated size in bytes of all entries."""
+        return self._total_weight
+
+    @property
+    def size_threshold(self) -> float:
+        return self.max_bytes + self.max_bytes * self.threshold
+
+    def _manage_size(self) -> None:
+        if self._total_weight <= self.size_threshold:
+            return
+        if not self._mutex.acquire(False):
+            return
+        try:
+            if self.size_alert:
+                self.size_alert(self)
+
+            by_counter = sorted(
+                self._data.values(),
+                key=operator.itemgetter(2),
+                reverse=True,
+            )
+            total = 0
+            for item in by_counter:
+                total += item[3]
+                if total > self.max_bytes:
+                    del self._data[item[0]]
+                    self._total_weight -= item[3]
+                    self.evictions += 1
+        finally:
+            self._mutex.release()
+
+
+# bump when the layout of the file written by PersistentCompiledCache
+# changes
+_PERSISTENT_FORMAT = 2
+
+# per-statement state that's only valid within the current process
+_TRANSIENT_COMPILED_ATTRS = frozenset(
+    ["_cached_metadata", "_gen_time", "_cache_hits"]
+)
+
+
+def _metadata_fingerprint(metadata: "MetaData") -> str:
+    """Return a digest of the structure of the given :class:`.MetaData`.
+
+    This is used to discard a persisted cache when the schema it was
+    generated against has changed, since statements against a
+    :class:`_schema.Table` may render differently once the table's columns
+    change, while their cache key stays the same.
+
+    """
+    from .. import __version__
+
+    digest = hashlib.sha256()
+    digest.update(__version__.encode("utf-8"))
+    for key in sorted(metadata.tables):
+        digest.update(repr(metadata.tables[key]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# objects outside of SQLAlchemy which an entry may refer to, besides
+# those that pickle natively
+_PERSISTENT_GLOBALS = frozenset(
+    [("builtins", name) for name in ("frozenset", "list", "set", "slice")]
+    + [
+        ("collections", "OrderedDict"),
+        ("collections", "defaultdict"),
+        ("collections", "deque"),
+        ("datetime", "date"),
+        ("datetime", "datetime"),
+        ("datetime", "time"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+        ("decimal", "Decimal"),
+        ("uuid", "UUID"),
+    ]
+    + [
+        (module, name)
+        for module in ("operator", "_operator")
+        for name in (
+            "add",
+            "and_",
+            "concat",
+            "contains",
+            "eq",
+            "floordiv",
+            "ge",
+            "getitem",
+            "gt",
+            "inv",
+            "is_",
+            "is_not",
+            "le",
+            "lshift",
+            "lt",
+            "mod",
+            "mul",
+            "ne",
+            "neg",
+            "not_",
+            "or_",
+            "pos",
+            "pow",
+            "rshift",
+            "sub",
+            "truediv",
+        )
+    ]
+)
+
+
+def _reconstitute_compiled(cls: type, state: Dict[str, Any]) -> Any:
+    compiled = cls.__new__(cls)
+    compiled.__dict__.update(state)
+    compiled._gen_time = perf_counter()
+    if state.get("_key_getters_for_crud_column", False) is None:
+        compiled._key_getters_for_crud_column = (
+            crud._key_getters_for_crud_column(
+                compiled, compiled.statement, compiled.compile_state
+            )
+        )
+    return compiled
+
+
+def _reconstitute_bindparam(cls: type, state: Dict[str, Any]) -> Any:
+    bindparam = cls.__new__(cls)
+    bindparam.__setstate__(state)
+    return bindparam
+
+
+def _compiled_state(compiled: Any) -> Dict[str, Any]:
+    cls = type(compiled)
+    state = {}
+    for key, value in compiled.__dict__.items():
+        if key in _TRANSIENT_COMPILED_ATTRS:
+            continue
+        cls_attr = getattr(cls, key, None)
+        if isinstance(cls_attr, memoized_property) or hasattr(
+            cls_attr, "__wrapped__"
+        ):
+            # memoized values are regenerated on demand, and are often
+            # closures which can't be pickled
+            continue
+        state[key] = value
+    if "_key_getters_for_crud_column" in state:
+        # regenerated from the statement when loaded
+        state["_key_getters_for_crud_column"] = None
+    return state
+
+
+class _CachePickler(pickle.Pickler):
+    def __init__(self, file: IO[bytes], metadata: "MetaData"):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.metadata = metadata
+
+        # ids of the bound parameters whose values are taken from the
+        # cache key of the statement being executed
+        self._extracted_binds = set()
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, ...]]:
+        if isinstance(obj, Dialect):
+            return ("dialect",)
+        elif isinstance(obj, IdentifierPreparer):
+            if obj is obj.dialect.identifier_preparer:
+                return ("preparer",)
+        elif isinstance(obj, Table):
+            if self.metadata.tables.get(obj.key) is obj:
+                return ("table", obj.key)
+        elif isinstance(obj, Column):
+            table = obj.table
+            if (
+                isinstance(table, Table)
+                and self.metadata.tables.get(table.key) is table
+                and table.c.get(obj.key) is obj
+            ):
+                return ("column", table.key, obj.key)
+        elif obj is self.metadata:
+            return ("metadata",)
+        return None
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, Compiled):
+            ckbm = getattr(obj, "_cache_key_bind_match", None)
+            if ckbm:
+                self._extracted_binds.update(
+                    id(bind)
+                    for binds in ckbm.values()
+                    if isinstance(binds, list)
+                    for bind in binds
+                )
+            return _reconstitute_compiled, (type(obj), _compiled_state(obj))
+        elif (
+            isinstance(obj, BindParameter)
+            and id(obj) in self._extracted_binds
+        ):
+            # the value of the statement that was first compiled is
+            # never used for a later execution, and isn't persisted
+            state = obj.__getstate__()
+            state["value"] = None
+            return _reconstitute_bindparam, (type(obj), state)
+        return NotImplemented
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    def __init__(
+        self,
+        file: IO[bytes],
+        metadata: "MetaData",
+        dialect: Optional[Dialect] = None,
+    ):
+        super().__init__(file)
+        self.metadata = metadata
+        self.dialect = dialect
+
+    def find_class(self, module: str, name: str) -> Any:
+        # only classes of SQLAlchemy, SQL operator functions and a few
+        # standard library types may be loaded; this limits what a
+        # tampered file can do, but is not a substitute for the file being
+        # trusted
+        if (module, name) in _PERSISTENT_GLOBALS:
+            return super().find_class(module, name)
+        elif module.startswith("sqlalchemy.") and not module.startswith(
+            "sqlalchemy.testing"
+        ):
+            obj = super().find_class(module, name)
+            if (
+                isinstance(obj, type)
+                or module == "sqlalchemy.sql.operators"
+                or obj in (_reconstitute_compiled, _reconstitute_bindparam)
+            ):
+                return obj
+        raise pickle.UnpicklingError(
+            "global '%s.%s' is not allowed in a persisted compiled cache"
+            % (module, name)
+        )
+
+    def persistent_load(self, pid: Tuple[str, ...]) -> Any:
+        type_ = pid[0]
+        if type_ == "table":
+            return self.metadata.tables[pid[1]]
+        elif type_ == "column":
+            return self.metadata.tables[pid[1]].c[pid[2]]
+        elif type_ == "metadata":
+            return self.metadata
+        elif self.dialect is None:
+            raise pickle.UnpicklingError("no dialect present")
+        elif type_ == "dialect":
+            return self.dialect
+        elif type_ == "preparer":
+            return self.dialect.identifier_preparer
+        else:
+            raise pickle.UnpicklingError("unknown persistent id %r" % (pid,))
+
+
+class _Pending:
+    """A persisted value that hasn't been unpickled yet."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class PersistentCompiledCache(CompiledCache):
+    """A :class:`.CompiledCache` which may be saved to a file and reloaded
+    in a new process, so that a newly started application doesn't need to
+    compile each of its statements again.
+
+    E.g.::
+
+        from sqlalchemy.engine import PersistentCompiledCache
+
+        cache = PersistentCompiledCache("/var/cache/myapp/sql.cache", metadata)
+        engine = create_engine(url, query_cache=cache)
+
+        # ... application runs
+
+        # at shutdown, or periodically
+        cache.save()
+
+    The file is read when the cache is constructed.  Entries are unpickled
+    lazily, the first time each one is requested; at that point, the
+    :class:`_schema.Table` and :class:`_schema.Column` objects referred to
+    by the entry are replaced with those of the given :class:`.MetaData`
+    and the dialect of the requesting engine is substituted, so that a
+    persisted entry is only used for a statement which produces the same
+    cache key against the same kind of dialect.  The entire file is
+    discarded if the structure of the :class:`.MetaData`, the version of
+    SQLAlchemy or the version of Python differs from when the file was
+    saved.
+
+    Only Core statements are persisted.  Statements whose compiled form
+    can't be pickled, such as ORM-enabled statements, those that include
+    lambda functions, or those against objects which aren't picklable, are
+    cached in memory only, and a warning is emitted by :meth:`.save` that
+    indicates how many statements couldn't be saved.  The statements
+    emitted by the ORM unit of work when flushing are cached separately by
+    each :class:`_orm.Mapper`, and don't make use of this cache.  The
+    values of bound parameters are not written to the file.
+
+    .. warning:: The file is read using ``pickle``, so that loading a file
+       that's been tampered with can run arbitrary code; it must only be
+       writable by the application's own user.  A file that's writable by
+       its group or by other users isn't loaded, and only SQLAlchemy
+       classes and a small set of standard library types may be referred
+       to by the file, however these measures don't make it safe to load
+       an untrusted file.
+
+    :param path: filesystem path of the file to be loaded and saved.
+
+    :param metadata: the :class:`.MetaData` which the application's
+     statements are generated against.
+
+    Remaining parameters are the same as those of :class:`.CompiledCache`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    __slots__ = ("path", "metadata")
+
+    def __init__(
+        self,
+        path: str,
+        metadata: "MetaData",
+        max_bytes: int = 32 * 1024 * 1024,
+        threshold: float = 0.5,
+        size_alert: Optional[Callable[["CompiledCache"], None]] = None,
+        weigher: Optional[Callable[[Any, Any], int]] = None,
+    ):
+        super().__init__(
+            max_bytes=max_bytes,
+            threshold=threshold,
+            size_alert=size_alert,
+            weigher=weigher,
+        )
+        self.path = path
+        self.metadata = metadata
+        self.load()
+
+    @staticmethod
+    def _header(metadata: "MetaData") -> Dict[str, Any]:
+        from .. import __version__
+
+        return {
+            "format": _PERSISTENT_FORMAT,
+            "version": __version__,
+            "python": tuple(sys.version_info[:2]),
+            "fingerprint": _metadata_fingerprint(metadata),
+        }
+
+    def _unpickle(self, data: bytes, dialect: Optional[Dialect] = None):
+        return _CacheUnpickler(io.BytesIO(data), self.metadata, dialect).load()
+
+    def _pickle(self, obj: Any) -> bytes:
+        buf = io.BytesIO()
+        _CachePickler(buf, self.metadata).dump(obj)
+        return buf.getvalue()
+
+    def _resolve(self, key: Any, pending: _Pending) -> Any:
+        tkey = self._key(key)
+        try:
+            value = self._unpickle(pending.data, key[0])
+        except Exception:
+            # the entry refers to something that's no longer present;
+            # discard it and have the statement compiled again
+            with self._mutex:
+                item = self._data.pop(tkey, None)
+                if item is not None:
+                    self._total_weight -= item[3]
+            return None
+
+        with self._mutex:
+            item = self._data.get(tkey)
+            if item is not None and item[1] is pending:
+                self._data[tkey] = (tkey, value, item[2], item[3])
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, default)
+        if type(value) is _Pending:
+            value = self._resolve(key, value)
+            if value is None:
+                self.hits -= 1
+                self.misses += 1
+                return default
+        return value
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        if type(value) is _Pending:
+            value = self._resolve(key, value)
+            if value is None:
+                raise KeyError(key)
+        return value
+
+    def load(self) -> int:
+        """Load entries from the file, returning the number of entries
+        loaded.
+
+        Entries currently present in the cache are retained.  If the file
+        doesn't exist, is writable by users other than its owner, or was
+        saved against a different version of SQLAlchemy or Python or a
+        different structure of :class:`.MetaData`, no entries are loaded.
+
+        """
+        try:
+            with open(self.path, "rb") as file_:
+                mode = os.fstat(file_.fileno()).st_mode
+                if not util.win32 and mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    util.warn(
+                        "Not loading the compiled cache from %s, as the "
+                        "file may be written to by other users" % self.path
+                    )
+                    return 0
+                contents = _CacheUnpickler(file_, self.metadata).load()
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return 0
+
+        header = self._header(self.metadata)
+        if not isinstance(contents, dict) or any(
+            contents.get(k) != v for k, v in header.items()
+        ):
+            return 0
+
+        count = 0
+        with self._mutex:
+            for key_data, value_data, weight in contents["entries"]:
+                try:
+                    key = self._unpickle(key_data)
+                except Exception:
+                    continue
+                if key in self._data:
+                    continue
+                self._data[key] = (
+                    key,
+                    _Pending(value_data),
+                    [self._inc_counter()],
+                    weight,
+                )
+                self._total_weight += weight
+                count += 1
+        self._manage_size()
+        return count
+
+    def save(self) -> int:
+        """Write the entries of the cache to the file, returning the number
+        of entries written.
+
+        The file is replaced atomically, so that a process which loads the
+        file concurrently sees either the previous or the new contents.
+        Entries that can't be pickled are skipped, and a warning is emitted
+        indicating how many were skipped.
+
+        """
+        entries = []
+        not_saved = []
+        for key, value, counter, weight in list(self._data.values()):
+            try:
+                key_data = self._pickle(key)
+                if type(value) is _Pending:
+                    value_data = value.data
+                else:
+                    value_data = self._pickle(value)
+            except Exception as err:
+                # not all statements can be persisted; these are
+                # retained in memory only
+                not_saved.append(err)
+                continue
+            entries.append((key_data, value_data, weight))
+
+        if not_saved:
+            util.warn(
+                "%d statement(s) in the compiled cache could not be saved "
+                "to %s and are cached in memory only; only Core statements "
+                "can be persisted (first error: %r)"
+                % (len(not_saved), self.path, not_saved[0])
+            )
+
+        contents = dict(self._header(self.metadata), entries=entries)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file_:
+                pickle.dump(contents, file_, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return len(entries)
@@ -96,6 +96,23 @@ def create_engine(url: "_url.URL", **kwargs: Any) -> "base.Engine":
 
         :ref:`connections_toplevel`
 
+    :param cache_miss_storm_interval=10.0: time in seconds within which
+     the number of compiled cache misses given by
+     :paramref:`_sa.create_engine.cache_miss_storm_threshold` must occur in
+     order for the :meth:`_events.ConnectionEvents.cache_miss_storm`
+     event to be emitted.
+
+     .. versionadded:: 2.0
+
+    :param cache_miss_storm_threshold=100: number of compiled cache misses
+     which, when occurring within
+     :paramref:`_sa.create_engine.cache_miss_storm_interval` seconds,
+     causes the :meth:`_events.ConnectionEvents.cache_miss_storm` event to
+     be emitted and a message to be logged at the INFO level.  Set to ``0``
+     or ``None`` to disable the detection of cache miss storms.
+
+     .. versionadded:: 2.0
+
     :param connect_args: a dictionary of options which will be
         passed directly to the DBAPI's ``connect()`` method as
         additional keyword arguments.  See the example
@@ -336,6 +353,17 @@ def create_engine(url: "_url.URL", **kwargs: Any) -> "base.Engine":
         instantiate the pool in this case, you just indicate what type
         of pool to be used.
 
+    :param pool_idle_timeout=None: number of seconds after which
+        :class:`~sqlalchemy.pool.QueuePool` closes connections that have
+        not been checked out, down to
+        :paramref:`_sa.create_engine.pool_min_idle` idle connections.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_idle_timeout`
+
     :param pool_logging_name:  String identifier which will be used within
        the "name" field of logging records generated within the
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
@@ -346,6 +374,26 @@ def create_engine(url: "_url.URL", **kwargs: Any) -> "base.Engine":
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param pool_maintenance_interval=5: number of seconds between runs of
+        the pool maintenance task enabled by
+        :paramref:`_sa.create_engine.pool_min_idle`,
+        :paramref:`_sa.create_engine.pool_prewarm` or
+        :paramref:`_sa.create_engine.pool_idle_timeout`.  Used with
+        :class:`~sqlalchemy.pool.QueuePool`.
+
+        .. versionadded:: 2.0
+
+    :param pool_min_idle=0: number of idle connections which
+        :class:`~sqlalchemy.pool.QueuePool` keeps open using a background
+        maintenance task, which also replaces idle connections ahead of
+        :paramref:`_sa.create_engine.pool_recycle`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_prewarm`
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -356,6 +404,28 @@ def create_engine(url: "_url.URL", **kwargs: Any) -> "base.Engine":
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_ping_interval=None: when used with
+        :paramref:`_sa.create_engine.pool_pre_ping`, skips the ping for
+        connections which were returned to the pool within this number of
+        seconds, retrying the first statement of a transaction on a new
+        connection if it fails due to a disconnect.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
+    :param pool_prewarm=False: if True, :class:`~sqlalchemy.pool.QueuePool`
+        opens ``pool_size`` connections in the background as soon as the
+        engine is created, as well as after :meth:`_engine.Engine.dispose`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_prewarm`
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -414,6 +484,20 @@ def create_engine(url: "_url.URL", **kwargs: Any) -> "base.Engine":
 
         .. versionadded:: 1.2.3
 
+    :param query_cache: an existing cache object to be used for the
+     SQL string form of queries, in place of the cache that's created
+     based on :paramref:`_sa.create_engine.query_cache_size`, which is
+     ignored when this parameter is present.   Typically an instance of
+     :class:`_engine.CompiledCache`, which may be shared among many
+     engines and whose size is limited by the estimated memory used by
+     its entries.
+
+     .. versionadded:: 2.0
+
+     .. seealso::
+
+        :class:`_engine.CompiledCache`
+
     :param query_cache_size: size of the cache used to cache the SQL string
      form of queries.  Set to zero to disable caching.
 
@@ -537,7 +621,12 @@ def create_engine(url: "_url.URL", **kwargs: Any) -> "base.Engine":
             "events": "pool_events",
             "reset_on_return": "pool_reset_on_return",
             "pre_ping": "pool_pre_ping",
+            "pre_ping_interval": "pool_pre_ping_interval",
             "use_lifo": "pool_use_lifo",
+            "min_idle": "pool_min_idle",
+            "prewarm": "pool_prewarm",
+            "maintenance_interval": "pool_maintenance_interval",
+            "idle_timeout": "pool_idle_timeout",
         }
         for k in util.get_cls_kwargs(poolclass):
             tk = translate.get(k, k)
@@ -636,6 +725,10 @@ def create_engine(url: "_url.URL", **kwargs: Any) -> "base.Engine":
             pool, "connect", first_connect, _once_unless_exception=True
         )
 
+    # start maintenance only after listeners are in place, so that
+    # connections it opens are fully initialized
+    pool._start_maintenance()
+
     dialect_cls.engine_created(engine)
     if entrypoint is not dialect_cls:
         entrypoint.engine_created(engine)
@@ -11,9 +11,12 @@
 
 import collections
 import functools
+import sys
+from time import perf_counter
 
 from .result import Result
 from .result import ResultMetaData
+from .result import fused_processor
 from .result import SimpleResultMetaData
 from .result import tuplegetter
 from .row import Row
@@ -49,6 +52,7 @@ class CursorResultMetaData(ResultMetaData):
     __slots__ = (
         "_keymap",
         "_processors",
+        "_row_processor",
         "_keys",
         "_keymap_by_result_column_idx",
         "_tuplefilter",
@@ -84,6 +88,7 @@ class CursorResultMetaData(ResultMetaData):
         new_metadata = self.__class__.__new__(self.__class__)
         new_metadata._unpickled = self._unpickled
         new_metadata._processors = self._processors
+        new_metadata._row_processor = None
         new_metadata._keys = new_keys
         new_metadata._tuplefilter = tup
         new_metadata._translated_indexes = indexes
@@ -152,6 +157,7 @@ class CursorResultMetaData(ResultMetaData):
 
         md._unpickled = self._unpickled
         md._processors = self._processors
+        md._row_processor = self._row_processor
         assert not self._tuplefilter
         md._tuplefilter = None
         md._translated_indexes = None
@@ -164,6 +170,7 @@ class CursorResultMetaData(ResultMetaData):
         context = parent.context
         self._tuplefilter = None
         self._translated_indexes = None
+        self._row_processor = None
         self._safe_for_cache = self._unpickled = False
 
         if context.result_column_struct:
@@ -683,6 +690,7 @@ class CursorResultMetaData(ResultMetaData):
 
     def __setstate__(self, state):
         self._processors = [None for _ in range(len(state["_keys"]))]
+        self._row_processor = None
         self._keymap = state["_keymap"]
 
         self._keymap_by_result_column_idx = None
@@ -889,12 +897,40 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
 
     .. versionadded:: 1.4 ``max_row_buffer`` may now exceed 1000 rows.
 
+    Alternatively, the size of the buffer may be adapted to the rows being
+    fetched, using the ``row_buffer_target_bytes`` execution option, which
+    sets an approximate number of bytes of rows to buffer at a time based on
+    the size of the rows fetched, and / or the ``row_buffer_target_time``
+    execution option, which sets a number of seconds that each fetch should
+    take based on the duration of previous fetches.   When either is set,
+    the buffer size is limited only by ``max_row_buffer`` if also present,
+    and is otherwise recalculated after each fetch, growing by at most the
+    growth factor each time::
+
+        with psycopg2_engine.connect() as conn:
+
+            result = conn.execution_options(
+                stream_results=True,
+                row_buffer_target_bytes=10 * 1024 * 1024,
+                row_buffer_target_time=0.1,
+            ).execute(text("select * from table"))
+
+    .. versionadded:: 2.0 Added ``row_buffer_target_bytes`` and
+       ``row_buffer_target_time``.
+
     .. seealso::
 
         :ref:`psycopg2_execution_options`
     """
 
-    __slots__ = ("_max_row_buffer", "_rowbuffer", "_bufsize", "_growth_factor")
+    __slots__ = (
+        "_max_row_buffer",
+        "_rowbuffer",
+        "_bufsize",
+        "_growth_factor",
+        "_target_bytes",
+        "_target_time",
+    )
 
     def __init__(
         self,
@@ -904,7 +940,16 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         initial_buffer=None,
     ):
 
-        self._max_row_buffer = execution_options.get("max_row_buffer", 1000)
+        self._target_bytes = execution_options.get("row_buffer_target_bytes")
+        self._target_time = execution_options.get("row_buffer_target_time")
+
+        if self._target_bytes or self._target_time:
+            # adaptive buffer size; unlimited unless max_row_buffer is given
+            self._max_row_buffer = execution_options.get("max_row_buffer")
+        else:
+            self._max_row_buffer = execution_options.get(
+                "max_row_buffer", 1000
+            )
 
         if initial_buffer is not None:
             self._rowbuffer = initial_buffer
@@ -912,7 +957,9 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
             self._rowbuffer = collections.deque(dbapi_cursor.fetchmany(1))
         self._growth_factor = growth_factor
 
-        if growth_factor:
+        if self._max_row_buffer is None:
+            self._bufsize = growth_factor or 1
+        elif growth_factor:
             self._bufsize = min(self._max_row_buffer, self._growth_factor)
         else:
             self._bufsize = self._max_row_buffer
@@ -928,6 +975,9 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         """this is currently used only by fetchone()."""
 
         size = self._bufsize
+        adaptive = self._target_bytes or self._target_time
+        if adaptive:
+            start = perf_counter()
         try:
             if size < 1:
                 new_rows = dbapi_cursor.fetchall()
@@ -939,13 +989,48 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         if not new_rows:
             return
         self._rowbuffer = collections.deque(new_rows)
-        if self._growth_factor and size < self._max_row_buffer:
+        if adaptive:
+            self._bufsize = self._adapt_bufsize(
+                size, new_rows, perf_counter() - start
+            )
+        elif self._growth_factor and size < self._max_row_buffer:
             self._bufsize = min(
                 self._max_row_buffer, size * self._growth_factor
             )
 
+    def _adapt_bufsize(self, size, new_rows, elapsed):
+        """Return the buffer size for the next fetch, given the rows
+        just fetched and the number of seconds the fetch took."""
+
+        if size < 1:
+            # all remaining rows were fetched
+            return size
+
+        targets = []
+        if self._target_time and elapsed > 0:
+            targets.append(int(len(new_rows) * self._target_time / elapsed))
+        if self._target_bytes:
+            # approximate the in-memory size of a row using the first row
+            # of those fetched
+            row = new_rows[0]
+            row_size = sys.getsizeof(row) + sum(
+                sys.getsizeof(value) for value in row
+            )
+            targets.append(self._target_bytes // row_size)
+
+        if targets:
+            new_size = min(targets)
+        else:
+            new_size = size * (self._growth_factor or 1)
+        if self._growth_factor:
+            new_size = min(new_size, size * self._growth_factor)
+        if self._max_row_buffer is not None:
+            new_size = min(new_size, self._max_row_buffer)
+        return max(new_size, 1)
+
     def yield_per(self, result, dbapi_cursor, num):
         self._growth_factor = 0
+        self._target_bytes = self._target_time = None
         self._max_row_buffer = self._bufsize = num
 
     def soft_close(self, result, dbapi_cursor):
@@ -1132,11 +1217,21 @@ class BaseCursorResult:
 
             keymap = metadata._keymap
             processors = metadata._processors
+            row_processor = metadata._row_processor
             process_row = self._process_row
             key_style = process_row._default_key_style
-            _make_row = functools.partial(
-                process_row, metadata, processors, keymap, key_style
-            )
+            if row_processor:
+                _make_processed_row = functools.partial(
+                    process_row, metadata, None, keymap, key_style
+                )
+
+                def _make_row(row):
+                    return _make_processed_row(row_processor(row))
+
+            else:
+                _make_row = functools.partial(
+                    process_row, metadata, processors, keymap, key_style
+                )
             if log_row:
 
                 def make_row(row):
@@ -1161,6 +1256,13 @@ class BaseCursorResult:
             else:
                 metadata = self._cursor_metadata(self, cursor_description)
                 if metadata._safe_for_cache:
+                    # the metadata will be reused for each execution of
+                    # the compiled statement; generate a single callable
+                    # to process each row in place of the individual
+                    # processors
+                    metadata._row_processor = fused_processor(
+                        metadata._processors
+                    )
                     compiled._cached_metadata = metadata
 
             # result rewrite/ adapt step.  this is to suit the case
@@ -1667,9 +1769,91 @@ class CursorResult(BaseCursorResult, Result):
     def _raw_row_iterator(self):
         return self._fetchiter_impl()
 
-    def merge(self, *others):
-        merged_result = super(CursorResult, self).merge(*others)
-        setup_rowcounts = not self._metadata.returns_rows
+    def columns_as_arrays(self, chunksize=None, as_numpy=False):
+        """Fetch all remaining rows, returning them as a list of per-column
+        sequences rather than as :class:`_engine.Row` objects.
+
+        E.g.::
+
+            result = conn.execute(select(table.c.id, table.c.data))
+            ids, data = result.columns_as_arrays()
+
+        Rows are fetched from the DBAPI cursor in chunks of ``chunksize``
+        and transposed directly into one buffer per column; the result
+        processor for each column's type, if any, is applied once per chunk
+        of column values.  No :class:`_engine.Row` objects are created, which
+        reduces both CPU time and memory for results with many rows.
+
+        The sequences are returned in the same order as
+        :meth:`_engine.CursorResult.keys`.  The result is exhausted and
+        closed when this method returns.
+
+        :param chunksize: number of rows to fetch from the cursor at a
+         time.  Defaults to the value passed to
+         :meth:`_engine.CursorResult.yield_per` if any, otherwise 10000.
+
+        :param as_numpy: when True, each column is returned as a
+         ``numpy.ndarray``, which requires that NumPy is installed.
+         Otherwise each column is a Python ``list``.
+
+        .. versionadded:: 2.0
+
+        """
+        metadata = self._metadata
+        if not metadata.returns_rows:
+            metadata._we_dont_return_rows()
+
+        if self._unique_filter_state:
+            raise exc.InvalidRequestError(
+                "Can't use columns_as_arrays() with a uniquing result"
+            )
+
+        if as_numpy:
+            import numpy
+        else:
+            numpy = None
+
+        if chunksize is None:
+            chunksize = self._yield_per or 10000
+
+        processors = metadata._processors
+        tf = metadata._tuplefilter
+        if tf and processors:
+            processors = tf(processors)
+
+        num_cols = len(metadata._keys)
+        if not processors:
+            processors = [None] * num_cols
+
+        columns = [[] for _ in range(num_cols)]
+        fetchmany = self._fetchmany_impl
+
+        while True:
+            rows = fetchmany(chunksize)
+            if not rows:
+                break
+            if tf:
+                rows = [tf(row) for row in rows]
+            for buf, proc, values in zip(columns, processors, zip(*rows)):
+                if proc:
+                    buf.extend(map(proc, values))
+                else:
+                    buf.extend(values)
+
+        self._soft_close()
+
+        if numpy is not None:
+            return [numpy.array(buf) for buf in columns]
+        else:
+            return columns
+
+    def merge(self, *others, key=None):
+        merged_result = super(CursorResult, self).merge(*others, key=key)
+        setup_rowcounts = (
+            not self._metadata.returns_rows
+            or self.context.isupdate
+            or self.context.isdelete
+        )
         if setup_rowcounts:
             merged_result.rowcount = sum(
                 result.rowcount for result in (self,) + others
@@ -23,6 +23,8 @@ from . import characteristics
 from . import cursor as _cursor
 from . import interfaces
 from .base import Connection
+from .util import _process_named_parameters
+from .util import _process_positional_parameters
 from .. import event
 from .. import exc
 from .. import pool
@@ -79,7 +81,13 @@ class DefaultDialect(interfaces.Dialect):
     postfetch_lastrowid = True
     implicit_returning = False
     full_returning = False
-    insert_executemany_returning = False
+
+    use_insertmanyvalues = False
+
+    use_insertmanyvalues_wo_returning = False
+
+    insertmanyvalues_page_size = 1000
+    insertmanyvalues_max_parameters = 32700
 
     cte_follows_insert = False
 
@@ -104,6 +112,8 @@ class DefaultDialect(interfaces.Dialect):
             ("pool_size", util.asint),
             ("max_overflow", util.asint),
             ("future", util.asbool),
+            ("use_insertmanyvalues", util.asbool),
+            ("insertmanyvalues_page_size", util.asint),
         ]
     )
 
@@ -151,6 +161,8 @@ class DefaultDialect(interfaces.Dialect):
 
     server_side_cursors = False
 
+    supports_pipeline = False
+
     # extra record-level locking features (#4860)
     supports_for_update_of = False
 
@@ -258,6 +270,8 @@ class DefaultDialect(interfaces.Dialect):
         # the direct reference to the "NO_LINTING" object
         compiler_linting=int(compiler.NO_LINTING),
         server_side_cursors=False,
+        use_insertmanyvalues=None,
+        insertmanyvalues_page_size=None,
         **kwargs,
     ):
 
@@ -304,6 +318,11 @@ class DefaultDialect(interfaces.Dialect):
         self.label_length = label_length
         self.compiler_linting = compiler_linting
 
+        if use_insertmanyvalues is not None:
+            self.use_insertmanyvalues = use_insertmanyvalues
+        if insertmanyvalues_page_size is not None:
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
+
     @util.memoized_property
     def _bind_typing_render_casts(self):
         return self.bind_typing is interfaces.BindTyping.RENDER_CASTS
@@ -349,6 +368,32 @@ class DefaultDialect(interfaces.Dialect):
     def dialect_description(self):
         return self.name + "+" + self.driver
 
+    _insert_executemany_returning = None
+
+    @property
+    def insert_executemany_returning(self):
+        """True if this dialect can deliver RETURNING rows for an INSERT
+        that's invoked with a list of parameter sets.
+
+        Unless set explicitly by the dialect, this is derived from the
+        :attr:`.Dialect.use_insertmanyvalues` flag in conjunction with
+        the ``full_returning`` and ``supports_multivalues_insert`` flags,
+        which may only be known once the dialect is initialized with a
+        server version.
+
+        """
+        if self._insert_executemany_returning is not None:
+            return self._insert_executemany_returning
+        return bool(
+            self.use_insertmanyvalues
+            and self.full_returning
+            and self.supports_multivalues_insert
+        )
+
+    @insert_executemany_returning.setter
+    def insert_executemany_returning(self, value):
+        self._insert_executemany_returning = value
+
     @property
     def supports_sane_rowcount_returning(self):
         """True if this dialect supports sane rowcount even if RETURNING is
@@ -562,6 +607,12 @@ class DefaultDialect(interfaces.Dialect):
     def do_commit(self, dbapi_connection):
         dbapi_connection.commit()
 
+    def do_pipeline(self, dbapi_connection):
+        raise NotImplementedError(
+            "Dialect %s does not support pipeline mode"
+            % self.dialect_description
+        )
+
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
@@ -764,6 +815,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     is_text = False
     isddl = False
     executemany = False
+    execute_style = interfaces.ExecuteStyle.EXECUTE
     compiled = None
     statement = None
     result_column_struct = None
@@ -788,6 +840,16 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     _expanded_parameters = util.immutabledict()
 
+    _rowcount = None
+
+    # statement was sent in pipeline mode; its results are available once
+    # the Connection synchronizes the pipeline
+    _pipelined = False
+
+    # statement may be sent in pipeline mode, if otherwise eligible;
+    # dialects may disallow this for particular execution styles
+    _allow_pipeline = True
+
     cache_hit = NO_CACHE_KEY
 
     @classmethod
@@ -906,8 +968,6 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             else:
                 self._process_executesingle_defaults()
 
-        processors = compiled._bind_processors
-
         if compiled.literal_execute_params or compiled.post_compile_params:
             if self.executemany:
                 raise exc.InvalidRequestError(
@@ -925,11 +985,13 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             # used by set_input_sizes() which is needed for Oracle
             self._expanded_parameters = expanded_state.parameter_expansion
 
-            processors = dict(processors)
+            processors = dict(compiled._bind_processors)
             processors.update(expanded_state.processors)
-            positiontup = expanded_state.positiontup
-        elif compiled.positional:
-            positiontup = self.compiled.positiontup
+            getter, processors = compiled._get_bind_processing_plan(
+                expanded_state.positiontup, processors
+            )
+        else:
+            getter, processors = compiled._bind_processing_plan
 
         if compiled.schema_translate_map:
             schema_translate_map = self.execution_options.get(
@@ -944,30 +1006,36 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         # by dialect
         self.statement = self.unicode_statement
 
+        if self.executemany:
+            if (
+                self.isinsert
+                and dialect.use_insertmanyvalues
+                and (
+                    compiled.returning
+                    or (
+                        compiled._insertmanyvalues is not None
+                        and dialect.use_insertmanyvalues_wo_returning
+                    )
+                )
+            ):
+                self.execute_style = interfaces.ExecuteStyle.INSERTMANYVALUES
+            else:
+                self.execute_style = interfaces.ExecuteStyle.EXECUTEMANY
+
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
-        parameters = []
         if compiled.positional:
-            for compiled_params in self.compiled_parameters:
-                param = [
-                    processors[key](compiled_params[key])
-                    if key in processors
-                    else compiled_params[key]
-                    for key in positiontup
-                ]
-                parameters.append(dialect.execute_sequence_format(param))
+            parameters = _process_positional_parameters(
+                self.compiled_parameters,
+                getter,
+                processors,
+                dialect.execute_sequence_format,
+            )
         else:
-            for compiled_params in self.compiled_parameters:
-
-                param = {
-                    key: processors[key](compiled_params[key])
-                    if key in processors
-                    else compiled_params[key]
-                    for key in compiled_params
-                }
-
-                parameters.append(param)
+            parameters = _process_named_parameters(
+                self.compiled_parameters, processors
+            )
 
         self.parameters = dialect.execute_sequence_format(parameters)
 
@@ -1008,6 +1076,8 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             ]
 
         self.executemany = len(parameters) > 1
+        if self.executemany:
+            self.execute_style = interfaces.ExecuteStyle.EXECUTEMANY
 
         self.statement = self.unicode_statement = statement
 
@@ -1234,6 +1304,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @property
     def rowcount(self):
+        if self._pipelined:
+            self.root_connection._sync_pipeline()
+        if self._rowcount is not None:
+            return self._rowcount
         return self.cursor.rowcount
 
     def supports_sane_rowcount(self):
@@ -1323,6 +1397,13 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         result = _cursor.CursorResult(self, strategy, cursor_description)
 
+        if self._pipelined:
+            # the cursor remains open until the pipeline is synchronized,
+            # at which point the rowcount is retrieved and the result
+            # soft-closed
+            self.root_connection._pipeline_results.append(result)
+            return result
+
         if self.isinsert:
             if self._is_implicit_returning:
                 rows = result.all()
@@ -1539,26 +1620,17 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             default_arg = default.arg
         compiled = expression.select(default_arg).compile(dialect=self.dialect)
         compiled_params = compiled.construct_params()
-        processors = compiled._bind_processors
+        getter, processors = compiled._bind_processing_plan
         if compiled.positional:
-            positiontup = compiled.positiontup
-            parameters = self.dialect.execute_sequence_format(
-                [
-                    processors[key](compiled_params[key])
-                    if key in processors
-                    else compiled_params[key]
-                    for key in positiontup
-                ]
+            (parameters,) = _process_positional_parameters(
+                [compiled_params],
+                getter,
+                processors,
+                self.dialect.execute_sequence_format,
             )
         else:
-            parameters = dict(
-                (
-                    key,
-                    processors[key](compiled_params[key])
-                    if key in processors
-                    else compiled_params[key],
-                )
-                for key in compiled_params
+            (parameters,) = _process_named_parameters(
+                [compiled_params], processors
             )
         return self._execute_scalar(
             str(compiled), type_, parameters=parameters
@@ -557,6 +557,37 @@ class ConnectionEvents(event.Events):
 
         """
 
+    def cache_miss_storm(self, conn, statements, elapsed):
+        """Intercept when a large number of statements have been compiled
+        within a short period of time, indicating that statements are not
+        being reused from the compiled cache.
+
+        This is typically the result of statements whose cache key differs
+        on each execution, such as those which render literal values that
+        change from one execution to the next.   The event is emitted when
+        the number of cache misses given by the
+        :paramref:`_sa.create_engine.cache_miss_storm_threshold` parameter
+        occurs within the number of seconds given by
+        :paramref:`_sa.create_engine.cache_miss_storm_interval`; counting
+        then starts over.
+
+        :param conn: :class:`_engine.Connection` object which executed the
+         statement that produced the final cache miss
+
+        :param statements: list of SQL strings for the statements that
+         were compiled
+
+        :param elapsed: time in seconds over which the statements were
+         compiled
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_engine.Engine.cache_stats`
+
+        """
+
     def begin(self, conn):
         """Intercept begin() events.
 
@@ -463,6 +463,29 @@ class BindTyping(Enum):
     """
 
 
+class ExecuteStyle(Enum):
+    """indicates the :term:`DBAPI` cursor method that will be used to invoke
+    a statement.
+
+    .. versionadded:: 2.0
+
+    """
+
+    EXECUTE = 0
+    """indicates cursor.execute() will be used"""
+
+    EXECUTEMANY = 1
+    """indicates cursor.executemany() will be used."""
+
+    INSERTMANYVALUES = 2
+    """indicates cursor.execute() will be used with an INSERT where the
+    VALUES expression will be expanded to accommodate for multiple
+    parameter sets, delivered in pages; see
+    :attr:`.Dialect.use_insertmanyvalues`.
+
+    """
+
+
 class Dialect:
     """Define the behavior of a specific database and DB-API combination.
 
@@ -560,6 +583,18 @@ class Dialect:
       VALUES`` is supported
     """
 
+    supports_pipeline: bool
+    """Indicates if the dialect is able to send statements in the
+    driver's pipeline mode, using :meth:`.Dialect.do_pipeline`.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`dbapi_pipeline`
+
+    """
+
     preexecute_autoincrement_sequences: bool
     """True if 'implicit' primary key functions must be executed separately
       in order to get their value.   This is currently oriented towards
@@ -653,6 +688,64 @@ class Dialect:
 
     .. versionadded:: 2.0
 
+    """
+
+    use_insertmanyvalues: bool
+    """if True, indicates "insertmanyvalues" functionality should be used
+    to allow for ``insert_executemany_returning`` behavior, if possible.
+
+    In practice, setting this to True means:
+
+    if ``supports_multivalues_insert``, ``full_returning`` and
+    ``use_insertmanyvalues`` are all True, the SQL compiler will produce
+    an INSERT that will be interpreted by the :class:`.DefaultDialect`
+    as an :attr:`.ExecuteStyle.INSERTMANYVALUES` execution that allows
+    for INSERT of many rows with RETURNING by rewriting a single-row
+    INSERT statement to have multiple VALUES clauses, also executing
+    the statement multiple times for a series of batches when large
+    numbers of rows are given.
+
+    The parameter is False for the default dialect, and is set to
+    True for SQLAlchemy internal dialects SQLite, PostgreSQL and SQL
+    Server.   It remains at False for Oracle, which does not support
+    ``supports_multivalues_insert``, as well as for MySQL/MariaDB, which
+    don't support RETURNING.  Dialects which set the flag but
+    which are connected to a database version that doesn't support
+    RETURNING, such as SQLite prior to 3.35, will not report
+    ``insert_executemany_returning`` as True.
+
+    .. versionadded:: 2.0
+
+    """
+
+    use_insertmanyvalues_wo_returning: bool
+    """if True, and use_insertmanyvalues is also True, INSERT statements
+    that don't include RETURNING will also use "insertmanyvalues".
+
+    .. versionadded:: 2.0
+
+    """
+
+    insertmanyvalues_page_size: int
+    """Number of rows to render into an individual INSERT..VALUES() statement
+    for :attr:`.ExecuteStyle.INSERTMANYVALUES` executions.
+
+    The default dialect defaults this to 1000.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size` -
+        execution option available on :class:`_engine.Connection`, statements
+
+    """  # noqa: E501
+
+    insertmanyvalues_max_parameters: int
+    """Alternate to insertmanyvalues_page_size, will additionally limit
+    page size based on number of parameters total in the statement.
+
+
     """
 
     def create_connect_args(
@@ -1078,6 +1171,31 @@ class Dialect:
 
         raise NotImplementedError()
 
+    def do_pipeline(self, dbapi_connection: PoolProxiedConnection) -> Any:
+        """Return a context manager which places the given DBAPI connection
+        in pipeline mode for its duration.
+
+        While in pipeline mode, statements are sent to the database without
+        waiting for their results.   Exiting the context manager waits for
+        all outstanding results, raising the error of any statement that
+        failed, and returns the connection to its normal mode.
+
+        This method is only called if :attr:`.Dialect.supports_pipeline`
+        is True.
+
+        :param dbapi_connection: a DBAPI connection, typically
+         proxied within a :class:`.ConnectionFairy`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`dbapi_pipeline`
+
+        """
+
+        raise NotImplementedError()
+
     def do_commit(self, dbapi_connection: PoolProxiedConnection) -> None:
         """Provide an implementation of ``connection.commit()``, given a
         DB-API connection.
@@ -1964,6 +2082,10 @@ class ExecutionContext:
       dialect's paramstyle (i.e. dict or list of dicts for non
       positional, list or list of lists/tuples for positional).
 
+    execute_style
+      an :class:`.ExecuteStyle` member indicating the cursor method
+      that will be used to invoke the statement.
+
     isinsert
       True if the statement is an INSERT.
 
@@ -8,6 +8,7 @@
 """Define generic result set constructs."""
 import collections.abc as collections_abc
 import functools
+import heapq
 import itertools
 import operator
 import typing
@@ -22,8 +23,10 @@ from ..util._has_cy import HAS_CYEXTENSION
 
 
 if typing.TYPE_CHECKING or not HAS_CYEXTENSION:
+    from ._py_row import fused_processor
     from ._py_row import tuplegetter
 else:
+    from sqlalchemy.cyextension.resultproxy import fused_processor
     from sqlalchemy.cyextension.resultproxy import tuplegetter
 
 
@@ -36,6 +39,10 @@ class ResultMetaData:
     _translated_indexes = None
     _unique_filters = None
 
+    # a callable which applies the processors of each column to a row
+    # in one step, when present; see fused_processor()
+    _row_processor = None
+
     @property
     def keys(self):
         return RMKeyView(self)
@@ -295,6 +302,7 @@ class ResultInternal(InPlaceGenerative):
         keymap = metadata._keymap
         processors = metadata._processors
         tf = metadata._tuplefilter
+        row_processor = metadata._row_processor
 
         if tf and not real_result._source_supports_scalars:
             if processors:
@@ -307,6 +315,14 @@ class ResultInternal(InPlaceGenerative):
             def make_row(row):
                 return _make_row_orig(tf(row))
 
+        elif row_processor and not real_result._source_supports_scalars:
+            _make_row_orig = functools.partial(
+                process_row, metadata, None, keymap, key_style
+            )
+
+            def make_row(row):
+                return _make_row_orig(row_processor(row))
+
         else:
             make_row = functools.partial(
                 process_row, metadata, processors, keymap, key_style
@@ -1213,7 +1229,7 @@ class Result(_WithKeys, ResultInternal):
 
         return FrozenResult(self)
 
-    def merge(self, *others):
+    def merge(self, *others, key=None):
         """Merge this :class:`.Result` with other compatible result
         objects.
 
@@ -1226,8 +1242,16 @@ class Result(_WithKeys, ResultInternal):
         set of result / cursor metadata, otherwise the behavior is
         undefined.
 
+        :param key: optional callable which, given a :class:`_engine.Row`,
+         returns a sort key.  When present, each result object is assumed
+         to be sorted by this key, and rows are produced from all result
+         objects in the order of the key as in :func:`heapq.merge`, rather
+         than one result object after the other.
+
+         .. versionadded:: 2.0
+
         """
-        return MergedResult(self._metadata, (self,) + others)
+        return MergedResult(self._metadata, (self,) + others, key=key)
 
 
 class FilterResult(ResultInternal):
@@ -1740,14 +1764,15 @@ class MergedResult(IteratorResult):
 
     closed = False
 
-    def __init__(self, cursor_metadata, results):
+    def __init__(self, cursor_metadata, results, key=None):
         self._results = results
-        super(MergedResult, self).__init__(
-            cursor_metadata,
-            itertools.chain.from_iterable(
+        if key is not None:
+            iterator = self._merge_ordered(results, key)
+        else:
+            iterator = itertools.chain.from_iterable(
                 r._raw_row_iterator() for r in results
-            ),
-        )
+            )
+        super(MergedResult, self).__init__(cursor_metadata, iterator)
 
         self._unique_filter_state = results[0]._unique_filter_state
         self._yield_per = results[0]._yield_per
@@ -1759,6 +1784,23 @@ class MergedResult(IteratorResult):
             *[r._attributes for r in results]
         )
 
+    def _merge_ordered(self, results, key):
+        """Merge the raw rows of results which are each ordered by the
+        given key, which is applied to each :class:`.Row`.
+
+        """
+        make_row = self._row_getter
+
+        if make_row is not None:
+            orig_key = key
+
+            def key(raw):
+                return orig_key(make_row(raw))
+
+        yield from heapq.merge(
+            *[r._raw_row_iterator() for r in results], key=key
+        )
+
     def _soft_close(self, hard=False, **kw):
         for r in self._results:
             r._soft_close(hard=hard, **kw)
@@ -11,9 +11,17 @@ from .. import util
 try:
     from sqlalchemy.cyextension.util import _distill_params_20  # noqa
     from sqlalchemy.cyextension.util import _distill_raw_params  # noqa
+    from sqlalchemy.cyextension.util import (  # noqa
+        _process_named_parameters,
+    )
+    from sqlalchemy.cyextension.util import (  # noqa
+        _process_positional_parameters,
+    )
 except ImportError:
     from ._py_util import _distill_params_20  # noqa
     from ._py_util import _distill_raw_params  # noqa
+    from ._py_util import _process_named_parameters  # noqa
+    from ._py_util import _process_positional_parameters  # noqa
 
 
 def connection_memoize(key):
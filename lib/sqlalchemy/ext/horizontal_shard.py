@@ -15,14 +15,22 @@ the source distribution.
 
 """
 
+import asyncio
+import concurrent.futures
+import time
+
+from .asyncio.engine import _get_sync_engine_or_connection
+from .asyncio.session import AsyncSession
 from .. import event
 from .. import exc
 from .. import inspect
 from .. import util
 from ..orm.query import Query
 from ..orm.session import Session
+from ..util.concurrency import await_only
+from ..util.concurrency import greenlet_spawn
 
-__all__ = ["ShardedSession", "ShardedQuery"]
+__all__ = ["ShardedSession", "ShardedQuery", "AsyncShardedSession"]
 
 
 class ShardedQuery(Query):
@@ -59,6 +67,7 @@ class ShardedSession(Session):
         execute_chooser=None,
         shards=None,
         query_cls=ShardedQuery,
+        executor=None,
         **kwargs,
     ):
         """Construct a ShardedSession.
@@ -77,7 +86,12 @@ class ShardedSession(Session):
         :param execute_chooser: For a given :class:`.ORMExecuteState`,
           returns the list of shard_ids
           where the query should be issued.  Results from all shards returned
-          will be combined together into a single listing.
+          will be combined together into a single listing.   If the
+          ``shard_merge_key`` execution option is present, it's used as the
+          ``key`` function for :func:`heapq.merge`, receiving each
+          :class:`_engine.Row`, such that results from shards which are
+          each ordered by that key are merged into a single ordered
+          listing as they're consumed, rather than being concatenated.
 
           .. versionchanged:: 1.4  The ``execute_chooser`` parameter
              supersedes the ``query_chooser`` parameter.
@@ -85,6 +99,29 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param executor: optional :class:`concurrent.futures.Executor`,
+          such as a :class:`concurrent.futures.ThreadPoolExecutor`, which
+          will be used to run a SELECT statement against each of the shards
+          returned by ``execute_chooser`` concurrently, rather than one after
+          the other.   Autoflush, as well as procuring the database
+          connection for each shard, takes place before the statements are
+          dispatched, and ORM objects are produced from the rows of each
+          shard as the merged result is consumed within the calling thread.
+          Shards which share the same :class:`_engine.Engine`, as well as
+          UPDATE and DELETE statements, are still run one after the other.
+          The executor is not shut down by the :class:`.ShardedSession`.
+
+          When an executor is in use, the ``shard_timeout`` execution option
+          may be used to indicate the number of seconds to wait for all of
+          the shards to respond, after which :class:`.exc.TimeoutError` is
+          raised.  Statements which haven't started yet are cancelled, and
+          the results of the other shards are closed; the connection of a
+          statement that's still running is invalidated, and its result is
+          closed once it completes, so the session should be rolled back or
+          closed in this case.
+
+          .. versionadded:: 2.0
+
         """
         query_chooser = kwargs.pop("query_chooser", None)
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
@@ -114,6 +151,7 @@ class ShardedSession(Session):
         else:
             self.execute_chooser = execute_chooser
         self.query_chooser = query_chooser
+        self.executor = executor
         self.__binds = {}
         if shards is not None:
             for k in shards:
@@ -205,6 +243,215 @@ class ShardedSession(Session):
     def bind_shard(self, shard_id, bind):
         self.__binds[shard_id] = bind
 
+    @property
+    def _concurrent_shards(self):
+        return self.executor is not None
+
+    def _execute_shards_concurrently(self, orm_context, shard_ids, invoke):
+        """Invoke a SELECT statement against the given shards using
+        :attr:`.ShardedSession.executor`, returning the list of results.
+
+        """
+        if orm_context.load_options._autoflush:
+            self._autoflush()
+
+        # procure connections up front, so that the SessionTransaction
+        # isn't modified from within worker threads
+        connections = [
+            self.connection(
+                bind_arguments=dict(
+                    orm_context.bind_arguments, shard_id=shard_id
+                )
+            )
+            for shard_id in shard_ids
+        ]
+        if len(set(connections)) < len(connections):
+            return [invoke(shard_id) for shard_id in shard_ids]
+
+        return self._invoke_shards_concurrently(
+            shard_ids,
+            connections,
+            invoke,
+            orm_context.execution_options.get("shard_timeout"),
+        )
+
+    def _invoke_shards_concurrently(
+        self, shard_ids, connections, invoke, timeout
+    ):
+        futures = [
+            self.executor.submit(invoke, shard_id) for shard_id in shard_ids
+        ]
+
+        # the timeout applies to all of the shards together
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        results = []
+        try:
+            for shard_id, future in zip(shard_ids, futures):
+                if timeout is not None:
+                    remaining = max(deadline - time.monotonic(), 0)
+                else:
+                    remaining = None
+                try:
+                    results.append(future.result(timeout=remaining))
+                except concurrent.futures.TimeoutError as err:
+                    raise exc.TimeoutError(
+                        "Shard %r did not respond within %s seconds"
+                        % (shard_id, timeout)
+                    ) from err
+        except BaseException as err:
+            for future in futures:
+                future.cancel()
+            if isinstance(err, exc.TimeoutError):
+                # statements still running after a timeout aren't waited
+                # upon; their connections, which are owned by the
+                # transaction, are invalidated so that they're no longer
+                # used by the session
+                for connection, future in zip(connections, futures):
+                    if not future.done():
+                        connection.invalidate()
+            else:
+                # don't leave statements running on connections that are
+                # still owned by the transaction
+                concurrent.futures.wait(futures)
+            for future in futures:
+                future.add_done_callback(_close_shard_result)
+            raise
+
+        return results
+
+
+def _close_shard_result(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class _AsyncAdaptedShardedSession(ShardedSession):
+    """The :class:`.ShardedSession` proxied by :class:`.AsyncShardedSession`,
+    which runs statements against multiple shards concurrently on the
+    event loop.
+
+    """
+
+    _concurrent_shards = True
+
+    def _invoke_shards_concurrently(
+        self, shard_ids, connections, invoke, timeout
+    ):
+        async def invoke_shard(shard_id, connection):
+            try:
+                return await asyncio.wait_for(
+                    greenlet_spawn(invoke, shard_id), timeout
+                )
+            except asyncio.TimeoutError as err:
+                # the statement was cancelled partway through, so the
+                # connection is no longer used by the session
+                await greenlet_spawn(connection.invalidate)
+                raise exc.TimeoutError(
+                    "Shard %r did not respond within %s seconds"
+                    % (shard_id, timeout)
+                ) from err
+
+        results = await_only(
+            asyncio.gather(
+                *[
+                    invoke_shard(shard_id, connection)
+                    for shard_id, connection in zip(shard_ids, connections)
+                ],
+                return_exceptions=True,
+            )
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                for other in results:
+                    if not isinstance(other, BaseException):
+                        other.close()
+                raise result
+
+        return results
+
+
+class AsyncShardedSession(AsyncSession):
+    """Asyncio version of :class:`.ShardedSession`.
+
+    The :class:`.AsyncShardedSession` is an :class:`_asyncio.AsyncSession`
+    which proxies a :class:`.ShardedSession`, accepting the same
+    ``shard_chooser``, ``id_chooser`` and ``execute_chooser`` hooks,
+    along with a dictionary of :class:`_asyncio.AsyncEngine` objects::
+
+        session = AsyncShardedSession(
+            shard_chooser=shard_chooser,
+            id_chooser=id_chooser,
+            execute_chooser=execute_chooser,
+            shards={
+                "north_america": create_async_engine(...),
+                "asia": create_async_engine(...),
+            },
+        )
+
+        result = await session.execute(select(WeatherLocation))
+
+    When a SELECT statement is run against more than one shard, the
+    statement for each shard is run concurrently on the event loop, and the
+    results are merged into a single result, which may be ordered using the
+    ``shard_merge_key`` execution option as described for
+    :class:`.ShardedSession`.  The ``shard_timeout`` execution option
+    indicates the number of seconds to wait for the shards, after which the
+    statement against a shard that hasn't responded is cancelled, its
+    connection is invalidated, and :class:`.exc.TimeoutError` is raised.
+
+    .. versionadded:: 2.0
+
+    """
+
+    sync_session_class = _AsyncAdaptedShardedSession
+
+    def __init__(
+        self,
+        shard_chooser,
+        id_chooser,
+        execute_chooser=None,
+        shards=None,
+        **kw,
+    ):
+        """Construct an AsyncShardedSession.
+
+        :param shard_chooser: see :class:`.ShardedSession`.
+
+        :param id_chooser: see :class:`.ShardedSession`.
+
+        :param execute_chooser: see :class:`.ShardedSession`.
+
+        :param shards: A dictionary of string shard names
+          to :class:`_asyncio.AsyncEngine` objects.
+
+        Additional keyword arguments are passed to
+        :class:`_asyncio.AsyncSession`.
+
+        """
+        if shards is not None:
+            shards = {
+                shard_id: _get_sync_engine_or_connection(bind)
+                for shard_id, bind in shards.items()
+            }
+
+        super(AsyncShardedSession, self).__init__(
+            shard_chooser=shard_chooser,
+            id_chooser=id_chooser,
+            execute_chooser=execute_chooser,
+            shards=shards,
+            **kw,
+        )
+
+    def bind_shard(self, shard_id, bind):
+        """Associate a shard id with an :class:`_asyncio.AsyncEngine`."""
+
+        self.sync_session.bind_shard(
+            shard_id, _get_sync_engine_or_connection(bind)
+        )
+
 
 def execute_and_instances(orm_context):
     if orm_context.is_select:
@@ -248,9 +495,27 @@ def execute_and_instances(orm_context):
     if shard_id is not None:
         return iter_for_shard(shard_id, load_options, update_options)
     else:
-        partial = []
-        for shard_id in session.execute_chooser(orm_context):
-            result_ = iter_for_shard(shard_id, load_options, update_options)
-            partial.append(result_)
-
-        return partial[0].merge(*partial[1:])
+        shard_ids = list(session.execute_chooser(orm_context))
+
+        if (
+            session._concurrent_shards
+            and orm_context.is_select
+            and len(shard_ids) > 1
+        ):
+            partial = session._execute_shards_concurrently(
+                orm_context,
+                shard_ids,
+                lambda shard_id: iter_for_shard(
+                    shard_id, load_options + {"_autoflush": False}, None
+                ),
+            )
+        else:
+            partial = [
+                iter_for_shard(shard_id, load_options, update_options)
+                for shard_id in shard_ids
+            ]
+
+        return partial[0].merge(
+            *partial[1:],
+            key=orm_context.execution_options.get("shard_merge_key"),
+        )
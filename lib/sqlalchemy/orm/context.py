@@ -83,6 +83,7 @@ class QueryContext:
         _refresh_state = None
         _lazy_loaded_from = None
         _legacy_uniquing = False
+        _readonly_entities = False
 
     def __init__(
         self,
@@ -253,7 +254,12 @@ class ORMCompileState(CompileState):
             execution_options,
         ) = QueryContext.default_load_options.from_execution_options(
             "_sa_orm_load_options",
-            {"populate_existing", "autoflush", "yield_per"},
+            {
+                "populate_existing",
+                "autoflush",
+                "yield_per",
+                "readonly_entities",
+            },
             execution_options,
             statement._execution_options,
         )
@@ -2162,17 +2168,28 @@ class _MapperEntity(_QueryEntity):
         else:
             only_load_props = refresh_state = None
 
-        _instance = loading._instance_processor(
-            self,
-            self.mapper,
-            context,
-            result,
-            self.path,
-            adapter,
-            only_load_props=only_load_props,
-            refresh_state=refresh_state,
-            polymorphic_discriminator=self._polymorphic_discriminator,
-        )
+        if context.load_options._readonly_entities:
+            _instance = loading._readonly_instance_processor(
+                self,
+                self.mapper,
+                context,
+                result,
+                self.path,
+                adapter,
+                polymorphic_discriminator=self._polymorphic_discriminator,
+            )
+        else:
+            _instance = loading._instance_processor(
+                self,
+                self.mapper,
+                context,
+                result,
+                self.path,
+                adapter,
+                only_load_props=only_load_props,
+                refresh_state=refresh_state,
+                polymorphic_discriminator=self._polymorphic_discriminator,
+            )
 
         return _instance, self._label_name, self._extra_entities
 
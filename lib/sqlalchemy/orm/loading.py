@@ -86,49 +86,82 @@ def instances(cursor, context):
         with util.safe_reraise():
             cursor.close()
 
-    def _no_unique(entry):
-        raise sa_exc.InvalidRequestError(
-            "Can't use the ORM yield_per feature in conjunction with unique()"
-        )
+    # the result metadata is a function of the entities in the compile
+    # state along with the uniquing options in use, so is cached along
+    # with the compile state, which itself is cached along with the
+    # compiled statement.  columns that are targeted using the invoked
+    # statement vary per execution, so in that case False is cached.
+    metadata_key = (
+        "row_metadata",
+        bool(context.yield_per),
+        context.load_options._legacy_uniquing,
+        single_entity,
+    )
+    cached_metadata = compile_state.attributes.get(metadata_key)
+
+    if not cached_metadata:
 
-    def _not_hashable(datatype):
-        def go(obj):
+        def _no_unique(entry):
             raise sa_exc.InvalidRequestError(
-                "Can't apply uniqueness to row tuple containing value of "
-                "type %r; this datatype produces non-hashable values"
-                % datatype
+                "Can't use the ORM yield_per feature in conjunction "
+                "with unique()"
             )
 
-        return go
-
-    if context.load_options._legacy_uniquing:
-        unique_filters = [
-            _no_unique
-            if context.yield_per
-            else id
-            if (
-                ent.use_id_for_hash
-                or ent._non_hashable_value
-                or ent._null_column_type
+        def _not_hashable(datatype):
+            def go(obj):
+                raise sa_exc.InvalidRequestError(
+                    "Can't apply uniqueness to row tuple containing value of "
+                    "type %r; this datatype produces non-hashable values"
+                    % datatype
+                )
+
+            return go
+
+        if context.load_options._legacy_uniquing:
+            unique_filters = [
+                _no_unique
+                if context.yield_per
+                else id
+                if (
+                    ent.use_id_for_hash
+                    or ent._non_hashable_value
+                    or ent._null_column_type
+                )
+                else None
+                for ent in compile_state._entities
+            ]
+        else:
+            unique_filters = [
+                _no_unique
+                if context.yield_per
+                else _not_hashable(ent.column.type)
+                if (not ent.use_id_for_hash and ent._non_hashable_value)
+                else id
+                if ent.use_id_for_hash
+                else None
+                for ent in compile_state._entities
+            ]
+
+        # filtered and single_entity are used to indicate to legacy Query
+        # that the query has ORM entities, so legacy deduping and scalars
+        # should be called on the result.
+        row_metadata = SimpleResultMetaData(
+            labels, extra, _unique_filters=unique_filters
+        )
+        result_attributes = util.immutabledict(
+            dict(filtered=filtered, is_single_entity=single_entity)
+        )
+
+        if cached_metadata is None:
+            compile_state.attributes[metadata_key] = (
+                not any(
+                    getattr(ent, "translate_raw_column", False)
+                    for ent in compile_state._entities
+                )
+                and (row_metadata, result_attributes)
             )
-            else None
-            for ent in context.compile_state._entities
-        ]
     else:
-        unique_filters = [
-            _no_unique
-            if context.yield_per
-            else _not_hashable(ent.column.type)
-            if (not ent.use_id_for_hash and ent._non_hashable_value)
-            else id
-            if ent.use_id_for_hash
-            else None
-            for ent in context.compile_state._entities
-        ]
-
-    row_metadata = SimpleResultMetaData(
-        labels, extra, _unique_filters=unique_filters
-    )
+        row_metadata, result_attributes = cached_metadata
 
     def chunks(size):
         while True:
@@ -177,12 +210,7 @@ def instances(cursor, context):
         dynamic_yield_per=cursor.context._is_server_side,
     )
 
-    # filtered and single_entity are used to indicate to legacy Query that the
-    # query has ORM entities, so legacy deduping and scalars should be called
-    # on the result.
-    result._attributes = result._attributes.union(
-        dict(filtered=filtered, is_single_entity=single_entity)
-    )
+    result._attributes = result_attributes
 
     # multi_row_eager_loaders OTOH is specific to joinedload.
     if context.compile_state.multi_row_eager_loaders:
@@ -717,6 +745,11 @@ def _instance_processor(
             "cached_populators": cached_populators,
             "todo": todo,
             "primary_key_getter": primary_key_getter,
+            "load_path": (
+                compile_state.current_path + path
+                if compile_state.current_path.path
+                else path
+            ),
         }
         for prop in props:
             if prop in quick_populators:
@@ -788,18 +821,28 @@ def _instance_processor(
 
     cached_populators = getters["cached_populators"]
 
-    populators = {key: list(value) for key, value in cached_populators.items()}
-    for prop in getters["todo"]:
-        prop.create_row_processor(
-            context, query_entity, path, mapper, result, adapter, populators
-        )
+    if getters["todo"]:
+        populators = {
+            key: list(value) for key, value in cached_populators.items()
+        }
+        for prop in getters["todo"]:
+            prop.create_row_processor(
+                context,
+                query_entity,
+                path,
+                mapper,
+                result,
+                adapter,
+                populators,
+            )
+    else:
+        # only column-based populators, which don't vary per execution;
+        # these aren't modified by the loading process, so the cached
+        # collection may be used directly
+        populators = cached_populators
 
     propagated_loader_options = context.propagated_loader_options
-    load_path = (
-        context.compile_state.current_path + path
-        if context.compile_state.current_path.path
-        else path
-    )
+    load_path = getters["load_path"]
 
     session_identity_map = context.session.identity_map
 
@@ -1067,6 +1110,297 @@ def _instance_processor(
     return _instance
 
 
+class _ReadOnlyEntity:
+    """Base for the snapshot classes produced when the
+    ``readonly_entities`` execution option is used.
+
+    A subclass is generated per mapper and set of loaded attributes,
+    with one ``__slots__`` entry per column-based attribute and per
+    eagerly loaded relationship.  Instances are not instrumented, have no
+    :class:`.InstanceState` and can't be modified.
+
+    """
+
+    __slots__ = ()
+
+    _sa_class = None
+
+    def __setattr__(self, key, value):
+        raise AttributeError(
+            "%s is a read-only snapshot of a %s row"
+            % (self.__class__.__name__, self._sa_class.__name__)
+        )
+
+    def __delattr__(self, key):
+        self.__setattr__(key, None)
+
+    def __repr__(self):
+        return "%s(%s)" % (
+            self.__class__.__name__,
+            ", ".join(
+                "%s=%r" % (key, getattr(self, key)) for key in self.__slots__
+            ),
+        )
+
+    def _asdict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+@util.preload_module(
+    "sqlalchemy.orm.properties",
+    "sqlalchemy.orm.relationships",
+    "sqlalchemy.orm.strategies",
+)
+def _readonly_instance_processor(
+    query_entity,
+    mapper,
+    context,
+    result,
+    path,
+    adapter,
+    polymorphic_discriminator=None,
+    _polymorphic_from=None,
+    _dedupe=False,
+):
+    """Produce a row processor callable which creates
+    :class:`._ReadOnlyEntity` snapshots rather than mapped instances.
+
+    This is used for the ``readonly_entities`` execution option.
+    Column-based attributes are populated from the row, as are
+    relationships that are eagerly loaded using the joined or "selectin"
+    strategies; nothing is placed in the identity map and no
+    instance-level events are emitted.
+
+    """
+    compile_state = context.compile_state
+    properties = util.preloaded.orm_properties
+    relationships = util.preloaded.orm_relationships
+    strategies = util.preloaded.orm_strategies
+
+    getter_key = ("readonly_getters", mapper)
+    getters = path.get(compile_state.attributes, getter_key, None)
+
+    if getters is None:
+        quick_populators = path.get(
+            context.attributes, "memoized_setups", _none_set
+        )
+
+        keys = []
+        row_getters = []
+        eager_loaders = []
+        for prop in mapper._props.values():
+            if prop in quick_populators:
+                col = quick_populators[prop]
+                if (
+                    col is _DEFER_FOR_STATE
+                    or col is _SET_DEFERRED_EXPIRED
+                    or col is _RAISE_FOR_STATE
+                ):
+                    # deferred columns aren't present in the row and
+                    # can't be loaded later, so leave them out
+                    continue
+
+                getter = None
+                if adapter:
+                    adapted_col = adapter.columns[col]
+                    if adapted_col is not None:
+                        getter = result._getter(adapted_col, False)
+                if not getter:
+                    getter = result._getter(col, False)
+                if getter:
+                    keys.append(prop.key)
+                    row_getters.append(getter)
+            elif isinstance(prop, properties.ColumnProperty):
+                # a column that wasn't set up for the entity, such as
+                # that of a subclass mapper, is included if it's present
+                # in the row
+                for col in prop.columns:
+                    if adapter:
+                        col = adapter.columns[col]
+                    getter = result._getter(col, False)
+                    if getter:
+                        keys.append(prop.key)
+                        row_getters.append(getter)
+                        break
+            elif isinstance(prop, relationships.RelationshipProperty):
+                loadopt = prop._get_context_loader(context, path)
+                if loadopt and loadopt.strategy:
+                    strat = prop._get_strategy(loadopt.strategy)
+                else:
+                    strat = prop.strategy
+                if isinstance(
+                    strat, (strategies.JoinedLoader, strategies.SelectInLoader)
+                ):
+                    eager_loaders.append((prop.key, strat, loadopt))
+                elif isinstance(strat, strategies.PostLoader):
+                    raise sa_exc.InvalidRequestError(
+                        "Can't eagerly load %s when the readonly_entities "
+                        "execution option is used; only the joinedload() "
+                        "and selectinload() strategies are supported for "
+                        "read-only entities." % prop
+                    )
+
+        pk_cols = mapper.primary_key
+        if adapter:
+            pk_cols = [adapter.columns[c] for c in pk_cols]
+
+        getters = (
+            keys,
+            row_getters,
+            eager_loaders,
+            result._tuple_getter(pk_cols),
+        )
+        path.set(compile_state.attributes, getter_key, getters)
+
+    keys, row_getters, eager_loaders, primary_key_getter = getters
+
+    # joined eager loading of a collection repeats the parent row for
+    # each member, so snapshots are then tracked by primary key for the
+    # span of this result, as is the case for joined eager loaders
+    # nested inside of them
+    dedupe = _dedupe or any(
+        strat.uselist
+        for key, strat, loadopt in eager_loaders
+        if isinstance(strat, strategies.JoinedLoader)
+    )
+
+    joined_loaders = []
+    post_loaders = []
+    for key, strat, loadopt in eager_loaders:
+        if isinstance(strat, strategies.JoinedLoader):
+            _child_instance = strat.create_readonly_row_processor(
+                context, query_entity, path, loadopt, result, adapter, dedupe
+            )
+            if _child_instance is not None:
+                joined_loaders.append((key, strat.uselist, _child_instance))
+        else:
+            post_loader = strat.create_readonly_loader(
+                context, query_entity, path, loadopt, result
+            )
+            if post_loader is not None:
+                post_loaders.append((key, post_loader))
+
+    cls = mapper._readonly_entity_classes[
+        tuple(keys)
+        + tuple(key for key, uselist, _child in joined_loaders)
+        + tuple(key for key, post_loader in post_loaders)
+    ]
+    new = cls.__new__
+    populators = [
+        (cls.__dict__[key].__set__, getter)
+        for key, getter in zip(keys, row_getters)
+    ]
+
+    if mapper.allow_partial_pks:
+        is_not_primary_key = _none_set.issuperset
+    else:
+        is_not_primary_key = _none_set.intersection
+
+    if not joined_loaders and not post_loaders and not dedupe:
+
+        def _instance(row):
+            if is_not_primary_key(primary_key_getter(row)):
+                return None
+
+            obj = new(cls)
+            for set_, getter in populators:
+                set_(obj, getter(row))
+            return obj
+
+    else:
+        joined_populators = []
+        post_load_loaders = []
+        for key, uselist, _child_instance in joined_loaders:
+            descriptor = cls.__dict__[key]
+            joined_populators.append(
+                (
+                    descriptor.__set__,
+                    descriptor.__get__ if uselist else None,
+                    _child_instance,
+                )
+            )
+            if uselist:
+                # members are gathered into a dictionary so that they
+                # are unique, then frozen into a tuple once the rows
+                # have been processed
+                post_load_loaders.append(
+                    (_freeze_readonly_collection, descriptor.__set__, (key,))
+                )
+        for key, (loader, arg) in post_loaders:
+            post_load_loaders.append(
+                (loader, cls.__dict__[key].__set__, arg)
+            )
+
+        if post_load_loaders:
+            post_load = _ReadOnlyPostLoad(context, post_load_loaders)
+        else:
+            post_load = None
+        identities = {} if dedupe else None
+
+        def _instance(row):
+            identity = primary_key_getter(row)
+            if is_not_primary_key(identity):
+                return None
+
+            if identities is not None:
+                obj = identities.get(identity)
+                if obj is not None:
+                    # descend into the joined eager loads for additional
+                    # collection members
+                    for set_, get, _child_instance in joined_populators:
+                        child = _child_instance(row)
+                        if get is not None and child is not None:
+                            get(obj, cls)[child] = None
+                    return obj
+
+            obj = new(cls)
+            for set_, getter in populators:
+                set_(obj, getter(row))
+            for set_, get, _child_instance in joined_populators:
+                child = _child_instance(row)
+                if get is None:
+                    set_(obj, child)
+                else:
+                    set_(obj, {child: None} if child is not None else {})
+
+            if identities is not None:
+                identities[identity] = obj
+            if post_load is not None:
+                post_load.snapshots.append((identity, obj))
+            return obj
+
+    if mapper.polymorphic_map and not _polymorphic_from:
+
+        def ensure_no_pk(row):
+            identity = primary_key_getter(row)
+            if not is_not_primary_key(identity):
+                return identity
+            else:
+                return None
+
+        _instance = _decorate_polymorphic_switch(
+            _instance,
+            context,
+            query_entity,
+            mapper,
+            result,
+            path,
+            polymorphic_discriminator,
+            adapter,
+            ensure_no_pk,
+            instance_processor=util.partial(
+                _readonly_instance_processor, _dedupe=_dedupe
+            ),
+        )
+
+    return _instance
+
+
+def _freeze_readonly_collection(context, snapshots, set_, key):
+    for identity, obj in snapshots:
+        set_(obj, tuple(getattr(obj, key)))
+
+
 def _load_subclass_via_in(context, path, entity):
     mapper = entity.mapper
 
@@ -1222,6 +1556,7 @@ def _decorate_polymorphic_switch(
     polymorphic_discriminator,
     adapter,
     ensure_no_pk,
+    instance_processor=_instance_processor,
 ):
     if polymorphic_discriminator is not None:
         polymorphic_on = polymorphic_discriminator
@@ -1246,7 +1581,7 @@ def _decorate_polymorphic_switch(
             elif not sub_mapper.isa(mapper):
                 return False
 
-            return _instance_processor(
+            return instance_processor(
                 query_entity,
                 sub_mapper,
                 context,
@@ -1357,6 +1692,35 @@ class PostLoad:
         pl.loaders[token] = (token, limit_to_mapper, loader_callable, arg, kw)
 
 
+class _ReadOnlyPostLoad:
+    """Track loaders and snapshots for "post load" operations when the
+    ``readonly_entities`` execution option is used.
+
+    Each row processor that needs to complete its snapshots once a batch
+    of rows has been processed, such as to run "selectin" eager loaders,
+    has its own :class:`._ReadOnlyPostLoad`, which is invoked along with
+    the :class:`.PostLoad` objects of the query.
+
+    """
+
+    __slots__ = "loaders", "snapshots"
+
+    def __init__(self, context, loaders):
+        self.loaders = loaders
+        self.snapshots = []
+
+        # snapshots have no path-based state of their own, so this
+        # object is keyed to itself rather than to a path
+        context.post_load_paths[self] = self
+
+    def invoke(self, context, path):
+        if not self.snapshots:
+            return
+        snapshots, self.snapshots = self.snapshots, []
+        for loader, set_, arg in self.loaders:
+            loader(context, snapshots, set_, *arg)
+
+
 def load_scalar_attributes(mapper, state, attribute_names, passive):
     """initiate a column-based attribute refresh operation."""
 
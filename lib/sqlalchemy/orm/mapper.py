@@ -1639,6 +1639,24 @@ class Mapper(
     def _prop_set(self):
         return frozenset(self._props.values())
 
+    @HasMemoized.memoized_attribute
+    def _readonly_entity_classes(self):
+        """Snapshot classes used by the ``readonly_entities`` execution
+        option, keyed on the tuple of attribute names each one holds."""
+
+        return util.PopulateDict(self._create_readonly_entity_class)
+
+    def _create_readonly_entity_class(self, keys):
+        return type(
+            self.class_.__name__,
+            (loading._ReadOnlyEntity,),
+            {
+                "__slots__": keys,
+                "__module__": self.class_.__module__,
+                "_sa_class": self.class_,
+            },
+        )
+
     @util.preload_module("sqlalchemy.orm.descriptor_props")
     def _adapt_inherited_property(self, key, prop, init):
         descriptor_props = util.preloaded.orm_descriptor_props
@@ -895,7 +895,7 @@ def _emit_update_statements(
             rec[7],  # has all pks
         ),
     ):
-        rows = 0
+        results = []
         records = list(records)
 
         statement = cached_stmt
@@ -956,7 +956,7 @@ def _emit_update_statements(
                         True,
                         c.returned_defaults,
                     )
-                rows += c.rowcount
+                results.append(c)
                 check_rowcount = assert_singlerow
         else:
             if not allow_multirow:
@@ -989,7 +989,7 @@ def _emit_update_statements(
                             True,
                             c.returned_defaults,
                         )
-                    rows += c.rowcount
+                    results.append(c)
             else:
                 multiparams = [rec[2] for rec in records]
 
@@ -1001,7 +1001,7 @@ def _emit_update_statements(
                     statement, multiparams, execution_options=execution_options
                 )
 
-                rows += c.rowcount
+                results.append(c)
 
                 for (
                     state,
@@ -1030,12 +1030,9 @@ def _emit_update_statements(
                         )
 
         if check_rowcount:
-            if rows != len(records):
-                raise orm_exc.StaleDataError(
-                    "UPDATE statement on table '%s' expected to "
-                    "update %d row(s); %d were matched."
-                    % (table.description, len(records), rows)
-                )
+            _verify_update_rowcount(
+                uowtransaction, table, results, len(records)
+            )
 
         elif needs_version_id:
             util.warn(
@@ -1137,6 +1134,9 @@ def _emit_insert_statements(
                 not hasvalue
                 and connection.dialect.insert_executemany_returning
                 and len(records) > 1
+                # an INSERT with no parameters can only be batched if
+                # the dialect can render "VALUES (DEFAULT)"
+                and (pkeys or connection.dialect.supports_default_metavalue)
             ):
                 do_executemany = True
             else:
@@ -1326,7 +1326,7 @@ def _emit_post_update_statements(
         update,
         lambda rec: (rec[3], set(rec[4])),  # connection  # parameter keys
     ):
-        rows = 0
+        results = []
 
         records = list(records)
         connection = key[0]
@@ -1359,7 +1359,7 @@ def _emit_post_update_statements(
                     c,
                     c.context.compiled_parameters[0],
                 )
-                rows += c.rowcount
+                results.append(c)
         else:
             multiparams = [
                 params
@@ -1374,7 +1374,7 @@ def _emit_post_update_statements(
                 statement, multiparams, execution_options=execution_options
             )
 
-            rows += c.rowcount
+            results.append(c)
             for state, state_dict, mapper_rec, connection, params in records:
                 _postfetch_post_update(
                     mapper_rec,
@@ -1387,12 +1387,9 @@ def _emit_post_update_statements(
                 )
 
         if check_rowcount:
-            if rows != len(records):
-                raise orm_exc.StaleDataError(
-                    "UPDATE statement on table '%s' expected to "
-                    "update %d row(s); %d were matched."
-                    % (table.description, len(records), rows)
-                )
+            _verify_update_rowcount(
+                uowtransaction, table, results, len(records)
+            )
 
         elif needs_version_id:
             util.warn(
@@ -1437,7 +1434,7 @@ def _emit_delete_statements(
 
         execution_options = {"compiled_cache": base_mapper._compiled_cache}
         expected = len(del_objects)
-        rows_matched = -1
+        results = None
         only_warn = False
 
         if (
@@ -1445,7 +1442,7 @@ def _emit_delete_statements(
             and not connection.dialect.supports_sane_multi_rowcount
         ):
             if connection.dialect.supports_sane_rowcount:
-                rows_matched = 0
+                results = []
                 # execute deletes individually so that versioned
                 # rows can be verified
                 for params in del_objects:
@@ -1453,7 +1450,7 @@ def _emit_delete_statements(
                     c = connection.execute(
                         statement, params, execution_options=execution_options
                     )
-                    rows_matched += c.rowcount
+                    results.append(c)
             else:
                 util.warn(
                     "Dialect %s does not support deleted rowcount "
@@ -1471,35 +1468,77 @@ def _emit_delete_statements(
             if not need_version_id:
                 only_warn = True
 
-            rows_matched = c.rowcount
+            results = [c]
 
         if (
             base_mapper.confirm_deleted_rows
-            and rows_matched > -1
-            and expected != rows_matched
+            and results is not None
             and (
                 connection.dialect.supports_sane_multi_rowcount
                 or len(del_objects) == 1
             )
         ):
-            # TODO: why does this "only warn" if versioning is turned off,
-            # whereas the UPDATE raises?
-            if only_warn:
-                util.warn(
-                    "DELETE statement on table '%s' expected to "
-                    "delete %d row(s); %d were matched.  Please set "
-                    "confirm_deleted_rows=False within the mapper "
-                    "configuration to prevent this warning."
-                    % (table.description, expected, rows_matched)
-                )
-            else:
-                raise orm_exc.StaleDataError(
-                    "DELETE statement on table '%s' expected to "
-                    "delete %d row(s); %d were matched.  Please set "
-                    "confirm_deleted_rows=False within the mapper "
-                    "configuration to prevent this warning."
-                    % (table.description, expected, rows_matched)
-                )
+            _verify_delete_rowcount(
+                uowtransaction, table, results, expected, only_warn
+            )
+
+
+def _when_rowcount_available(uowtransaction, results, fn):
+    """Invoke the given function once the rowcounts of the given
+    results may be retrieved without delay.
+
+    If any of the statements were sent in pipeline mode, the function is
+    deferred until all flush actions have been executed, so that the
+    pipeline isn't synchronized after each statement.
+
+    """
+    if any(result.context._pipelined for result in results):
+        uowtransaction.pipelined_rowcount_checks.append(fn)
+    else:
+        fn()
+
+
+def _verify_update_rowcount(uowtransaction, table, results, expected):
+    def check():
+        rows = sum(result.rowcount for result in results)
+        if rows != expected:
+            raise orm_exc.StaleDataError(
+                "UPDATE statement on table '%s' expected to "
+                "update %d row(s); %d were matched."
+                % (table.description, expected, rows)
+            )
+
+    _when_rowcount_available(uowtransaction, results, check)
+
+
+def _verify_delete_rowcount(
+    uowtransaction, table, results, expected, only_warn
+):
+    def check():
+        rows_matched = sum(result.rowcount for result in results)
+        if rows_matched < 0 or rows_matched == expected:
+            return
+
+        # TODO: why does this "only warn" if versioning is turned off,
+        # whereas the UPDATE raises?
+        if only_warn:
+            util.warn(
+                "DELETE statement on table '%s' expected to "
+                "delete %d row(s); %d were matched.  Please set "
+                "confirm_deleted_rows=False within the mapper "
+                "configuration to prevent this warning."
+                % (table.description, expected, rows_matched)
+            )
+        else:
+            raise orm_exc.StaleDataError(
+                "DELETE statement on table '%s' expected to "
+                "delete %d row(s); %d were matched.  Please set "
+                "confirm_deleted_rows=False within the mapper "
+                "configuration to prevent this warning."
+                % (table.description, expected, rows_matched)
+            )
+
+    _when_rowcount_available(uowtransaction, results, check)
 
 
 def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
@@ -106,6 +106,7 @@ class ScopedSessionMixin:
         "rollback",
         "scalar",
         "scalars",
+        "scalars_in_batches",
     ],
     attributes=[
         "bind",
@@ -1615,6 +1615,191 @@ class Session(_SessionClassMethods):
             **kw,
         ).scalars()
 
+    def scalars_in_batches(
+        self,
+        statement,
+        batch_size=1000,
+        params=None,
+        execution_options=util.EMPTY_DICT,
+        bind_arguments=None,
+        keyset=None,
+    ):
+        """Execute a statement repeatedly using keyset pagination, yielding
+        its scalar results in lists of at most ``batch_size`` elements.
+
+        Rather than running the statement once and streaming its rows from
+        a single cursor, each batch is fetched by a distinct execution of
+        the statement, limited to ``batch_size`` rows and ordered by a set
+        of unique "keyset" columns, which default to the primary key of the
+        entity being selected.  Every batch after the first is constrained
+        to rows whose keyset values are greater than those of the last row
+        of the previous batch, a technique also known as the "seek method";
+        for a composite key, the comparison is rendered as a series of
+        ``OR`` / ``AND`` conjunctions so that it is supported on all
+        backends::
+
+            for batch in session.scalars_in_batches(
+                select(User).where(User.active == True), batch_size=500
+            ):
+                for user in batch:
+                    export(user)
+
+        Unlike an ``OFFSET`` based approach, the cost of fetching each batch
+        does not grow with its position in the overall result, and unlike
+        :meth:`_orm.Query.yield_per` or the ``stream_results`` execution
+        option, no cursor remains open between batches.  The statement
+        constrained by the keyset criteria is generated once, using bound
+        parameters for the keyset values, so that all batches after the
+        first make use of the same compiled cache entry.
+
+        If the :class:`_orm.Session` is not within a transaction when
+        iteration begins, the transaction begun by each batch is rolled
+        back once the batch has been consumed, i.e. before the next batch
+        is fetched, so that no single transaction spans the whole
+        operation.  As with any rollback, objects in the
+        :class:`_orm.Session` are expired, and changes made to them which
+        weren't committed are discarded; to persist changes made to each
+        batch, call :meth:`_orm.Session.commit` within the loop.
+        Otherwise, all batches take place within the transaction already
+        in progress, which is left open.
+
+        :param statement: a :func:`_sql.select` construct, which may not
+         include ORDER BY, LIMIT or OFFSET criteria of its own.  The first
+         column or entity selected is that which is delivered in each
+         batch.
+
+        :param batch_size: maximum number of elements in each batch.
+
+        :param params: optional dictionary of bound parameter values,
+         passed along to :meth:`_orm.Session.execute` for each batch.
+
+        :param execution_options: optional execution options, passed along
+         to :meth:`_orm.Session.execute` for each batch.
+
+        :param bind_arguments: optional bind arguments, passed along
+         to :meth:`_orm.Session.execute` for each batch.
+
+        :param keyset: optional sequence of column expressions which
+         uniquely identify each row of the statement.  Required when the
+         first element selected is not an ORM entity.
+
+        :return: an iterator of lists
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`orm_queryguide_keyset_batches`
+
+        """
+        if batch_size < 1:
+            raise sa_exc.ArgumentError("batch_size must be at least 1")
+
+        if (
+            statement._order_by_clauses
+            or statement._limit_clause is not None
+            or statement._offset_clause is not None
+        ):
+            raise sa_exc.ArgumentError(
+                "Statement passed to Session.scalars_in_batches() may not "
+                "include ORDER BY, LIMIT or OFFSET criteria"
+            )
+
+        if keyset is None:
+            if statement._propagate_attrs.get("compile_state_plugin") == "orm":
+                entity = statement.column_descriptions[0].get("entity")
+            else:
+                entity = None
+            insp = inspect(entity, raiseerr=False) if entity else None
+            if insp is None or not (insp.is_mapper or insp.is_aliased_class):
+                raise sa_exc.ArgumentError(
+                    "keyset columns must be passed to "
+                    "Session.scalars_in_batches() when the statement does "
+                    "not select an ORM entity"
+                )
+            keyset = [
+                getattr(entity, prop.key)
+                for prop in insp.mapper._identity_key_props
+            ]
+        else:
+            keyset = [
+                coercions.expect(roles.ColumnsClauseRole, col)
+                for col in keyset
+            ]
+            if not keyset:
+                raise sa_exc.ArgumentError("keyset may not be empty")
+
+        num_keys = len(keyset)
+        first_stmt = (
+            statement.add_columns(*keyset).order_by(*keyset).limit(batch_size)
+        )
+
+        keyset_binds = [
+            sql.bindparam("keyset_%d" % idx) for idx in range(num_keys)
+        ]
+        next_stmt = first_stmt.where(
+            sql.or_(
+                *[
+                    sql.and_(
+                        *[keyset[i] == keyset_binds[i] for i in range(idx)],
+                        keyset[idx] > keyset_binds[idx],
+                    )
+                    for idx in range(num_keys)
+                ]
+            )
+        )
+
+        return self._iterate_keyset_batches(
+            first_stmt,
+            next_stmt,
+            num_keys,
+            batch_size,
+            dict(params) if params else {},
+            execution_options,
+            bind_arguments,
+        )
+
+    def _iterate_keyset_batches(
+        self,
+        first_stmt,
+        next_stmt,
+        num_keys,
+        batch_size,
+        params,
+        execution_options,
+        bind_arguments,
+    ):
+        end_transactions = not self.in_transaction()
+        stmt = first_stmt
+
+        while True:
+            rows = self.execute(
+                stmt,
+                params,
+                execution_options=execution_options,
+                bind_arguments=bind_arguments,
+            ).all()
+
+            if rows:
+                params = dict(
+                    params,
+                    **{
+                        "keyset_%d" % idx: value
+                        for idx, value in enumerate(rows[-1][-num_keys:])
+                    },
+                )
+                yield [row[0] for row in rows]
+
+            if end_transactions and self.in_transaction():
+                # end the transaction begun for this batch; changes made
+                # while consuming it are not committed implicitly
+                self.rollback()
+
+            if len(rows) < batch_size:
+                break
+
+            stmt = next_stmt
+
     def close(self):
         """Close out the transactional resources and ORM objects used by this
         :class:`_orm.Session`.
@@ -2624,6 +2624,35 @@ class JoinedLoader(AbstractRelationshipLoader):
                 (self.key, load_scalar_from_joined_exec)
             )
 
+    def create_readonly_row_processor(
+        self, context, query_entity, path, loadopt, result, adapter, dedupe
+    ):
+        """Produce a row processor for the related snapshots of this
+        relationship, when the ``readonly_entities`` execution option is
+        used, or None if the eager join is not present in the result.
+
+        """
+        our_path = path[self.parent_property]
+
+        eager_adapter = self._create_eager_adapter(
+            context, result, adapter, our_path, loadopt
+        )
+        if eager_adapter is False:
+            return None
+
+        if self.uselist:
+            context.loaders_require_uniquing = True
+
+        return loading._readonly_instance_processor(
+            query_entity,
+            self.mapper,
+            context,
+            result,
+            our_path[self.entity],
+            eager_adapter,
+            _dedupe=dedupe,
+        )
+
 
 @log.class_logger
 @relationships.RelationshipProperty.strategy_for(lazy="selectin")
@@ -2795,6 +2824,11 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         else:
             effective_entity = self.entity
 
+        if loadopt and "chunksize" in loadopt.local_opts:
+            chunksize = loadopt.local_opts["chunksize"]
+        else:
+            chunksize = self._chunksize
+
         loading.PostLoad.callable_for_path(
             context,
             selectin_path,
@@ -2803,10 +2837,20 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             self._load_for_path,
             effective_entity,
             loadopt,
+            chunksize,
+            result.context.dialect.insertmanyvalues_max_parameters,
         )
 
     def _load_for_path(
-        self, context, path, states, load_only, effective_entity, loadopt
+        self,
+        context,
+        path,
+        states,
+        load_only,
+        effective_entity,
+        loadopt,
+        chunksize,
+        max_parameters,
     ):
         if load_only and self.key not in load_only:
             return
@@ -2855,6 +2899,33 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                 for state, overwrite in states
             ]
 
+        q = self._selectin_query(
+            context, path, query_info, effective_entity, loadopt
+        )
+
+        # each primary key value in the IN is its own bound parameter;
+        # insertmanyvalues_max_parameters is the dialect's limit on the
+        # number of bound parameters in a single statement
+        chunksize = max(
+            1, min(chunksize, max_parameters // len(query_info.pk_cols))
+        )
+
+        if query_info.load_only_child:
+            self._load_via_child(
+                our_states, none_states, query_info, q, context, chunksize
+            )
+        else:
+            self._load_via_parent(
+                our_states, query_info, q, context, chunksize
+            )
+
+    def _selectin_query(
+        self, context, path, query_info, effective_entity, loadopt
+    ):
+        """Produce the SELECT statement which loads related objects for
+        the parent keys in the "primary_keys" bound parameter.
+
+        """
         pk_cols = query_info.pk_cols
         in_expr = query_info.in_expr
 
@@ -3005,21 +3076,18 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     _setup_outermost_orderby, self.parent_property
                 )
 
-        if query_info.load_only_child:
-            self._load_via_child(
-                our_states, none_states, query_info, q, context
-            )
-        else:
-            self._load_via_parent(our_states, query_info, q, context)
+        return q
 
-    def _load_via_child(self, our_states, none_states, query_info, q, context):
+    def _load_via_child(
+        self, our_states, none_states, query_info, q, context, chunksize
+    ):
         uselist = self.uselist
 
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
         while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
+            chunk = our_keys[0:chunksize]
+            our_keys = our_keys[chunksize:]
             data = {
                 k: v
                 for k, v in context.session.execute(
@@ -3058,13 +3126,13 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             # collection will be populated
             state.get_impl(self.key).set_committed_value(state, dict_, None)
 
-    def _load_via_parent(self, our_states, query_info, q, context):
+    def _load_via_parent(self, our_states, query_info, q, context, chunksize):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
         while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
 
             primary_keys = [
                 key[0] if query_info.zero_idx else key
@@ -3104,6 +3172,112 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                         state, state_dict, collection
                     )
 
+    def create_readonly_loader(
+        self, context, query_entity, path, loadopt, result
+    ):
+        """Produce a "post load" callable and its arguments which
+        populate this relationship on snapshots, when the
+        ``readonly_entities`` execution option is used, or None if the
+        relationship isn't to be loaded.
+
+        """
+        if self._check_recursive_postload(context, path, self.join_depth):
+            return None
+
+        if len(path) == 1:
+            if not orm_util._entity_isa(query_entity.entity_zero, self.parent):
+                return None
+        elif not orm_util._entity_isa(path[-1], self.parent):
+            return None
+
+        selectin_path = (
+            context.compile_state.current_path or orm_util.PathRegistry.root
+        ) + path
+
+        with_poly_entity = path[self.parent_property].get(
+            context.attributes, "path_with_polymorphic", None
+        )
+        if with_poly_entity is not None:
+            effective_entity = inspect(with_poly_entity)
+        else:
+            effective_entity = self.entity
+
+        if loadopt and "chunksize" in loadopt.local_opts:
+            chunksize = loadopt.local_opts["chunksize"]
+        else:
+            chunksize = self._chunksize
+
+        return self._load_readonly_for_path, (
+            selectin_path,
+            effective_entity,
+            loadopt,
+            chunksize,
+            result.context.dialect.insertmanyvalues_max_parameters,
+        )
+
+    def _load_readonly_for_path(
+        self,
+        context,
+        snapshots,
+        set_,
+        path,
+        effective_entity,
+        loadopt,
+        chunksize,
+        max_parameters,
+    ):
+        query_info = self._query_info
+        if query_info.load_only_child:
+            # snapshots don't retain the foreign key values that the
+            # "omit join" many-to-one query would use, so locate related
+            # rows in terms of the parent primary key instead
+            query_info = self._fallback_query_info
+
+        q = self._selectin_query(
+            context, path, query_info, effective_entity, loadopt
+        )
+
+        chunksize = max(
+            1, min(chunksize, max_parameters // len(query_info.pk_cols))
+        )
+
+        uselist = self.uselist
+
+        while snapshots:
+            chunk = snapshots[0:chunksize]
+            snapshots = snapshots[chunksize:]
+
+            data = collections.defaultdict(list)
+            for k, v in itertools.groupby(
+                context.session.execute(
+                    q,
+                    params={
+                        "primary_keys": [
+                            key[0] if query_info.zero_idx else key
+                            for key, obj in chunk
+                        ]
+                    },
+                    execution_options={"readonly_entities": True},
+                ).unique(),
+                lambda x: x[0],
+            ):
+                data[k].extend(vv[1] for vv in v)
+
+            for key, obj in chunk:
+                collection = data.get(key, ())
+                if uselist:
+                    set_(obj, tuple(collection))
+                elif collection:
+                    if len(collection) > 1:
+                        util.warn(
+                            "Multiple rows returned with "
+                            "uselist=False for eagerly-loaded "
+                            "attribute '%s' " % self
+                        )
+                    set_(obj, collection[0])
+                else:
+                    set_(obj, None)
+
 
 def single_parent_validator(desc, prop):
     def _do_check(state, value, oldvalue, initiator):
@@ -287,7 +287,7 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         """
         return self._set_relationship_strategy(attr, {"lazy": "subquery"})
 
-    def selectinload(self, attr):
+    def selectinload(self, attr, chunksize=None):
         """Indicate that the given attribute should be loaded using
         SELECT IN eager loading.
 
@@ -310,6 +310,15 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
 
         .. versionadded:: 1.2
 
+        :param chunksize: maximum number of primary key values to include in
+         the IN clause of each SELECT emitted; when more objects than this
+         are loaded, the SELECT is emitted multiple times.  Defaults to 500.
+         The value is lowered if necessary so that the number of bound
+         parameters in each SELECT stays within the limit of the database
+         in use, taking into account composite primary keys.
+
+         .. versionadded:: 2.0
+
         .. seealso::
 
             :ref:`loading_toplevel`
@@ -317,7 +326,13 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
             :ref:`selectin_eager_loading`
 
         """
-        return self._set_relationship_strategy(attr, {"lazy": "selectin"})
+        return self._set_relationship_strategy(
+            attr,
+            {"lazy": "selectin"},
+            opts={"chunksize": chunksize}
+            if chunksize is not None
+            else util.EMPTY_DICT,
+        )
 
     def lazyload(self, attr):
         """Indicate that the given attribute should be loaded using "lazy"
@@ -2190,8 +2205,8 @@ def subqueryload(*keys) -> _AbstractLoad:
 
 
 @loader_unbound_fn
-def selectinload(*keys) -> _AbstractLoad:
-    return _generate_from_keys(Load.selectinload, keys, False, {})
+def selectinload(*keys, **kw) -> _AbstractLoad:
+    return _generate_from_keys(Load.selectinload, keys, False, kw)
 
 
 @loader_unbound_fn
@@ -20,6 +20,11 @@ from .. import event
 from .. import util
 from ..util import topological
 
+# memoized outcome of the dependency sort for graphs of flush actions,
+# keyed on the sort keys of the actions and of the dependencies among them;
+# see UOWTransaction._dependency_graph_key()
+_dependency_sort_memo = util.LRUCache(100)
+
 
 def track_cascade_events(descriptor, prop):
     """Establish event listeners on object attributes which handle
@@ -174,6 +179,10 @@ class UOWTransaction:
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # callables which verify the rowcounts of statements sent in
+        # pipeline mode, invoked once all flush actions have been executed
+        self.pipelined_rowcount_checks = []
+
     @property
     def has_work(self):
         return bool(self.states)
@@ -370,11 +379,39 @@ class UOWTransaction:
             if not ret:
                 break
 
-        # see if the graph of mapper dependencies has cycles.
-        self.cycles = cycles = topological.find_cycles(
-            self.dependencies, list(self.postsort_actions.values())
+        postsort_actions = list(self.postsort_actions.values())
+
+        # the graph of mapper dependencies tends to be the same from one
+        # flush to the next; if it's been seen before, use the cycles and
+        # sort order that were determined for it then.
+        self._graph_key = graph_key = self._dependency_graph_key(
+            postsort_actions
+        )
+        memo = (
+            _dependency_sort_memo.get(graph_key)
+            if graph_key is not None
+            else None
         )
 
+        if memo is not None:
+            cycle_keys, self._sort_order = memo
+            cycles = set(
+                rec for rec in postsort_actions if rec.sort_key in cycle_keys
+            )
+        else:
+            # see if the graph of mapper dependencies has cycles.
+            cycles = topological.find_cycles(
+                self.dependencies, postsort_actions
+            )
+            self._sort_order = None
+            if graph_key is not None and cycles:
+                _dependency_sort_memo[graph_key] = (
+                    frozenset(rec.sort_key for rec in cycles),
+                    None,
+                )
+
+        self.cycles = cycles
+
         if cycles:
             # if yes, break the per-mapper actions into
             # per-state actions
@@ -406,13 +443,53 @@ class UOWTransaction:
             [a for a in self.postsort_actions.values() if not a.disabled]
         ).difference(cycles)
 
+    def _dependency_graph_key(self, postsort_actions):
+        """Return a hashable key for the graph of flush actions and the
+        dependencies among them, in terms of the sort key of each action.
+
+        Two flushes with the same key have the same cycles and sort order
+        in terms of sort keys, so these are memoized.  None is returned if
+        the sort keys aren't unique among the actions.
+
+        """
+        sort_keys = frozenset(rec.sort_key for rec in postsort_actions)
+        if len(sort_keys) != len(postsort_actions):
+            return None
+
+        return (
+            sort_keys,
+            frozenset(
+                (
+                    parent.sort_key if parent is not None else None,
+                    child.sort_key if child is not None else None,
+                )
+                for parent, child in self.dependencies
+            ),
+        )
+
+    def _sorted_actions(self, postsort_actions):
+        """Return the given acyclic set of actions sorted by dependency."""
+
+        if self._sort_order is not None:
+            by_sort_key = {rec.sort_key: rec for rec in postsort_actions}
+            return [by_sort_key[sort_key] for sort_key in self._sort_order]
+
+        sorted_actions = list(
+            topological.sort(
+                self.dependencies,
+                sorted(postsort_actions, key=lambda item: item.sort_key),
+            )
+        )
+        if self._graph_key is not None:
+            _dependency_sort_memo[self._graph_key] = (
+                frozenset(),
+                tuple(rec.sort_key for rec in sorted_actions),
+            )
+        return sorted_actions
+
     def execute(self):
         postsort_actions = self._generate_actions()
 
-        postsort_actions = sorted(
-            postsort_actions,
-            key=lambda item: item.sort_key,
-        )
         # sort = topological.sort(self.dependencies, postsort_actions)
         # print "--------------"
         # print "\ndependencies:", self.dependencies
@@ -422,6 +499,10 @@ class UOWTransaction:
 
         # execute
         if self.cycles:
+            postsort_actions = sorted(
+                postsort_actions,
+                key=lambda item: item.sort_key,
+            )
             for subset in topological.sort_as_subsets(
                 self.dependencies, postsort_actions
             ):
@@ -430,9 +511,13 @@ class UOWTransaction:
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(self.dependencies, postsort_actions):
+            for rec in self._sorted_actions(postsort_actions):
                 rec.execute(self)
 
+        # retrieving the rowcounts synchronizes the pipeline
+        for check in self.pipelined_rowcount_checks:
+            check()
+
     def finalize_flush_changes(self):
         """Mark processed objects as clean / deleted after a successful
         flush().
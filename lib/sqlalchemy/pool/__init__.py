@@ -23,6 +23,8 @@ from .base import _ConnectionFairy
 from .base import _ConnectionRecord
 from .base import _finalize_fairy
 from .base import Pool
+from .base import PoolHistogram
+from .base import PoolMetrics
 from .base import PoolProxiedConnection
 from .base import reset_commit
 from .base import reset_none
@@ -38,6 +40,8 @@ from .impl import StaticPool
 
 __all__ = [
     "Pool",
+    "PoolHistogram",
+    "PoolMetrics",
     "PoolProxiedConnection",
     "reset_commit",
     "reset_none",
@@ -10,6 +10,7 @@
 
 """
 
+import bisect
 from collections import deque
 import time
 from typing import Any
@@ -66,6 +67,140 @@ class _AsyncConnDialect(_ConnDialect):
     is_async = True
 
 
+class PoolHistogram:
+    """A histogram of durations, in seconds, recorded by
+    :class:`.PoolMetrics`.
+
+    Observations are counted within fixed buckets, in the style of
+    cumulative histograms used by metrics systems such as Prometheus.
+
+    .. versionadded:: 2.0
+
+    """
+
+    __slots__ = ("bounds", "_counts", "count", "sum", "max")
+
+    default_bounds = (
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    )
+
+    def __init__(self, bounds=default_bounds):
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        """Record a single duration."""
+
+        self._counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def buckets(self):
+        """Return a list of ``(upper_bound, cumulative_count)`` tuples,
+        ending with an upper bound of ``float("inf")``."""
+
+        result = []
+        total = 0
+        for bound, count in zip(
+            self.bounds + (float("inf"),), list(self._counts)
+        ):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def __repr__(self):
+        return "PoolHistogram(count=%d, sum=%f, max=%f)" % (
+            self.count,
+            self.sum,
+            self.max,
+        )
+
+
+class PoolMetrics:
+    """Counters and histograms describing the use of a
+    :class:`_pool.Pool`, available from the :attr:`_pool.Pool.metrics`
+    attribute.
+
+    The values are updated on each checkout and checkin without locking, and
+    are intended to be read periodically by a metrics exporter.  A pool
+    that's replaced using :meth:`_pool.Pool.recreate`, such as by
+    :meth:`_engine.Engine.dispose`, starts with new metrics.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`pool_metrics`
+
+    """
+
+    __slots__ = (
+        "checkouts",
+        "connects",
+        "timeouts",
+        "overflow_high_water",
+        "wait_time",
+        "hold_time",
+    )
+
+    def __init__(self):
+        self.checkouts = 0
+        """Number of connections checked out."""
+
+        self.connects = 0
+        """Number of attempts made to establish a new DBAPI connection,
+        including reconnects."""
+
+        self.timeouts = 0
+        """Number of checkouts which failed as the pool timeout was
+        reached."""
+
+        self.overflow_high_water = 0
+        """The highest number of overflow connections, beyond
+        ``pool_size``, which have been open at once."""
+
+        self.wait_time = PoolHistogram()
+        """:class:`.PoolHistogram` of time spent waiting for a connection
+        to become available in the pool."""
+
+        self.hold_time = PoolHistogram()
+        """:class:`.PoolHistogram` of time between a connection's checkout
+        and its checkin."""
+
+    def __repr__(self):
+        return (
+            "PoolMetrics(checkouts=%d, connects=%d, timeouts=%d, "
+            "overflow_high_water=%d, wait_time=%r, hold_time=%r)"
+            % (
+                self.checkouts,
+                self.connects,
+                self.timeouts,
+                self.overflow_high_water,
+                self.wait_time,
+                self.hold_time,
+            )
+        )
+
+
 class Pool(log.Identified):
 
     """Abstract base class for connection pools."""
@@ -82,6 +217,7 @@ class Pool(log.Identified):
         events=None,
         dialect=None,
         pre_ping=False,
+        pre_ping_interval=None,
         _dispatch=None,
     ):
         """
@@ -175,6 +311,21 @@ class Pool(log.Identified):
 
          .. versionadded:: 1.2
 
+        :param pre_ping_interval: when used with
+         :paramref:`_pool.Pool.pre_ping`, number of seconds within which a
+         connection that was returned to the pool is considered to be
+         verified, so that the ping is skipped upon checkout.  If the
+         first statement of a transaction on such a connection then fails
+         due to a disconnect, the :class:`_engine.Connection` reconnects and
+         runs the statement again, unless the connection is in
+         autocommit mode.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -186,6 +337,8 @@ class Pool(log.Identified):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        self._pre_ping_interval = pre_ping_interval
+        self.metrics = PoolMetrics()
         self._reset_on_return = util.symbol.parse_user_argument(
             reset_on_return,
             {
@@ -207,6 +360,13 @@ class Pool(log.Identified):
             for fn, target in events:
                 event.listen(self, target, fn)
 
+    metrics = None
+    """A :class:`.PoolMetrics` object recording use of this pool.
+
+    .. versionadded:: 2.0
+
+    """
+
     @util.hybridproperty
     def _is_asyncio(self):
         return self._dialect.is_async
@@ -246,6 +406,15 @@ class Pool(log.Identified):
         else:
             return lambda crec: creator()
 
+    def _start_maintenance(self):
+        """Start background maintenance of pooled connections, if
+        this pool supports it.
+
+        Called by :func:`_sa.create_engine` once event listeners
+        have been established on the pool.
+
+        """
+
     def _close_connection(self, connection):
         self.logger.debug("Closing connection %r", connection)
 
@@ -376,9 +545,47 @@ class _ConnectionRecord:
         if connect:
             self.__connect()
         self.finalize_callback = deque()
+        self.last_checkin_time = time.time()
 
     fresh = False
 
+    checkout_count = 0
+    """Number of times this :class:`._ConnectionRecord` has been checked
+    out.
+
+    .. versionadded:: 2.0
+
+    """
+
+    error_count = 0
+    """Number of times this :class:`._ConnectionRecord` has been
+    invalidated due to an error, such as a disconnect or a failed
+    pre-ping.  The count is retained when a new DBAPI connection is
+    established for the record.
+
+    .. versionadded:: 2.0
+
+    """
+
+    last_checkout_latency = 0.0
+    """Seconds taken by the most recent checkout to produce a usable
+    DBAPI connection, including reconnection and pre-ping, but not time
+    spent waiting for the pool.
+
+    .. versionadded:: 2.0
+
+    """
+
+    _checkout_time = None
+
+    last_checkin_time = None
+    """Time at which this :class:`._ConnectionRecord` was last returned
+    to the pool, or when it was created.
+
+    .. versionadded:: 2.0
+
+    """
+
     fairy_ref = None
 
     starttime = None
@@ -480,11 +687,16 @@ class _ConnectionRecord:
     @classmethod
     def checkout(cls, pool):
         rec = pool._do_get()
+        start = time.perf_counter()
         try:
             dbapi_connection = rec.get_connection()
         except Exception as err:
             with util.safe_reraise():
                 rec._checkin_failed(err, _fairy_was_created=False)
+        rec._checkout_time = now = time.perf_counter()
+        rec.last_checkout_latency = now - start
+        rec.checkout_count += 1
+        pool.metrics.checkouts += 1
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(dbapi_connection, rec, echo)
 
@@ -518,8 +730,14 @@ class _ConnectionRecord:
             util.warn("Double checkin attempted on %s" % self)
             return
         self.fairy_ref = None
+        self.last_checkin_time = time.time()
         connection = self.dbapi_connection
         pool = self.__pool
+        if self._checkout_time is not None:
+            pool.metrics.hold_time.observe(
+                time.perf_counter() - self._checkout_time
+            )
+            self._checkout_time = None
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             finalizer(connection)
@@ -566,6 +784,8 @@ class _ConnectionRecord:
         # already invalidated
         if self.dbapi_connection is None:
             return
+        if e is not None:
+            self.error_count += 1
         if soft:
             self.__pool.dispatch.soft_invalidate(
                 self.dbapi_connection, self, e
@@ -642,6 +862,19 @@ class _ConnectionRecord:
             self.__connect()
         return self.dbapi_connection
 
+    def _replace_connection(self):
+        """Replace the DBAPI connection of an idle record ahead of
+        checkout, as performed by pool maintenance."""
+
+        if self.dbapi_connection is not None:
+            self.__pool.logger.info(
+                "Connection %r due for recycle; replacing",
+                self.dbapi_connection,
+            )
+            self.__close()
+        self.info.clear()
+        self.__connect()
+
     def _is_hard_or_soft_invalidated(self):
         return (
             self.dbapi_connection is None
@@ -664,6 +897,7 @@ class _ConnectionRecord:
         self.dbapi_connection = None
         try:
             self.starttime = time.time()
+            pool.metrics.connects += 1
             self.dbapi_connection = connection = pool._invoke_creator(self)
             pool.logger.debug("Created new connection %r", connection)
             self.fresh = True
@@ -1026,6 +1260,8 @@ class _ConnectionFairy(PoolProxiedConnection):
 
     """
 
+    _ping_skipped = False
+
     @property
     def driver_connection(self):
         """The connection object as returned by the driver after a connect.
@@ -1088,13 +1324,31 @@ class _ConnectionFairy(PoolProxiedConnection):
             fairy._connection_record.fresh = False
             try:
                 if pool._pre_ping:
-                    if not connection_is_fresh:
+                    if (
+                        not connection_is_fresh
+                        and pool._pre_ping_interval is not None
+                        and time.time()
+                        - fairy._connection_record.last_checkin_time
+                        < pool._pre_ping_interval
+                    ):
+                        fairy._ping_skipped = True
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s was used within "
+                                "pre_ping_interval, skipping pre-ping",
+                                fairy.dbapi_connection,
+                            )
+                    elif not connection_is_fresh:
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s",
                                 fairy.dbapi_connection,
                             )
+                        start = time.perf_counter()
                         result = pool._dialect.do_ping(fairy.dbapi_connection)
+                        fairy._connection_record.last_checkout_latency += (
+                            time.perf_counter() - start
+                        )
                         if not result:
                             if fairy._echo:
                                 pool.logger.debug(
@@ -10,7 +10,9 @@
 
 """
 
+import asyncio
 import threading
+import time
 import traceback
 import weakref
 
@@ -22,6 +24,7 @@ from .. import exc
 from .. import util
 from ..util import chop_traceback
 from ..util import queue as sqla_queue
+from ..util.concurrency import greenlet_spawn
 
 
 class QueuePool(Pool):
@@ -44,6 +47,10 @@ class QueuePool(Pool):
         max_overflow=10,
         timeout=30.0,
         use_lifo=False,
+        min_idle=0,
+        prewarm=False,
+        maintenance_interval=5.0,
+        idle_timeout=None,
         **kw,
     ):
         r"""
@@ -94,6 +101,60 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param min_idle: number of idle connections which a background
+          maintenance task will seek to keep present in the pool, so that
+          a burst of checkouts doesn't need to establish new connections
+          inline.  The maintenance task additionally replaces idle
+          connections which are invalidated, or which will pass the
+          :paramref:`_pool.Pool.recycle` time before its next run, so that
+          recycling doesn't take place within a checkout.  Connections are
+          only opened by the maintenance task up to ``pool_size``.  Defaults
+          to zero, meaning no maintenance task is run unless
+          :paramref:`.QueuePool.prewarm` is set.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_prewarm`
+
+        :param prewarm: if True, the maintenance task opens ``pool_size``
+          connections as soon as it starts, rather than the pool opening
+          them as they are first requested.   When the pool is used by an
+          :class:`_engine.Engine`, the maintenance task is started when the
+          engine is created, as well as for the new pool which replaces this
+          one when :meth:`_engine.Engine.dispose` is called; for a pool
+          constructed directly, it starts when the first connection is
+          requested.   For :class:`.AsyncAdaptedQueuePool`, the maintenance
+          task is an asyncio task which starts once an event loop is running.
+
+          .. versionadded:: 2.0
+
+        :param maintenance_interval: number of seconds between runs of the
+          maintenance task enabled by :paramref:`.QueuePool.min_idle`,
+          :paramref:`.QueuePool.prewarm` or
+          :paramref:`.QueuePool.idle_timeout`.  Defaults to 5.
+
+          .. versionadded:: 2.0
+
+        :param idle_timeout: if set, number of seconds after which a
+          connection that has remained in the pool without being checked out
+          is closed by the maintenance task, shrinking the pool back
+          towards :paramref:`.QueuePool.min_idle` idle connections after a
+          period of peak use.  The least healthy connections are closed
+          first, as determined by the number of errors such as disconnects
+          and failed pre-pings, then the time taken to produce the
+          connection at its last checkout, then age.  This setting is most
+          effective with :paramref:`.QueuePool.use_lifo`, which concentrates
+          checkouts on the most recently used connections so that surplus
+          connections become idle.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_idle_timeout`
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -106,6 +167,129 @@ class QueuePool(Pool):
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._min_idle = min_idle
+        self._prewarm = prewarm
+        self._maintenance_interval = maintenance_interval
+        self._idle_timeout = idle_timeout
+        self._maintenance = None
+        self._maintenance_pending = self._uses_maintenance
+
+    @property
+    def _uses_maintenance(self):
+        return bool(
+            self._min_idle or self._prewarm or self._idle_timeout is not None
+        )
+
+    def _start_maintenance(self):
+        with self._overflow_lock:
+            if not self._maintenance_pending:
+                return
+            self._maintenance_pending = False
+        self._maintenance = self._spawn_maintenance()
+
+    def _spawn_maintenance(self):
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=_maintenance_loop,
+            args=(weakref.ref(self), stop, self._maintenance_interval),
+            name="sqlalchemy pool maintenance",
+            daemon=True,
+        )
+        thread.start()
+        return stop
+
+    def _stop_maintenance(self):
+        stop, self._maintenance = self._maintenance, None
+        if stop is not None:
+            stop.set()
+
+    def _run_maintenance(self, initial=False):
+        """Retire and replace idle connections as needed, then open new
+        ones up to the ``min_idle`` setting, or to ``pool_size`` on the
+        initial run when ``prewarm`` is set.
+
+        """
+        try:
+            self._maintain_idle_connections()
+            self._fill_idle_connections(initial and self._prewarm)
+        except Exception:
+            self.logger.warning("Error during pool maintenance", exc_info=True)
+
+    def _maintain_idle_connections(self):
+        now = time.time()
+        if self._recycle > -1:
+            # connections started before this time will pass the recycle
+            # time before the next maintenance run
+            horizon = now - self._recycle + self._maintenance_interval
+        else:
+            horizon = None
+
+        # records are inspected in place, so that they remain available
+        # to checkouts; only a record that's being retired or replaced
+        # is taken out of the pool, one at a time
+        idle = self._pool.queued()
+
+        retire = []
+        if self._idle_timeout is not None:
+            surplus = len(idle) - self._min_idle
+            if surplus > 0:
+                expired_time = now - self._idle_timeout
+                expired = [
+                    rec for rec in idle if rec.last_checkin_time < expired_time
+                ]
+                expired.sort(key=_retirement_key, reverse=True)
+                retire = expired[:surplus]
+
+        for rec in retire:
+            if not self._pool.remove(rec):
+                # checked out in the meantime
+                continue
+            self.logger.info(
+                "Closing connection %r idle beyond idle_timeout",
+                rec.dbapi_connection,
+            )
+            try:
+                rec.close()
+            finally:
+                self._dec_overflow()
+
+        for rec in idle:
+            if rec in retire or not (
+                rec._is_hard_or_soft_invalidated()
+                or (horizon is not None and rec.starttime < horizon)
+            ):
+                continue
+            if not self._pool.remove(rec):
+                continue
+            try:
+                rec._replace_connection()
+            except Exception:
+                self.logger.warning(
+                    "Error replacing connection during pool maintenance",
+                    exc_info=True,
+                )
+            finally:
+                self._do_return_conn(rec)
+
+    def _fill_idle_connections(self, prewarm):
+        target = self._min_idle
+        maxsize = self._pool.maxsize
+        if maxsize > 0:
+            if prewarm:
+                target = maxsize
+            target = min(target, maxsize)
+
+        while self._pool.qsize() < target and (
+            maxsize <= 0 or self._overflow < 0
+        ):
+            if not self._inc_overflow():
+                break
+            try:
+                rec = self._create_connection()
+            except:
+                with util.safe_reraise():
+                    self._dec_overflow()
+            self._do_return_conn(rec)
 
     def _do_return_conn(self, conn):
         try:
@@ -117,8 +301,22 @@ class QueuePool(Pool):
                 self._dec_overflow()
 
     def _do_get(self):
+        if self._maintenance_pending:
+            self._start_maintenance()
+
+        # the time spent waiting on the queue is recorded once for each
+        # checkout, including when it's retried after another thread
+        # took the last overflow slot
+        waited = []
+        try:
+            return self._get_or_create(waited)
+        finally:
+            self.metrics.wait_time.observe(sum(waited))
+
+    def _get_or_create(self, waited):
         use_overflow = self._max_overflow > -1
 
+        start = time.perf_counter()
         try:
             wait = use_overflow and self._overflow >= self._max_overflow
             return self._pool.get(wait, self._timeout)
@@ -127,10 +325,13 @@ class QueuePool(Pool):
             # we timed out or can't connect and raise, Python 3 tells
             # people the real error is queue.Empty which it isn't.
             pass
+        finally:
+            waited.append(time.perf_counter() - start)
         if use_overflow and self._overflow >= self._max_overflow:
             if not wait:
-                return self._do_get()
+                return self._get_or_create(waited)
             else:
+                self.metrics.timeouts += 1
                 raise exc.TimeoutError(
                     "QueuePool limit of size %d overflow %d reached, "
                     "connection timed out, timeout %0.2f"
@@ -145,18 +346,20 @@ class QueuePool(Pool):
                 with util.safe_reraise():
                     self._dec_overflow()
         else:
-            return self._do_get()
+            return self._get_or_create(waited)
 
     def _inc_overflow(self):
         if self._max_overflow == -1:
             self._overflow += 1
-            return True
-        with self._overflow_lock:
-            if self._overflow < self._max_overflow:
-                self._overflow += 1
-                return True
-            else:
-                return False
+        else:
+            with self._overflow_lock:
+                if self._overflow < self._max_overflow:
+                    self._overflow += 1
+                else:
+                    return False
+        if self._overflow > self.metrics.overflow_high_water:
+            self.metrics.overflow_high_water = self._overflow
+        return True
 
     def _dec_overflow(self):
         if self._max_overflow == -1:
@@ -168,13 +371,18 @@ class QueuePool(Pool):
 
     def recreate(self):
         self.logger.info("Pool recreating")
-        return self.__class__(
+        pool = self.__class__(
             self._creator,
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             use_lifo=self._pool.use_lifo,
             timeout=self._timeout,
+            min_idle=self._min_idle,
+            prewarm=self._prewarm,
+            maintenance_interval=self._maintenance_interval,
+            idle_timeout=self._idle_timeout,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
@@ -182,8 +390,15 @@ class QueuePool(Pool):
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
+        pool._start_maintenance()
+        return pool
 
     def dispose(self):
+        self._stop_maintenance()
+        # if this pool continues to be used, maintenance resumes upon
+        # the next checkout
+        self._maintenance_pending = self._uses_maintenance
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -223,11 +438,64 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+def _retirement_key(rec):
+    # ascends from the most to the least healthy connection; compares
+    # errors first, then latency of the last checkout, then age
+    return (rec.error_count, rec.last_checkout_latency, -rec.starttime)
+
+
+def _maintenance_loop(pool_ref, stop, interval):
+    initial = True
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        pool._run_maintenance(initial)
+        del pool
+        initial = False
+        if stop.wait(interval):
+            return
+
+
+async def _async_maintenance_loop(pool_ref, interval):
+    initial = True
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        await greenlet_spawn(pool._run_maintenance, initial)
+        del pool
+        initial = False
+        await asyncio.sleep(interval)
+
+
 class AsyncAdaptedQueuePool(QueuePool):
     _is_asyncio = True
     _queue_class = sqla_queue.AsyncAdaptedQueue
     _dialect = _AsyncConnDialect()
 
+    def _spawn_maintenance(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop is running yet; try again on the next checkout
+            self._maintenance_pending = True
+            return None
+        return loop.create_task(
+            _async_maintenance_loop(
+                weakref.ref(self), self._maintenance_interval
+            )
+        )
+
+    def _stop_maintenance(self):
+        task, self._maintenance = self._maintenance, None
+        if task is not None:
+            try:
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # event loop is closed
+                pass
+
 
 class FallbackAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
     _queue_class = sqla_queue.FallbackAsyncAdaptedQueue
@@ -265,6 +533,7 @@ class NullPool(Pool):
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -321,6 +590,7 @@ class SingletonThreadPool(Pool):
             recycle=self._recycle,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             _dispatch=self.dispatch,
@@ -422,6 +692,7 @@ class StaticPool(Pool):
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             _dispatch=self.dispatch,
@@ -488,6 +759,7 @@ class AssertionPool(Pool):
             self._creator,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             logging_name=self._orig_logging_name,
@@ -273,6 +273,22 @@ ExpandedState = collections.namedtuple(
     ],
 )
 
+_InsertManyValues = collections.namedtuple(
+    "_InsertManyValues",
+    ["single_values_expr", "positional_range", "bind_names"],
+)
+
+
+def _no_positional_values(params):
+    return ()
+
+
+def _single_positional_getter(key):
+    def getter(params):
+        return (params[key],)
+
+    return getter
+
 
 NO_LINTING = util.symbol("NO_LINTING", "Disable all linting.", canonical=0)
 
@@ -405,6 +421,12 @@ class Compiled:
     cache_key = None
     _gen_time = None
 
+    _compile_time = None
+    """time in seconds taken to compile the statement"""
+
+    _cache_hits = 0
+    """number of times this object was retrieved from a compiled cache"""
+
     def __init__(
         self,
         dialect,
@@ -434,6 +456,7 @@ class Compiled:
 
         """
 
+        start = perf_counter()
         self.dialect = dialect
         self.preparer = self.dialect.identifier_preparer
         if schema_translate_map:
@@ -455,6 +478,7 @@ class Compiled:
                     self.string, schema_translate_map
                 )
         self._gen_time = perf_counter()
+        self._compile_time = self._gen_time - start
 
     def _execute_on_connection(
         self, connection, distilled_params, execution_options
@@ -634,6 +658,26 @@ class SQLCompiler(Compiled):
 
     """
 
+    insert_single_values_columns = None
+    """The :class:`_schema.Column` objects for which values are rendered
+    within :attr:`.insert_single_values_expr`, in the same order.
+
+    .. versionadded:: 2.0
+
+    """
+
+    _insertmanyvalues = None
+    """bookkeeping for an INSERT that may be invoked using the
+    "insertmanyvalues" execution style, where the VALUES clause is
+    rewritten to accommodate many parameter sets at once.
+
+    Stores an :class:`._InsertManyValues` tuple including the rendered
+    VALUES expression, the range within ``positiontup`` consumed by it for
+    positional paramstyles, and the bound parameter names rendered within
+    it for named paramstyles.
+
+    """
+
     literal_execute_params = frozenset()
     """bindparameter objects that are rendered as literal values at statement
     execution time.
@@ -911,6 +955,50 @@ class SQLCompiler(Compiled):
             if value is not None
         )
 
+    @util.memoized_property
+    def _bind_processing_plan(self):
+        return self._get_bind_processing_plan(
+            self.positiontup, self._bind_processors
+        )
+
+    def _get_bind_processing_plan(self, positiontup, processors):
+        """Return a plan for converting the dictionaries returned by
+        :meth:`.construct_params` into the parameters passed to the DBAPI.
+
+        For a positional paramstyle, the plan is a callable returning a tuple
+        of the values for the given ``positiontup``, along with a tuple of
+        ``(index, processor)`` for each position that has a bind processor.
+        Otherwise, the plan is ``None`` along with a tuple of ``(key,
+        processor)`` for each processor.
+
+        """
+        if self.positional:
+            if not positiontup:
+                getter = _no_positional_values
+            elif len(positiontup) == 1:
+                getter = _single_positional_getter(positiontup[0])
+            else:
+                getter = operator.itemgetter(*positiontup)
+
+            return getter, tuple(
+                (index, processors[key])
+                for index, key in enumerate(positiontup)
+                if key in processors
+            )
+        else:
+            return None, tuple(processors.items())
+
+    @util.memoized_property
+    def _construct_params_plan(self):
+        """Tuple of ``(bindparam, name, escaped_name)`` for each bound
+        parameter, as used by :meth:`.construct_params`."""
+
+        escaped_bind_names = self.escaped_bind_names
+        return tuple(
+            (bindparam, name, escaped_bind_names.get(name, name))
+            for bindparam, name in self.bind_names.items()
+        )
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -927,8 +1015,6 @@ class SQLCompiler(Compiled):
     ):
         """return a dictionary of bind parameter keys and values"""
 
-        has_escaped_names = bool(self.escaped_bind_names)
-
         if extracted_parameters:
             # related the bound parameters collected in the original cache key
             # to those collected in the incoming cache key.  They will not have
@@ -955,13 +1041,7 @@ class SQLCompiler(Compiled):
 
         if params:
             pd = {}
-            for bindparam, name in self.bind_names.items():
-                escaped_name = (
-                    self.escaped_bind_names.get(name, name)
-                    if has_escaped_names
-                    else name
-                )
-
+            for bindparam, name, escaped_name in self._construct_params_plan:
                 if bindparam.key in params:
                     pd[escaped_name] = params[bindparam.key]
                 elif name in params:
@@ -996,13 +1076,7 @@ class SQLCompiler(Compiled):
             return pd
         else:
             pd = {}
-            for bindparam, name in self.bind_names.items():
-                escaped_name = (
-                    self.escaped_bind_names.get(name, name)
-                    if has_escaped_names
-                    else name
-                )
-
+            for bindparam, name, escaped_name in self._construct_params_plan:
                 if _check and bindparam.required:
                     if _group_number:
                         raise exc.InvalidRequestError(
@@ -1232,6 +1306,8 @@ class SQLCompiler(Compiled):
             self.string = expanded_state.statement
             self._bind_processors.update(expanded_state.processors)
             self.positiontup = expanded_state.positiontup
+            util.memoized_property.reset(self, "_bind_processing_plan")
+            util.memoized_property.reset(self, "_construct_params_plan")
             self.post_compile_params = frozenset()
             for key in expanded_state.parameter_expansion:
                 bind = self.binds.pop(key)
@@ -3833,6 +3909,139 @@ class SQLCompiler(Compiled):
             )
         return dialect_hints, table_text
 
+    @util.memoized_property
+    def _insertmanyvalues_template(self):
+        """Return the VALUES expression of an "insertmanyvalues" INSERT
+        with each bound parameter name rendered with an
+        ``__EXECMANY_INDEX__`` token following a double underscore, where
+        the token is to be replaced with the index of each parameter set
+        within a batch.
+
+        Applies to named paramstyles only.
+
+        """
+        imv = self._insertmanyvalues
+        single_values_expr = "(%s)" % imv.single_values_expr
+        if not imv.bind_names:
+            return single_values_expr
+
+        # the bind template is rendered around a sentinel so that the
+        # names can be matched by regular expression regardless of
+        # paramstyle, e.g. ":name" or "%(name)s"
+        prefix, suffix = (
+            re.escape(token)
+            for token in (self.bindtemplate % {"name": "\x00"}).split(
+                "\x00"
+            )
+        )
+        bind_re = re.compile(
+            r"%s(%s)%s(?!\w)"
+            % (
+                prefix,
+                "|".join(
+                    re.escape(name)
+                    for name in sorted(imv.bind_names, key=len, reverse=True)
+                ),
+                suffix,
+            )
+        )
+        return bind_re.sub(
+            lambda m: self.bindtemplate
+            % {"name": "%s____EXECMANY_INDEX__" % m.group(1)},
+            single_values_expr,
+        )
+
+    def _deliver_insertmanyvalues_batches(
+        self, statement, parameters, batch_size
+    ):
+        """Given a statement string and a list of DBAPI-ready parameter sets
+        for an "insertmanyvalues" INSERT, yield tuples of
+        ``(statement, parameters, batchnum, total_batches)``, where each
+        statement renders a multiple-row VALUES clause against a page of at
+        most ``batch_size`` parameter sets.
+
+        If the statement can't be rewritten, such as for an INSERT that
+        renders DEFAULT VALUES or one that was altered after compilation
+        such that the single-row VALUES clause is no longer present, the
+        statement is yielded unchanged for each parameter set, so that
+        RETURNING rows may still be delivered for every row.
+
+        """
+        imv = self._insertmanyvalues
+        dialect = self.dialect
+
+        if imv is not None:
+            single_values_expr = "(%s)" % imv.single_values_expr
+            anchor = " VALUES %s" % single_values_expr
+
+        if imv is None or anchor not in statement:
+            total_batches = len(parameters)
+            for batchnum, param in enumerate(parameters, 1):
+                yield statement, param, batchnum, total_batches
+            return
+
+        before, after = statement.split(anchor, 1)
+
+        if self.positional:
+            positional_start, positional_end = imv.positional_range
+            num_params_per_row = positional_end - positional_start
+        else:
+            bind_names = imv.bind_names
+            num_params_per_row = len(bind_names)
+            template = self._insertmanyvalues_template
+
+        if num_params_per_row:
+            batch_size = max(
+                1,
+                min(
+                    batch_size,
+                    dialect.insertmanyvalues_max_parameters
+                    // num_params_per_row,
+                ),
+            )
+
+        total_batches = -(-len(parameters) // batch_size)
+
+        for batchnum, start in enumerate(
+            range(0, len(parameters), batch_size), 1
+        ):
+            batch = parameters[start : start + batch_size]
+            first = batch[0]
+
+            if self.positional:
+                values_clause = ", ".join(
+                    [single_values_expr] * len(batch)
+                )
+                new_params = list(first[0:positional_start])
+                for param in batch:
+                    new_params.extend(
+                        param[positional_start:positional_end]
+                    )
+                new_params.extend(first[positional_end:])
+                new_params = dialect.execute_sequence_format(new_params)
+            else:
+                values_clause = ", ".join(
+                    template.replace("__EXECMANY_INDEX__", str(idx))
+                    for idx in range(len(batch))
+                )
+                new_params = {
+                    key: value
+                    for key, value in first.items()
+                    if key not in bind_names
+                }
+                for idx, param in enumerate(batch):
+                    new_params.update(
+                        ("%s__%d" % (key, idx), param[key])
+                        for key in bind_names
+                    )
+
+            yield (
+                "%s VALUES %s%s" % (before, values_clause, after),
+                new_params,
+                batchnum,
+                total_batches,
+            )
+
     def visit_insert(self, insert_stmt, **kw):
 
         compile_state = insert_stmt._compile_state_factory(
@@ -3855,10 +4064,34 @@ class SQLCompiler(Compiled):
             }
         )
 
+        use_insertmanyvalues = (
+            toplevel
+            and self.for_executemany
+            and self.dialect.use_insertmanyvalues
+            and not self._numeric_binds
+            and not compile_state._has_multi_parameters
+        )
+        if use_insertmanyvalues:
+            binds_start = len(self.binds)
+            if self.positional:
+                positional_start = len(self.positiontup)
+
         crud_params = crud._get_crud_params(
             self, insert_stmt, compile_state, **kw
         )
 
+        if use_insertmanyvalues:
+            if self.positional:
+                positional_range = (positional_start, len(self.positiontup))
+                insertmanyvalues_bind_names = ()
+            else:
+                positional_range = None
+                escaped = self.escaped_bind_names
+                insertmanyvalues_bind_names = tuple(
+                    escaped.get(name, name)
+                    for name in list(self.binds)[binds_start:]
+                )
+
         if (
             not crud_params
             and not self.dialect.supports_default_values
@@ -3960,6 +4193,9 @@ class SQLCompiler(Compiled):
                 # We can't apply that optimization safely if for example the
                 # statement includes a clause like "ON CONFLICT DO UPDATE"
                 self.insert_single_values_expr = insert_single_values_expr
+                self.insert_single_values_columns = tuple(
+                    c for c, expr, value in crud_params
+                )
 
         if insert_stmt._post_values_clause is not None:
             post_values_clause = self.process(
@@ -3980,6 +4216,26 @@ class SQLCompiler(Compiled):
                 + text
             )
 
+        if (
+            use_insertmanyvalues
+            and self.insert_single_values_expr is not None
+            and not self.ctes
+            and (
+                # for positional styles, the parameters rendered within
+                # VALUES must be contiguous and line up with the rendered
+                # string, which is not the case if a clause rendered after
+                # VALUES, i.e. an OUTPUT clause, is placed before it
+                not self.positional
+                or not self.returning_precedes_values
+                or positional_range[1] == len(self.positiontup)
+            )
+        ):
+            self._insertmanyvalues = _InsertManyValues(
+                self.insert_single_values_expr,
+                positional_range,
+                insertmanyvalues_bind_names,
+            )
+
         self.stack.pop(-1)
 
         return text
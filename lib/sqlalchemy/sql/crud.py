@@ -1025,7 +1025,16 @@ def _get_returning_modifiers(compiler, stmt, compile_state):
 
     implicit_returning = (
         need_pks
-        and compiler.dialect.implicit_returning
+        and (
+            compiler.dialect.implicit_returning
+            # a dialect that prefers cursor.lastrowid for single-row
+            # INSERT may still deliver RETURNING for executemany, using
+            # the "insertmanyvalues" execution style
+            or (
+                compiler.for_executemany
+                and compiler.dialect.insert_executemany_returning
+            )
+        )
         and stmt.table.implicit_returning
     )
 
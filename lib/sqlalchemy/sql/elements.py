@@ -508,6 +508,7 @@ class ClauseElement(
                 compiled_cache[key] = compiled_sql
             else:
                 cache_hit = dialect.CACHE_HIT
+                compiled_sql._cache_hits += 1
         else:
             extracted_params = None
             compiled_sql = self._compiler(
@@ -33,6 +33,7 @@ from ._collections import OrderedSet
 from ._collections import PopulateDict
 from ._collections import Properties
 from ._collections import ScopedRegistry
+from ._collections import ShardedLRUCache
 from ._collections import sort_dictionary
 from ._collections import ThreadLocalRegistry
 from ._collections import to_column_set
@@ -54,6 +55,7 @@ from .compat import cpython
 from .compat import dataclass_fields
 from .compat import decode_backslashreplace
 from .compat import dottedgetter
+from .compat import freethreading
 from .compat import has_refcount_gc
 from .compat import inspect_getfullargspec
 from .compat import local_dataclass_fields
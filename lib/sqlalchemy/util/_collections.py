@@ -438,6 +438,7 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
         "capacity",
         "threshold",
         "size_alert",
+        "evictions",
         "_data",
         "_counter",
         "_mutex",
@@ -446,11 +447,13 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
     capacity: int
     threshold: float
     size_alert: Callable[["LRUCache[_KT, _VT]"], None]
+    evictions: int
 
     def __init__(self, capacity=100, threshold=0.5, size_alert=None):
         self.capacity = capacity
         self.threshold = threshold
         self.size_alert = size_alert
+        self.evictions = 0
         self._counter = 0
         self._mutex = threading.Lock()
         self._data: Dict[_KT, Tuple[_KT, _VT, List[int]]] = {}
@@ -489,7 +492,12 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
         return len(self._data)
 
     def values(self) -> ValuesView[_VT]:
-        return typing.ValuesView({k: i[1] for k, i in self._data.items()})
+        return typing.ValuesView(self.snapshot())
+
+    def snapshot(self) -> Dict[_KT, _VT]:
+        """Return a dictionary of the keys and values in the cache, without
+        updating their usage."""
+        return {k: i[1] for k, i in self._data.items()}
 
     def __setitem__(self, key: _KT, value: _VT) -> None:
         self._data[key] = (key, value, [self._inc_counter()])
@@ -522,10 +530,123 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
                     except KeyError:
                         # deleted elsewhere; skip
                         continue
+                    self.evictions += 1
         finally:
             self._mutex.release()
 
 
+class ShardedLRUCache(typing.MutableMapping[_KT, _VT]):
+    """An :class:`.LRUCache` that's segmented into a number of independent
+    sub-caches, each with its own mutex and usage counter.
+
+    Each key is stored in the sub-cache selected by its hash, so that
+    concurrent threads that read from and write to the cache contend only
+    for the sub-cache holding their key, rather than all threads contending
+    for a single mutex and counter.
+
+    The overall capacity is divided evenly among the sub-caches, each of
+    which is pruned independently.  The ``size_alert`` callable, if any,
+    receives this object when any sub-cache is pruned.
+
+    When ``shards`` is not given, the number of sub-caches is chosen based
+    on the capacity, so that small caches remain a single
+    :class:`.LRUCache`.
+
+    """
+
+    __slots__ = (
+        "capacity",
+        "threshold",
+        "size_alert",
+        "_shards",
+        "_num_shards",
+    )
+
+    capacity: int
+    threshold: float
+    size_alert: Callable[["ShardedLRUCache[_KT, _VT]"], None]
+
+    max_shards = 16
+    min_shard_capacity = 64
+
+    def __init__(
+        self, capacity=100, threshold=0.5, size_alert=None, shards=None
+    ):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.size_alert = size_alert
+
+        if shards is None:
+            shards = max(
+                1, min(self.max_shards, capacity // self.min_shard_capacity)
+            )
+
+        shard_capacity = -(-capacity // shards)
+        self._num_shards = shards
+        self._shards: List[LRUCache[_KT, _VT]] = [
+            LRUCache(
+                shard_capacity,
+                threshold=threshold,
+                size_alert=self._shard_size_alert,
+            )
+            for _ in range(shards)
+        ]
+
+    def _shard_size_alert(self, shard: LRUCache[_KT, _VT]) -> None:
+        if self.size_alert:
+            self.size_alert(self)
+
+    @overload
+    def get(self, key: _KT) -> Optional[_VT]:
+        ...
+
+    @overload
+    def get(self, key: _KT, default: Union[_VT, _T]) -> Union[_VT, _T]:
+        ...
+
+    def get(
+        self, key: _KT, default: Optional[Union[_VT, _T]] = None
+    ) -> Optional[Union[_VT, _T]]:
+        return self._shards[hash(key) % self._num_shards].get(key, default)
+
+    def __getitem__(self, key: _KT) -> _VT:
+        return self._shards[hash(key) % self._num_shards][key]
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        self._shards[hash(key) % self._num_shards][key] = value
+
+    def __delitem__(self, key: _KT) -> None:
+        del self._shards[hash(key) % self._num_shards][key]
+
+    def __iter__(self) -> Iterator[_KT]:
+        for shard in self._shards:
+            yield from list(shard)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def values(self) -> ValuesView[_VT]:
+        return typing.ValuesView(
+            {
+                k: value
+                for shard in self._shards
+                for k, value in shard.snapshot().items()
+            }
+        )
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    @property
+    def evictions(self) -> int:
+        return sum(shard.evictions for shard in self._shards)
+
+    @property
+    def size_threshold(self) -> float:
+        return self.capacity + self.capacity * self.threshold
+
+
 class ScopedRegistry:
     """A Registry that can store one or multiple instances of a single
     class on the basis of a "scope" function.
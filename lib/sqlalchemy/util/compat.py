@@ -38,6 +38,9 @@ arm = "aarch" in platform.machine().lower()
 
 has_refcount_gc = bool(cpython)
 
+# CPython 3.13+ free-threaded build, running with the GIL disabled
+freethreading = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
 dottedgetter = operator.attrgetter
 next = next  # noqa
 
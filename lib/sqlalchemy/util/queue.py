@@ -167,6 +167,29 @@ class Queue:
 
         return self.get(False)
 
+    def queued(self):
+        """Return a list of the items in the queue, without removing
+        them."""
+
+        with self.mutex:
+            return list(self.queue)
+
+    def remove(self, item):
+        """Remove the given item from the queue without blocking.
+
+        Return True if the item was removed, or False if it isn't
+        present in the queue, e.g. because it was retrieved by a call to
+        ``get()`` in the meantime.
+        """
+
+        with self.not_full:
+            try:
+                self.queue.remove(item)
+            except ValueError:
+                return False
+            self.not_full.notify()
+            return True
+
     # Override these methods to implement other queue organizations
     # (e.g. stack or priority queue).
     # These will only be called with appropriate locks held
@@ -207,6 +230,7 @@ class AsyncAdaptedQueue:
     def __init__(self, maxsize=0, use_lifo=False):
         self.use_lifo = use_lifo
         self.maxsize = maxsize
+        self.mutex = threading.Lock()
 
     def empty(self):
         return self._queue.empty()
@@ -258,6 +282,43 @@ class AsyncAdaptedQueue:
         except asyncio.QueueEmpty as err:
             raise Empty() from err
 
+    def _drain(self):
+        # remove all items from the queue, returning them in the order
+        # in which they were put
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if self.use_lifo:
+            items.reverse()
+        return items
+
+    def _restore(self, items):
+        for item in items:
+            self._queue.put_nowait(item)
+
+    def queued(self):
+        # asyncio.Queue has no public means of inspecting its items, so
+        # they're taken out and put back; this doesn't yield to the event
+        # loop, so other tasks don't see the queue in the meantime
+        with self.mutex:
+            items = self._drain()
+            self._restore(items)
+            return items
+
+    def remove(self, item):
+        with self.mutex:
+            items = self._drain()
+            try:
+                items.remove(item)
+            except ValueError:
+                return False
+            finally:
+                self._restore(items)
+            return True
+
     def get(self, block=True, timeout=None):
         if not block:
             return self.get_nowait()
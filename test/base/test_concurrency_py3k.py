@@ -1,11 +1,13 @@
 import threading
 
 from sqlalchemy import exc
+from sqlalchemy import testing
 from sqlalchemy.testing import async_test
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.util import asyncio
 from sqlalchemy.util import await_fallback
@@ -234,3 +236,43 @@ class TestAsyncAdaptedQueue(fixtures.TestBase):
         t.join()
 
         is_true(run[0])
+
+    @testing.combinations(False, True, argnames="use_lifo")
+    @async_test
+    async def test_queued_remove(self, use_lifo):
+        q = queue.AsyncAdaptedQueue(maxsize=3, use_lifo=use_lifo)
+
+        def go():
+            for item in (1, 2, 3):
+                q.put_nowait(item)
+            eq_(q.queued(), [1, 2, 3])
+
+            is_true(q.remove(2))
+            is_false(q.remove(2))
+            eq_(q.queued(), [1, 3])
+
+            if use_lifo:
+                eq_([q.get_nowait(), q.get_nowait()], [3, 1])
+            else:
+                eq_([q.get_nowait(), q.get_nowait()], [1, 3])
+            eq_(q.queued(), [])
+
+        await greenlet_spawn(go)
+
+    @async_test
+    async def test_remove_unblocks_put(self):
+        q = queue.AsyncAdaptedQueue(maxsize=1)
+
+        def prime():
+            q.put_nowait(1)
+
+        def put():
+            q.put(2, timeout=5)
+
+        await greenlet_spawn(prime)
+        putter = asyncio.create_task(greenlet_spawn(put))
+        await asyncio.sleep(0)
+
+        is_true(q.remove(1))
+        await asyncio.wait_for(putter, 5)
+        eq_(q.queued(), [2])
@@ -6,6 +6,7 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing.util import picklers
@@ -227,6 +228,43 @@ class ResultTupleTest(fixtures.TestBase):
             is_true(isinstance(row3, _CyRow))
 
 
+class _FusedProcessorTest(fixtures.TestBase):
+    def test_no_processors(self):
+        is_(self.module.fused_processor(None), None)
+        is_(self.module.fused_processor([]), None)
+        is_(self.module.fused_processor([None, None]), None)
+
+    @testing.combinations(
+        ([str], (5,), ("5",)),
+        ([None, str, None], (1, 2, 3), (1, "2", 3)),
+        ([str, None, lambda v: v * 10], (1, 2, 3), ("1", 2, 30)),
+        ([None, None, str], [1, 2, None], (1, 2, "None")),
+        argnames="processors, row, expected",
+    )
+    def test_process(self, processors, row, expected):
+        proc = self.module.fused_processor(processors)
+        eq_(proc(row), expected)
+        is_true(isinstance(proc(row), tuple))
+
+
+class PyFusedProcessorTest(_FusedProcessorTest):
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.engine import _py_row
+
+        cls.module = _py_row
+
+
+class CyFusedProcessorTest(_FusedProcessorTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.cyextension import resultproxy
+
+        cls.module = resultproxy
+
+
 class ResultTest(fixtures.TestBase):
     def _fixture(
         self,
@@ -1012,6 +1050,39 @@ class MergeResultTest(fixtures.TestBase):
 
         eq_(result.scalars(0).all(), [7, 8, 9, 10, 11, 12])
 
+    def test_merge_key(self, merge_fixture):
+        r1, r2, r3, r4 = merge_fixture
+
+        result = r3.merge(r1, r4, r2, key=lambda row: row.user_id)
+        eq_(
+            result.fetchall(),
+            [
+                (7, "u1"),
+                (8, "u2"),
+                (9, "u3"),
+                (10, "u4"),
+                (11, "u5"),
+                (12, "u6"),
+            ],
+        )
+
+    def test_merge_key_interleaved(self, dupe_fixture):
+        r1, r2 = dupe_fixture
+
+        result = r2.merge(r1, key=lambda row: row.z)
+
+        eq_(result.all(), [(1, 2, 1), (2, 2, 1), (3, 1, 2), (3, 3, 3)])
+
+    def test_merge_key_scalars(self, merge_fixture):
+        r1, r2, r3, r4 = merge_fixture
+
+        for r in (r1, r2, r3, r4):
+            r.scalars(0)
+
+        result = r4.merge(r3, r2, r1, key=lambda row: row.user_id)
+
+        eq_(result.scalars(0).all(), [7, 8, 9, 10, 11, 12])
+
     def test_merge_unique(self, dupe_fixture):
         r1, r2 = dupe_fixture
 
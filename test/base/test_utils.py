@@ -4,6 +4,7 @@ import copy
 import inspect
 import pickle
 import sys
+import threading
 
 from sqlalchemy import exc
 from sqlalchemy import sql
@@ -1240,6 +1241,103 @@ class LRUTest(fixtures.TestBase):
         assert 25 in lru
         assert lru[25] is i2
 
+    def test_snapshot_doesnt_update_usage(self):
+        lru = util.LRUCache(10, threshold=0.2)
+
+        for i in range(10):
+            lru[i] = str(i)
+        eq_(lru.snapshot(), {i: str(i) for i in range(10)})
+        eq_(set(lru.values()), {str(i) for i in range(10)})
+
+        for i in range(10, 13):
+            lru[i] = str(i)
+
+        # the oldest items are pruned, having not been used since
+        assert 0 not in lru
+        assert 1 not in lru
+
+
+class ShardedLRUTest(fixtures.TestBase):
+    def test_num_shards(self):
+        eq_(len(util.ShardedLRUCache(10)._shards), 1)
+        eq_(len(util.ShardedLRUCache(500)._shards), 7)
+        eq_(len(util.ShardedLRUCache(100000)._shards), 16)
+        eq_(len(util.ShardedLRUCache(10, shards=4)._shards), 4)
+
+    def test_mapping(self):
+        lru = util.ShardedLRUCache(100, shards=4)
+
+        for i in range(50):
+            lru[i] = str(i)
+
+        eq_(len(lru), 50)
+        eq_(set(lru), set(range(50)))
+        eq_(set(lru.values()), {str(i) for i in range(50)})
+        eq_(lru[10], "10")
+        eq_(lru.get(10), "10")
+        eq_(lru.get(200), None)
+        eq_(lru.get(200, "x"), "x")
+
+        del lru[10]
+        assert 10 not in lru
+        eq_(len(lru), 49)
+
+        lru.clear()
+        eq_(len(lru), 0)
+
+    def test_prune(self):
+        canary = mock.Mock()
+        lru = util.ShardedLRUCache(
+            40, threshold=0.5, shards=4, size_alert=canary
+        )
+
+        for i in range(1000):
+            lru[i] = i
+
+        # each shard is pruned independently, down to its share of
+        # the capacity
+        for shard in lru._shards:
+            eq_(shard.capacity, 10)
+            assert len(shard) <= 15
+        assert len(lru) <= lru.size_threshold
+        assert canary.mock_calls
+        for c in canary.mock_calls:
+            eq_(c, mock.call(lru))
+
+    def test_recently_used_retained(self):
+        lru = util.ShardedLRUCache(10, threshold=0.2, shards=1)
+
+        for i in range(10):
+            lru[i] = i
+        lru[0]
+        lru.get(1)
+        for i in range(10, 13):
+            lru[i] = i
+
+        assert 0 in lru
+        assert 1 in lru
+        assert 2 not in lru
+
+    def test_threads(self):
+        lru = util.ShardedLRUCache(100, shards=8)
+
+        def go(offset):
+            for i in range(2000):
+                key = (i * 3 + offset) % 150
+                value = lru.get(key)
+                if value is None:
+                    lru[key] = key
+                else:
+                    eq_(value, key)
+
+        threads = [threading.Thread(target=go, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(lru) <= lru.size_threshold
+
 
 class ImmutableSubclass(str):
     pass
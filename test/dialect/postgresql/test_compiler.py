@@ -40,6 +40,7 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.dialects.postgresql import TSRANGE
 from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.engine.interfaces import BindTyping
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import Session
@@ -52,6 +53,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import AssertsCompiledSQL
+from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import expect_warnings
 from sqlalchemy.testing.assertions import is_
 from sqlalchemy.util import OrderedDict
@@ -3175,3 +3177,151 @@ class RegexpTest(fixtures.TestBase, testing.AssertsCompiledSQL):
             "SELECT 1 " + exp,
             checkparams=params,
         )
+
+
+class InAsAnyTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = postgresql.dialect(use_any_for_in=True)
+
+    def setup_test(self):
+        self.table = table(
+            "mytable", column("myid", Integer), column("name", String)
+        )
+
+    def test_in(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(self.table.c.myid.in_([1, 2, 3])),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid = ANY(%(myid_1)s::INTEGER[])",
+            checkparams={"myid_1": [1, 2, 3]},
+        )
+
+    def test_not_in(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(
+                self.table.c.name.not_in(["a", "b"])
+            ),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.name != ALL(%(name_1)s::VARCHAR[])",
+            checkparams={"name_1": ["a", "b"]},
+        )
+
+    def test_empty_in(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(self.table.c.myid.in_([])),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid = ANY(%(myid_1)s::INTEGER[])",
+            checkparams={"myid_1": []},
+        )
+
+    def test_named_bindparam(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(
+                self.table.c.myid.in_(bindparam("ids"))
+            ),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid = ANY(%(ids)s::INTEGER[])",
+            params={"ids": [5, 6]},
+            checkparams={"ids": [5, 6]},
+        )
+
+    def test_asyncpg_element_cast(self):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        self.assert_compile(
+            select(self.table.c.myid).where(self.table.c.myid.in_([1, 2])),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid = ANY(%s::INTEGER[])",
+            dialect=asyncpg.dialect(use_any_for_in=True),
+        )
+
+    @testing.combinations(
+        (
+            postgresql.ENUM("a", "b", name="myenum"),
+            ["a"],
+            "mytable.data = ANY(%(data_1)s::myenum[])",
+        ),
+        (
+            Enum("a", "b", name="myenum"),
+            ["a"],
+            "mytable.data != ALL(%(data_1)s::myenum[])",
+        ),
+        (
+            postgresql.UUID(as_uuid=False),
+            ["8b6e2b5e-6f76-4a2d-9bd4-3b6bfcb6c0ad"],
+            "mytable.data = ANY(%(data_1)s::UUID[])",
+        ),
+        argnames="type_, values, expected",
+    )
+    @testing.combinations(True, False, argnames="render_casts")
+    def test_psycopg2_array_cast(self, type_, values, expected, render_casts):
+        """the array is cast to the element type on psycopg2, for types
+        whose values would otherwise be sent as text[], whether or not the
+        dialect renders bind casts."""
+
+        t = table("mytable", column("data", type_))
+        if "ALL" in expected:
+            criteria = t.c.data.not_in(values)
+        else:
+            criteria = t.c.data.in_(values)
+
+        dialect = PGDialect_psycopg2(use_any_for_in=True)
+        if not render_casts:
+            dialect.bind_typing = BindTyping.NONE
+
+        self.assert_compile(
+            select(t.c.data).where(criteria),
+            "SELECT mytable.data FROM mytable WHERE " + expected,
+            checkparams={"data_1": values},
+            dialect=dialect,
+        )
+
+    def test_tuple_in_unchanged(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(
+                tuple_(self.table.c.myid, self.table.c.name).in_(
+                    [(1, "a"), (2, "b")]
+                )
+            ),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE (mytable.myid, mytable.name) IN "
+            "(__[POSTCOMPILE_param_1])",
+        )
+
+    def test_subquery_in_unchanged(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(
+                self.table.c.myid.in_(select(self.table.c.myid))
+            ),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid IN (SELECT mytable.myid FROM mytable)",
+        )
+
+    def test_literal_binds_unchanged(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(self.table.c.myid.in_([1, 2])),
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid IN (1, 2)",
+            literal_binds=True,
+        )
+
+    def test_default_off(self):
+        self.assert_compile(
+            select(self.table.c.myid).where(self.table.c.myid.in_([1, 2])),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid IN (__[POSTCOMPILE_myid_1])",
+            dialect=postgresql.dialect(),
+        )
+
+    def test_cached_statement_new_values(self):
+        s1 = select(self.table.c.myid).where(self.table.c.myid.in_([1, 2]))
+        s2 = select(self.table.c.myid).where(
+            self.table.c.myid.in_([3, 4, 5, 6])
+        )
+
+        ck1, ck2 = s1._generate_cache_key(), s2._generate_cache_key()
+        eq_(ck1, ck2)
+
+        compiled = s1.compile(dialect=self.__dialect__, cache_key=ck1)
+        eq_(
+            compiled.construct_params(extracted_parameters=ck2[1]),
+            {"myid_1": [3, 4, 5, 6]},
+        )
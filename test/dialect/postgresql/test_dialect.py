@@ -1,21 +1,25 @@
 # coding: utf-8
 import datetime
+import decimal
 import itertools
 import logging
 import logging.handlers
 
 from sqlalchemy import BigInteger
 from sqlalchemy import bindparam
+from sqlalchemy import Boolean
 from sqlalchemy import cast
 from sqlalchemy import Column
 from sqlalchemy import create_engine
 from sqlalchemy import DateTime
 from sqlalchemy import DDL
+from sqlalchemy import Enum
 from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import extract
 from sqlalchemy import func
 from sqlalchemy import Integer
+from sqlalchemy import Interval
 from sqlalchemy import literal
 from sqlalchemy import literal_column
 from sqlalchemy import MetaData
@@ -30,11 +34,17 @@ from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import TypeDecorator
 from sqlalchemy import util
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import base as postgresql
+from sqlalchemy.dialects.postgresql import BYTEA
 from sqlalchemy.dialects.postgresql import HSTORE
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql import INT4RANGE
+from sqlalchemy.dialects.postgresql import INTERVAL
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import psycopg as psycopg_dialect
 from sqlalchemy.dialects.postgresql import psycopg2 as psycopg2_dialect
+from sqlalchemy.dialects.postgresql import TSRANGE
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_BATCH
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_PLAIN
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_VALUES
@@ -55,6 +65,7 @@ from sqlalchemy.testing.assertions import AssertsExecutionResults
 from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import eq_regex
 from sqlalchemy.testing.assertions import ne_
+from sqlalchemy.types import UserDefinedType
 
 if True:
     from sqlalchemy.dialects.postgresql.psycopg2 import (
@@ -256,6 +267,484 @@ $$ LANGUAGE plpgsql;"""
         eq_(dialect.is_disconnect("not an error", None, None), False)
 
 
+class PsycopgPreparedStatementTest(fixtures.TestBase):
+    def _connection(self):
+        conn = mock.Mock()
+        conn._connection_record.info = {}
+        return conn
+
+    def _context(self, dialect, statement, **kw):
+        kw.setdefault("compiled", None)
+        kw.setdefault("isddl", False)
+        kw.setdefault("cache_hit", None)
+        return mock.Mock(
+            dialect=dialect,
+            statement=statement,
+            _is_server_side=False,
+            _dbapi_connection=self._connection(),
+            _psycopg_prepare=None,
+            **kw,
+        )
+
+    @testing.combinations(
+        (True, {"prepare": True}),
+        (False, {"prepare": False}),
+        (None, {}),
+        argnames="prepare, expected",
+    )
+    def test_do_execute(self, prepare, expected):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        context = mock.Mock(_psycopg_prepare=prepare)
+
+        cursor = mock.Mock()
+        dialect.do_execute(cursor, "select 1", {"x": 5}, context)
+        dialect.do_execute_no_params(cursor, "select 1", context)
+        eq_(
+            cursor.mock_calls,
+            [
+                mock.call.execute("select 1", {"x": 5}, **expected),
+                mock.call.execute("select 1", **expected),
+            ],
+        )
+
+    def test_cache_hit_is_prepared(self):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        pre_exec = psycopg_dialect.PGExecutionContext_psycopg.pre_exec
+
+        hit = self._context(dialect, "select 1", cache_hit=dialect.CACHE_HIT)
+        pre_exec(hit)
+        is_true(hit._psycopg_prepare)
+
+        miss = self._context(dialect, "select 1", cache_hit=dialect.CACHE_MISS)
+        pre_exec(miss)
+        is_false(miss._psycopg_prepare)
+
+    def test_cache_size_zero(self):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepared_statement_cache_size=0
+        )
+        context = self._context(
+            dialect, "select 1", cache_hit=dialect.CACHE_HIT
+        )
+        psycopg_dialect.PGExecutionContext_psycopg.pre_exec(context)
+        is_(context._psycopg_prepare, None)
+
+        dialect._invalidate_prepared_statements()
+        conn = self._connection()
+        dialect.do_rollback(conn)
+        eq_(conn.mock_calls, [mock.call.rollback()])
+
+    @testing.combinations(
+        ("SET search_path TO foo", True),
+        ("  set session search_path=foo, public", True),
+        ("SET LOCAL search_path TO foo", True),
+        ("SET search_path_other TO foo", False),
+        ("select 'SET search_path'", False),
+        argnames="statement, invalidates",
+    )
+    def test_search_path_invalidates(self, statement, invalidates):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        context = self._context(dialect, statement)
+        psycopg_dialect.PGExecutionContext_psycopg.pre_exec(context)
+        eq_(dialect._prepared_statements_generation, int(invalidates))
+
+    def test_ddl_invalidates(self):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        context = self._context(dialect, "CREATE TABLE t (x INT)", isddl=True)
+        psycopg_dialect.PGExecutionContext_psycopg.pre_exec(context)
+        eq_(dialect._prepared_statements_generation, 1)
+
+    def test_result_type_error_invalidates(self):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        context = self._context(dialect, "select 1")
+        handle = (
+            psycopg_dialect.PGExecutionContext_psycopg.handle_dbapi_exception
+        )
+
+        handle(context, mock.Mock(sqlstate="42P01"))
+        eq_(dialect._prepared_statements_generation, 0)
+        handle(context, mock.Mock(sqlstate="0A000"))
+        eq_(dialect._prepared_statements_generation, 1)
+
+    def test_deallocate_stale(self):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        conn = self._connection()
+
+        dialect._deallocate_stale_prepared_statements(conn)
+        eq_(conn.mock_calls, [])
+
+        dialect._invalidate_prepared_statements()
+        dialect._deallocate_stale_prepared_statements(conn)
+        dialect._deallocate_stale_prepared_statements(conn)
+        eq_(
+            conn.mock_calls,
+            [
+                mock.call.cursor(),
+                mock.call.cursor().execute("DEALLOCATE ALL"),
+                mock.call.cursor().close(),
+            ],
+        )
+
+        # a new connection, or one that has reconnected, has nothing
+        # to deallocate
+        other = self._connection()
+        dialect._deallocate_stale_prepared_statements(other)
+        eq_(other.mock_calls, [])
+
+    def test_rollback_deallocates_stale(self):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        conn = self._connection()
+
+        dialect.do_rollback(conn)
+        dialect._invalidate_prepared_statements()
+        dialect.do_rollback(conn)
+        eq_(
+            conn.mock_calls,
+            [
+                mock.call.rollback(),
+                mock.call.cursor(),
+                mock.call.cursor().execute("DEALLOCATE ALL"),
+                mock.call.cursor().close(),
+                mock.call.rollback(),
+            ],
+        )
+
+
+class _NoTextType(UserDefinedType):
+    cache_ok = True
+
+    def get_col_spec(self):
+        return "NOTEXT"
+
+
+class CopyInsertTest(fixtures.TestBase):
+    @testing.fixture
+    def copy_table(self):
+        return Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", String(50)),
+            Column("status", String(10), default="new"),
+            Column("created", DateTime, default=func.now()),
+            schema="s1",
+        )
+
+    def _context(self, dialect, stmt, params, **execution_options):
+        compiled = stmt.compile(
+            dialect=dialect, column_keys=list(params[0]), for_executemany=True
+        )
+        context = dialect.execution_ctx_cls.__new__(dialect.execution_ctx_cls)
+        context.dialect = dialect
+        context.compiled = compiled
+        context.isinsert = True
+        context.executemany = True
+        context.execution_options = util.immutabledict(
+            {"postgresql_copy": True, **execution_options}
+        )
+        return context
+
+    def _processed(self, context, params):
+        # parameters as they're passed to do_executemany()
+        compiled = context.compiled
+        params = [
+            compiled.construct_params(p, _group_number=i)
+            for i, p in enumerate(params)
+        ]
+        processors = compiled._bind_processors
+        params = [
+            {
+                key: processors[key](value) if key in processors else value
+                for key, value in p.items()
+            }
+            for p in params
+        ]
+        if compiled.positional:
+            params = [
+                tuple(p[key] for key in compiled.positiontup) for p in params
+            ]
+        return params
+
+    def test_copy_columns(self, copy_table):
+        dialect = psycopg2_dialect.dialect()
+        stmt = copy_table.insert()
+        params = [{"id": 1, "data": "d1"}, {"id": 2, "data": "d2"}]
+
+        compiled = stmt.compile(
+            dialect=dialect, column_keys=list(params[0]), for_executemany=True
+        )
+
+        # "created" has a SQL expression default which renders inline
+        is_(compiled._copy_insert_columns, None)
+
+        context = self._context(
+            dialect, stmt, [dict(p, created=None) for p in params]
+        )
+        is_true(context._use_copy_insert)
+        eq_(
+            context._copy_insert_statement(),
+            "COPY s1.t (id, data, status, created) FROM STDIN",
+        )
+
+    @testing.combinations(
+        ("returning", lambda t: t.insert().returning(t.c.id)),
+        ("values", lambda t: t.insert().values(data=func.lower("x"))),
+        (
+            "on_conflict",
+            lambda t: pg_insert(t).on_conflict_do_nothing(),
+        ),
+        argnames="stmt",
+        id_="ia",
+    )
+    def test_copy_not_eligible(self, copy_table, stmt):
+        dialect = psycopg2_dialect.dialect()
+        params = [{"id": 1, "data": "d1", "created": None}]
+        context = self._context(dialect, stmt(copy_table), params)
+        is_false(context._use_copy_insert)
+
+    def test_copy_requires_option(self, copy_table):
+        dialect = psycopg2_dialect.dialect()
+        params = [{"id": 1, "data": "d1", "created": None}]
+        context = self._context(
+            dialect, copy_table.insert(), params, postgresql_copy=False
+        )
+        is_false(context._use_copy_insert)
+
+    def test_copy_not_supported(self, copy_table):
+        from sqlalchemy.dialects.postgresql import pg8000
+
+        dialect = pg8000.dialect()
+        params = [{"id": 1, "data": "d1", "created": None}]
+        context = self._context(dialect, copy_table.insert(), params)
+        is_false(context._use_copy_insert)
+
+    def test_copy_schema_translate(self, copy_table):
+        dialect = psycopg2_dialect.dialect()
+        params = [{"id": 1, "data": "d1", "created": None}]
+        stmt = copy_table.insert()
+        compiled = stmt.compile(
+            dialect=dialect,
+            column_keys=list(params[0]),
+            for_executemany=True,
+            schema_translate_map={"s1": "s2"},
+        )
+        context = self._context(
+            dialect, stmt, params, schema_translate_map={"s1": "s2"}
+        )
+        context.compiled = compiled
+        eq_(
+            context._copy_insert_statement(),
+            "COPY s2.t (id, data, status, created) FROM STDIN",
+        )
+
+    def _copy_text_context(self, type_, value, dialect=None):
+        if dialect is None:
+            dialect = psycopg2_dialect.dialect()
+        table = Table(
+            "t",
+            MetaData(),
+            Column("x", type_),
+            Column("y", String),
+        )
+        params = [{"x": value, "y": "y"}]
+        context = self._context(dialect, table.insert(), params)
+        return context, self._processed(context, params)
+
+    @testing.combinations(
+        (String, "plain", "plain"),
+        (
+            String,
+            "tab\tnewline\ncr\rbackslash\\",
+            r"tab\tnewline\ncr\rbackslash\\",
+        ),
+        (String, None, r"\N"),
+        (Integer, 5, "5"),
+        (Numeric(10, 2), decimal.Decimal("5.25"), "5.25"),
+        (Boolean, True, "t"),
+        (Boolean, False, "f"),
+        (Enum("a", "b", name="e"), "b", "b"),
+        (
+            DateTime,
+            datetime.datetime(2022, 5, 10, 12, 30),
+            "2022-05-10 12:30:00",
+        ),
+        (
+            INTERVAL,
+            datetime.timedelta(days=1, seconds=5),
+            "1 days 5 seconds 0 microseconds",
+        ),
+        (
+            Interval,
+            datetime.timedelta(days=-1, seconds=5),
+            "-1 days 5 seconds 0 microseconds",
+        ),
+        (BYTEA, b"\x01\xff", r"\\x01ff"),
+        (HSTORE, {"k": "v"}, r'"k"=>"v"'),
+        (JSONB, {"k": "v"}, r'{"k": "v"}'),
+        (ARRAY(Integer), [1, 2], r'{"1","2"}'),
+        (ARRAY(Integer), [1, None], r'{"1",NULL}'),
+        (
+            ARRAY(String),
+            ['a"b', None, "c\\d"],
+            r'{"a\\"b",NULL,"c\\\\d"}',
+        ),
+        (
+            ARRAY(Integer, dimensions=2),
+            [[1, None], [None, 4]],
+            r'{{"1",NULL},{NULL,"4"}}',
+        ),
+        (
+            ARRAY(INTERVAL),
+            [datetime.timedelta(seconds=1), None],
+            r'{"0 days 1 seconds 0 microseconds",NULL}',
+        ),
+        (ARRAY(Boolean), [True, False], r'{"t","f"}'),
+        argnames="type_, value, expected",
+    )
+    def test_copy_text_encoding(self, type_, value, expected):
+        context, params = self._copy_text_context(type_, value)
+        is_true(context._use_copy_insert)
+        eq_(
+            list(context._copy_insert_text_lines(params)),
+            ["%s\ty\n" % expected],
+        )
+
+    @testing.combinations(
+        (INT4RANGE, "[1,5)"),
+        (TSRANGE, "empty"),
+        (ARRAY(INT4RANGE), ["[1,5)"]),
+        (_NoTextType, "x"),
+        argnames="type_, value",
+    )
+    def test_copy_text_not_known(self, type_, value):
+        dialect = psycopg2_dialect.dialect(executemany_mode=None)
+        context, params = self._copy_text_context(type_, value, dialect)
+        is_(context.compiled._copy_text_encoders, None)
+        is_false(context._use_copy_insert)
+
+        cursor = mock.Mock()
+        context.dialect.do_executemany(
+            cursor, context.compiled.string, params, context
+        )
+        eq_(cursor.copy_expert.mock_calls, [])
+        eq_(
+            cursor.executemany.mock_calls,
+            [mock.call(context.compiled.string, params)],
+        )
+
+    def test_copy_text_driver_binary(self):
+        # with a DBAPI present, LargeBinary wraps values in dbapi.Binary(),
+        # which has no known text representation
+        dialect = psycopg2_dialect.dialect()
+        dialect.dbapi = mock.Mock()
+        context, params = self._copy_text_context(BYTEA, b"\x01", dialect)
+        is_(context.compiled._copy_text_encoders, None)
+        is_false(context._use_copy_insert)
+
+    def test_copy_text_stream(self):
+        stream = psycopg2_dialect._CopyTextStream(
+            iter(["one\n", "two\n", "three\n"])
+        )
+        chunks = []
+        chunk = stream.read(5)
+        while chunk:
+            chunks.append(chunk)
+            chunk = stream.read(5)
+        eq_(chunks, ["one\nt", "wo\nth", "ree\n"])
+
+    def test_psycopg2_executemany(self, copy_table):
+        dialect = psycopg2_dialect.dialect()
+        params = [
+            {"id": 1, "data": "d1", "status": "new", "created": None},
+            {"id": 2, "data": None, "status": "new", "created": None},
+        ]
+        context = self._context(dialect, copy_table.insert(), params)
+
+        copied = []
+        cursor = mock.Mock(
+            copy_expert=mock.Mock(
+                side_effect=lambda stmt, stream: copied.append(
+                    (stmt, stream.read())
+                )
+            )
+        )
+        dialect.do_executemany(
+            cursor,
+            context.compiled.string,
+            self._processed(context, params),
+            context,
+        )
+        eq_(
+            copied,
+            [
+                (
+                    "COPY s1.t (id, data, status, created) FROM STDIN",
+                    "1\td1\tnew\t\\N\n2\t\\N\tnew\t\\N\n",
+                )
+            ],
+        )
+        eq_(cursor.executemany.mock_calls, [])
+
+    def test_psycopg_executemany(self, copy_table):
+        dialect = psycopg_dialect.dialect()
+        params = [
+            {"id": 1, "data": "d1", "status": "new", "created": None},
+            {"id": 2, "data": None, "status": "new", "created": None},
+        ]
+        context = self._context(dialect, copy_table.insert(), params)
+
+        cursor = mock.MagicMock()
+        dialect.do_executemany(
+            cursor,
+            context.compiled.string,
+            self._processed(context, params),
+            context,
+        )
+        copy = cursor.copy.return_value.__enter__.return_value
+        eq_(
+            cursor.copy.mock_calls[0],
+            mock.call("COPY s1.t (id, data, status, created) FROM STDIN"),
+        )
+        eq_(
+            copy.write_row.mock_calls,
+            [
+                mock.call((1, "d1", "new", None)),
+                mock.call((2, None, "new", None)),
+            ],
+        )
+
+    def test_asyncpg_executemany(self, copy_table):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        dialect = asyncpg.dialect()
+        params = [
+            {"id": 1, "data": "d1", "status": "new", "created": None},
+            {"id": 2, "data": None, "status": "new", "created": None},
+        ]
+        context = self._context(
+            dialect, copy_table.insert(), params, schema_translate_map={}
+        )
+
+        cursor = mock.Mock()
+        dialect.do_executemany(
+            cursor,
+            context.compiled.string,
+            self._processed(context, params),
+            context,
+        )
+        eq_(
+            cursor.mock_calls,
+            [
+                mock.call.copy_records(
+                    "t",
+                    "s1",
+                    ["id", "data", "status", "created"],
+                    [(1, "d1", "new", None), (2, None, "new", None)],
+                )
+            ],
+        )
+
+
 class PGCodeTest(fixtures.TestBase):
     __only_on__ = "postgresql"
 
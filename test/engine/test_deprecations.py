@@ -390,7 +390,10 @@ class ImplicitReturningFlagTest(fixtures.TestBase):
             stmt = insert(t).values(data="data")
 
             if implicit_returning:
-                if not testing.requires.returning.enabled:
+                if not (
+                    testing.requires.returning.enabled
+                    or testing.requires.full_returning.enabled
+                ):
                     with expect_raises_message(
                         exc.CompileError, "RETURNING is not supported"
                     ):
@@ -4,7 +4,11 @@ import collections.abc as collections_abc
 from contextlib import contextmanager
 from contextlib import nullcontext
 from io import StringIO
+import json
+import os
+import pickle
 import re
+import tempfile
 import threading
 from unittest.mock import call
 from unittest.mock import Mock
@@ -18,6 +22,7 @@ from sqlalchemy import create_mock_engine
 from sqlalchemy import event
 from sqlalchemy import func
 from sqlalchemy import inspect
+from sqlalchemy import lambda_stmt
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import LargeBinary
@@ -30,13 +35,22 @@ from sqlalchemy import text
 from sqlalchemy import TypeDecorator
 from sqlalchemy import util
 from sqlalchemy import VARCHAR
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.engine import BindTyping
+from sqlalchemy.engine import CompiledCache
+from sqlalchemy.engine import PersistentCompiledCache
 from sqlalchemy.engine import default
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.cache import _dialect_identity
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import registry
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import NullPool
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import column
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql import Select
 from sqlalchemy.sql import literal
 from sqlalchemy.sql.elements import literal_column
 from sqlalchemy.testing import assert_raises
@@ -45,12 +59,15 @@ from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
+from sqlalchemy.testing import ne_
+from sqlalchemy.testing import not_in
 from sqlalchemy.testing.assertions import expect_deprecated
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
@@ -856,6 +873,89 @@ class ExecuteTest(fixtures.TablesTest):
 
         connection.execute(users.insert(), parameters)
 
+    @testing.combinations(
+        (None, [1000]),
+        (3, [3, 3, 3, 1]),
+        (5, [5, 5]),
+        (20, [10]),
+        argnames="page_size, expected_pages",
+    )
+    def test_params_iterator(self, connection, page_size, expected_pages):
+        users = self.tables.users
+
+        consumed = []
+
+        def params(count):
+            for i in range(1, count + 1):
+                consumed.append(i)
+                yield {"user_id": i, "user_name": "name%d" % i}
+
+        num = sum(expected_pages) if page_size else 10
+        if page_size:
+            connection.execution_options(executemany_page_size=page_size)
+
+        canary = mock.Mock()
+        event.listen(connection, "before_cursor_execute", canary)
+
+        result = connection.execute(users.insert(), params(num))
+        eq_(result.rowcount, num)
+
+        # one executemany for each page of parameters, consuming the
+        # iterator as each page is sent
+        eq_(
+            [
+                len(call[1][3]) if call[1][5] else 1
+                for call in canary.mock_calls
+            ],
+            [min(num, size) for size in expected_pages],
+        )
+        eq_(consumed, list(range(1, num + 1)))
+
+        eq_(
+            connection.scalar(select(func.count()).select_from(users)),
+            num,
+        )
+
+    def test_params_iterator_empty(self, connection):
+        users = self.tables.users
+
+        canary = mock.Mock()
+        event.listen(connection, "before_cursor_execute", canary)
+
+        result = connection.execute(users.insert(), (d for d in []))
+        eq_(result.rowcount, 0)
+        eq_(result.all(), [])
+        eq_(canary.mock_calls, [])
+
+        eq_(
+            connection.scalar(select(func.count()).select_from(users)),
+            0,
+        )
+
+    def test_params_iterator_invalid_page_size(self, connection):
+        users = self.tables.users
+
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "executemany_page_size must be a positive integer",
+        ):
+            connection.execute(
+                users.insert(),
+                iter([{"user_id": 1, "user_name": "name1"}]),
+                execution_options={"executemany_page_size": 0},
+            )
+
+    @testing.requires.insert_executemany_returning
+    def test_params_iterator_returning(self, connection):
+        users = self.tables.users
+
+        result = connection.execute(
+            users.insert().returning(users.c.user_id),
+            ({"user_id": i, "user_name": "name%d" % i} for i in range(1, 8)),
+            execution_options={"executemany_page_size": 3},
+        )
+        eq_(sorted(result.scalars()), list(range(1, 8)))
+
 
 class ConvenienceExecuteTest(fixtures.TablesTest):
     __backend__ = True
@@ -1156,6 +1256,696 @@ class CompiledCacheTest(fixtures.TestBase):
         )
         eq_(conn.scalar(stmt), 1)
 
+    @testing.combinations(
+        (True, util.ShardedLRUCache),
+        (False, util.LRUCache),
+        argnames="freethreading, cls",
+    )
+    def test_default_cache_type(self, freethreading, cls):
+        with mock.patch.object(util, "freethreading", freethreading):
+            eng = engines.testing_engine(options={"query_cache_size": 100})
+        is_(type(eng._compiled_cache), cls)
+        eq_(eng._compiled_cache.capacity, 100)
+
+
+class CacheStatsTest(fixtures.TestBase):
+    __backend__ = True
+
+    def test_stats(self):
+        eng = engines.testing_engine()
+
+        s1 = select(literal_column("1").label("x"))
+        s2 = select(literal_column("2").label("x"))
+        with eng.connect() as conn:
+            for i in range(3):
+                conn.execute(s1)
+            conn.execute(s2)
+            conn.exec_driver_sql("select 1")
+
+        stats = eng.cache_stats()
+        eq_(stats.hits, 2)
+        eq_(stats.misses, 2)
+        eq_(stats.no_cache_key, 0)
+        eq_(stats.evictions, 0)
+
+        eq_(len(stats.statements), 2)
+        eq_([st.hits for st in stats.statements], [2, 0])
+        eq_(stats.statements[0].sql, str(s1.compile(eng)))
+        for st in stats.statements:
+            assert st.compile_time > 0
+            assert st.size > 0
+
+    def test_option_engine_shares_stats(self):
+        eng = engines.testing_engine()
+        opt_eng = eng.execution_options(foo="bar")
+
+        s1 = select(literal_column("1").label("x"))
+        with eng.connect() as conn:
+            conn.execute(s1)
+        with opt_eng.connect() as conn:
+            conn.execute(s1)
+
+        stats = eng.cache_stats()
+        eq_((stats.hits, stats.misses), (1, 1))
+        eq_(opt_eng.cache_stats(), stats)
+
+    def test_no_cache_key(self):
+        eng = engines.testing_engine()
+
+        class MyElement(ColumnElement):
+            inherit_cache = False
+
+        @compiles(MyElement)
+        def go(element, compiler, **kw):
+            return "1"
+
+        with eng.connect() as conn:
+            conn.execute(select(MyElement()))
+
+        stats = eng.cache_stats()
+        eq_((stats.hits, stats.misses, stats.no_cache_key), (0, 0, 1))
+
+    def test_evictions(self):
+        eng = engines.testing_engine(options={"query_cache_size": 10})
+
+        with eng.connect() as conn:
+            for i in range(20):
+                conn.execute(select(literal_column(str(i)).label("x")))
+
+        stats = eng.cache_stats()
+        eq_(stats.misses, 20)
+        eq_(stats.evictions, 6)
+        eq_(len(stats.statements), 14)
+
+    def test_shared_cache_weigher(self):
+        cache = CompiledCache(weigher=lambda k, v: 12345)
+        eng = engines.testing_engine(options={"query_cache": cache})
+
+        with eng.connect() as conn:
+            conn.execute(select(literal_column("1").label("x")))
+            conn.execute(select(literal_column("2").label("x")))
+
+        eq_([st.size for st in eng.cache_stats().statements], [12345, 12345])
+
+    def test_caching_disabled(self):
+        eng = engines.testing_engine(options={"query_cache_size": 0})
+        with eng.connect() as conn:
+            conn.execute(select(literal_column("1")))
+
+        eq_(eng.cache_stats(), (0, 0, 0, 0, []))
+
+    def test_miss_storm(self):
+        eng = engines.testing_engine(
+            options={
+                "cache_miss_storm_threshold": 5,
+                "cache_miss_storm_interval": 60,
+            }
+        )
+        canary = Mock()
+        event.listen(eng, "cache_miss_storm", canary)
+
+        with eng.connect() as conn:
+            for i in range(12):
+                conn.execute(select(literal_column(str(i)).label("x")))
+                # cache hits don't count towards the storm
+                conn.execute(select(literal_column(str(i)).label("x")))
+
+        eq_(canary.call_count, 2)
+        for c, start in zip(canary.mock_calls, (0, 5)):
+            conn_arg, statements, elapsed = c[1]
+            is_(conn_arg, conn)
+            eq_(
+                statements,
+                [
+                    str(select(literal_column(str(i)).label("x")).compile(eng))
+                    for i in range(start, start + 5)
+                ],
+            )
+            assert 0 < elapsed < 60
+
+    @testing.combinations(0, None, argnames="threshold")
+    def test_miss_storm_disabled(self, threshold):
+        eng = engines.testing_engine(
+            options={"cache_miss_storm_threshold": threshold}
+        )
+        canary = Mock()
+        event.listen(eng, "cache_miss_storm", canary)
+
+        with eng.connect() as conn:
+            for i in range(5):
+                eq_(conn.scalar(select(literal_column(str(i)))), i)
+
+        eq_(canary.call_count, 0)
+        eq_(eng.cache_stats().misses, 5)
+
+    def test_miss_storm_threshold_one(self):
+        eng = engines.testing_engine(
+            options={
+                "cache_miss_storm_threshold": 1,
+                "cache_miss_storm_interval": 60,
+            }
+        )
+        canary = Mock()
+        event.listen(eng, "cache_miss_storm", canary)
+
+        with eng.connect() as conn:
+            for i in range(3):
+                conn.execute(select(literal_column(str(i)).label("x")))
+                conn.execute(select(literal_column(str(i)).label("x")))
+
+        eq_(
+            [c[1][1] for c in canary.mock_calls],
+            [
+                [str(select(literal_column(str(i)).label("x")).compile(eng))]
+                for i in range(3)
+            ],
+        )
+
+    def test_miss_storm_threshold_negative(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "cache_miss_storm_threshold must be a positive integer",
+            create_engine,
+            "sqlite://",
+            cache_miss_storm_threshold=-1,
+        )
+
+    def test_miss_storm_interval(self):
+        eng = engines.testing_engine(
+            options={
+                "cache_miss_storm_threshold": 5,
+                "cache_miss_storm_interval": 0,
+            }
+        )
+        canary = Mock()
+        event.listen(eng, "cache_miss_storm", canary)
+
+        with eng.connect() as conn:
+            for i in range(12):
+                conn.execute(select(literal_column(str(i)).label("x")))
+
+        eq_(canary.call_count, 0)
+
+class SharedCompiledCacheTest(fixtures.TestBase):
+    __backend__ = True
+
+    def _stmt(self, num):
+        return select(literal_column(str(num)).label("x"))
+
+    def test_shared_among_engines(self):
+        cache = CompiledCache()
+        e1 = engines.testing_engine(options={"query_cache": cache})
+        e2 = engines.testing_engine(options={"query_cache": cache})
+
+        stmt = self._stmt(5)
+        with e1.connect() as conn:
+            eq_(conn.scalar(stmt), 5)
+        with e2.connect() as conn:
+            eq_(conn.scalar(stmt), 5)
+
+        eq_(len(cache), 1)
+        eq_(cache.misses, 1)
+        eq_(cache.hits, 1)
+
+        is_(e1._compiled_cache, cache)
+        e2.clear_compiled_cache()
+        eq_(len(cache), 0)
+
+    def test_distinct_dialect_config(self):
+        cache = CompiledCache()
+        e1 = engines.testing_engine(options={"query_cache": cache})
+        e2 = engines.testing_engine(
+            options={"query_cache": cache, "label_length": 10}
+        )
+
+        stmt = self._stmt(5)
+        with e1.connect() as conn:
+            eq_(conn.scalar(stmt), 5)
+        with e2.connect() as conn:
+            eq_(conn.scalar(stmt), 5)
+
+        eq_(len(cache), 2)
+        eq_(cache.misses, 2)
+        eq_(cache.hits, 0)
+
+    def test_dialect_identity_non_scalar(self):
+        def serializer(value):
+            return json.dumps(value)
+
+        eq_(
+            _dialect_identity(sqlite.dialect(json_serializer=serializer)),
+            _dialect_identity(sqlite.dialect(json_serializer=serializer)),
+        )
+        ne_(
+            _dialect_identity(sqlite.dialect(json_serializer=serializer)),
+            _dialect_identity(sqlite.dialect(json_serializer=json.dumps)),
+        )
+        ne_(
+            _dialect_identity(sqlite.dialect(json_serializer=serializer)),
+            _dialect_identity(sqlite.dialect()),
+        )
+
+        # type adaptations established per-dialect are compared by
+        # their contents
+        d1, d2 = sqlite.dialect(), sqlite.dialect()
+        d1.colspecs = dict(d1.colspecs)
+        d2.colspecs = dict(d2.colspecs)
+        eq_(_dialect_identity(d1), _dialect_identity(d2))
+        d2.colspecs.pop(Integer, None)
+        d2.colspecs[String] = VARCHAR
+        ne_(_dialect_identity(d1), _dialect_identity(d2))
+
+        # a value that can't be compared prevents sharing
+        d1, d2 = sqlite.dialect(), sqlite.dialect()
+        d1.some_setting = d2.some_setting = [1, 2]
+        ne_(_dialect_identity(d1), _dialect_identity(d2))
+
+    def test_evict_by_weight(self):
+        cache = CompiledCache(
+            max_bytes=1000, threshold=0.5, weigher=lambda k, v: 300
+        )
+        eng = engines.testing_engine(options={"query_cache": cache})
+
+        with eng.connect() as conn:
+            for i in range(5):
+                eq_(conn.scalar(self._stmt(i)), i)
+                eq_(len(cache), i + 1)
+                eq_(cache.total_weight, (i + 1) * 300)
+
+            # pruned down to max_bytes
+            eq_(conn.scalar(self._stmt(5)), 5)
+            eq_(len(cache), 3)
+            eq_(cache.total_weight, 900)
+            eq_(cache.evictions, 3)
+
+            # most recently used entries were retained
+            eq_(conn.scalar(self._stmt(5)), 5)
+            eq_(conn.scalar(self._stmt(4)), 4)
+            eq_(conn.scalar(self._stmt(3)), 3)
+            eq_(cache.hits, 3)
+
+    def test_default_weight(self):
+        cache = CompiledCache()
+        eng = engines.testing_engine(options={"query_cache": cache})
+
+        small = select(literal_column("1"))
+        large = select(*[literal(i).label("x%d" % i) for i in range(50)])
+        with eng.connect() as conn:
+            conn.execute(small)
+            conn.execute(large)
+
+        small_key, large_key = list(cache)
+        assert cache.weight(small_key) < cache.weight(large_key)
+        eq_(
+            cache.total_weight,
+            cache.weight(small_key) + cache.weight(large_key),
+        )
+
+    def test_size_alert(self):
+        canary = Mock()
+        cache = CompiledCache(
+            max_bytes=100, weigher=lambda k, v: 100, size_alert=canary
+        )
+        cache["a"] = 1
+        eq_(canary.mock_calls, [])
+        cache["b"] = 2
+        eq_(canary.mock_calls, [call(cache)])
+        eq_(list(cache), ["b"])
+
+
+class PersistentCompiledCacheTest(fixtures.TestBase):
+    __only_on__ = "sqlite"
+
+    @testing.fixture
+    def cache_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield os.path.join(tmpdir, "sql.cache")
+
+    def _metadata_fixture(self, extra_col=False):
+        m = MetaData()
+        t = Table(
+            "t",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            *([Column("extra", Integer)] if extra_col else []),
+        )
+        return m, t
+
+    def _run_statements(self, cache, m, t):
+        eng = engines.testing_engine(options={"query_cache": cache})
+        with eng.begin() as conn:
+            m.create_all(conn)
+            conn.execute(t.insert(), [{"data": "d1"}, {"data": "d2"}])
+            result = conn.execute(t.insert(), {"data": "d3"})
+            eq_(result.inserted_primary_key, (3,))
+            eq_(
+                conn.execute(
+                    select(t.c.data).where(t.c.data.in_(["d1", "d3"]))
+                ).all(),
+                [("d1",), ("d3",)],
+            )
+            eq_(
+                conn.execute(
+                    select(t).where(t.c.id == 2).order_by(t.c.id)
+                ).all(),
+                [(2, "d2")],
+            )
+
+    def test_roundtrip(self, cache_path):
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        eq_(len(cache), 0)
+        self._run_statements(cache, m, t)
+        eq_(cache.hits, 0)
+        eq_(cache.save(), 4)
+
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        eq_(len(cache), 4)
+
+        with mock.patch.object(
+            Select, "_compiler", side_effect=Select._compiler, autospec=True
+        ) as compile_mock:
+            self._run_statements(cache, m, t)
+        eq_(compile_mock.call_count, 0)
+        eq_(cache.hits, 4)
+        eq_(cache.misses, 0)
+
+        # resolved entries may be saved again
+        eq_(cache.save(), 4)
+
+    def test_metadata_changed(self, cache_path):
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        self._run_statements(cache, m, t)
+        cache.save()
+
+        m, t = self._metadata_fixture(extra_col=True)
+        cache = PersistentCompiledCache(cache_path, m)
+        eq_(len(cache), 0)
+
+    def test_no_file(self, cache_path):
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        eq_(len(cache), 0)
+        eq_(cache.load(), 0)
+
+    def test_unpicklable_not_saved(self, cache_path):
+        m, t = self._metadata_fixture()
+        other = Table("other", MetaData(), Column("q", Integer))
+        cache = PersistentCompiledCache(cache_path, m)
+        eng = engines.testing_engine(options={"query_cache": cache})
+        with eng.begin() as conn:
+            m.create_all(conn)
+            conn.execute(lambda_stmt(lambda: select(t.c.data)))
+            conn.execute(select(t.c.data))
+        eq_(len(cache), 2)
+        with expect_warnings(
+            r"1 statement\(s\) in the compiled cache could not be saved"
+        ):
+            eq_(cache.save(), 1)
+
+        # statements against tables outside of the MetaData may be saved,
+        # but won't match statements against those tables in a new process
+        cache = PersistentCompiledCache(cache_path, m)
+        eq_(len(cache), 1)
+        eng = engines.testing_engine(options={"query_cache": cache})
+        with eng.begin() as conn:
+            other.create(conn)
+            conn.execute(select(other.c.q))
+        eq_(cache.save(), 2)
+
+        cache = PersistentCompiledCache(cache_path, m)
+        eng = engines.testing_engine(options={"query_cache": cache})
+        with eng.begin() as conn:
+            other.create(conn)
+            conn.execute(select(other.c.q))
+        eq_(cache.misses, 1)
+
+    def test_orm_statement_not_saved(self, cache_path):
+        m, t = self._metadata_fixture()
+
+        class A:
+            pass
+
+        registry().map_imperatively(A, t)
+
+        cache = PersistentCompiledCache(cache_path, m)
+        eng = engines.testing_engine(options={"query_cache": cache})
+        with eng.begin() as conn:
+            m.create_all(conn)
+            conn.execute(select(t.c.data))
+            with Session(conn) as sess:
+                sess.scalars(select(A)).all()
+        eq_(len(cache), 2)
+
+        with expect_warnings(
+            r"1 statement\(s\) in the compiled cache could not be saved .* "
+            "only Core statements can be persisted"
+        ):
+            eq_(cache.save(), 1)
+
+    def test_parameter_values_not_saved(self, cache_path):
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        eng = engines.testing_engine(options={"query_cache": cache})
+        with eng.begin() as conn:
+            m.create_all(conn)
+            conn.execute(t.insert(), {"data": "some secret"})
+            eq_(
+                conn.scalar(select(t.c.id).where(t.c.data == "some secret")),
+                1,
+            )
+        eq_(cache.save(), 2)
+
+        with open(cache_path, "rb") as file_:
+            contents = pickle.load(file_)
+        for key_data, value_data, weight in contents["entries"]:
+            not_in(b"some secret", key_data)
+            not_in(b"some secret", value_data)
+
+        # the persisted statement is used with the values of a new
+        # execution
+        cache = PersistentCompiledCache(cache_path, m)
+        eng = engines.testing_engine(options={"query_cache": cache})
+        with eng.begin() as conn:
+            m.create_all(conn)
+            conn.execute(t.insert(), {"data": "other"})
+            eq_(
+                conn.scalar(select(t.c.id).where(t.c.data == "other")),
+                1,
+            )
+        eq_(cache.hits, 2)
+
+    def _rewrite_file(self, cache_path, fn):
+        with open(cache_path, "rb") as file_:
+            contents = pickle.load(file_)
+        fn(contents)
+        with open(cache_path, "wb") as file_:
+            pickle.dump(contents, file_)
+        os.chmod(cache_path, 0o600)
+
+    @testing.combinations("version", "python", argnames="field")
+    def test_version_changed(self, cache_path, field):
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        self._run_statements(cache, m, t)
+        eq_(cache.save(), 4)
+
+        self._rewrite_file(
+            cache_path, lambda contents: contents.update({field: "other"})
+        )
+        eq_(len(PersistentCompiledCache(cache_path, m)), 0)
+
+    def test_disallowed_global_not_loaded(self, cache_path):
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        self._run_statements(cache, m, t)
+        eq_(cache.save(), 4)
+
+        class Tampered:
+            def __reduce__(self):
+                return (_persisted_cache_canary, ())
+
+        def tamper(contents):
+            entries = contents["entries"]
+            key_data, value_data, weight = entries[0]
+            entries[0] = (pickle.dumps(Tampered()), value_data, weight)
+            key_data, value_data, weight = entries[1]
+            entries[1] = (key_data, pickle.dumps(Tampered()), weight)
+
+        self._rewrite_file(cache_path, tamper)
+
+        cache = PersistentCompiledCache(cache_path, m)
+        eq_(len(cache), 3)
+        self._run_statements(cache, m, t)
+        eq_(cache.hits, 2)
+        eq_(cache.misses, 2)
+        eq_(_persisted_cache_canary_calls, [])
+
+    @testing.skip_if(lambda: util.win32, "POSIX file permissions")
+    def test_writable_file_not_loaded(self, cache_path):
+        m, t = self._metadata_fixture()
+        cache = PersistentCompiledCache(cache_path, m)
+        self._run_statements(cache, m, t)
+        eq_(cache.save(), 4)
+        eq_(os.stat(cache_path).st_mode & 0o777, 0o600)
+
+        os.chmod(cache_path, 0o666)
+        with expect_warnings(
+            "Not loading the compiled cache from .*, as the file may be "
+            "written to by other users"
+        ):
+            cache = PersistentCompiledCache(cache_path, m)
+        eq_(len(cache), 0)
+
+
+_persisted_cache_canary_calls = []
+
+
+def _persisted_cache_canary():
+    _persisted_cache_canary_calls.append(True)
+
+
+class PipelineTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True),
+            Column("user_name", VARCHAR(20)),
+            test_needs_acid=True,
+        )
+
+    @testing.fixture
+    def pipeline_engine(self):
+        """The testing engine with its dialect reporting pipeline support,
+        and the pipeline itself replaced by a mock; statements still run
+        normally."""
+
+        dialect = testing.db.dialect
+        pipeline = mock.MagicMock()
+        with mock.patch.object(
+            dialect, "supports_pipeline", True
+        ), mock.patch.object(dialect, "do_pipeline", return_value=pipeline):
+            yield testing.db, pipeline
+
+    def test_dml_is_pipelined(self, pipeline_engine):
+        engine, pipeline = pipeline_engine
+        users = self.tables.users
+
+        with engine.connect() as conn:
+            conn.execution_options(pipeline=True)
+            results = [
+                conn.execute(
+                    users.insert(), {"user_id": i, "user_name": "u%d" % i}
+                )
+                for i in range(1, 4)
+            ]
+            results.append(
+                conn.execute(
+                    users.update().where(users.c.user_id > 1),
+                    {"user_name": "updated"},
+                )
+            )
+            eq_(pipeline.__enter__.call_count, 1)
+            eq_(pipeline.__exit__.call_count, 0)
+            is_true(all(r.context._pipelined for r in results))
+
+            # a statement returning rows synchronizes the pipeline
+            eq_(
+                conn.execute(
+                    select(users.c.user_name).order_by(users.c.user_id)
+                ).all(),
+                [("u1",), ("updated",), ("updated",)],
+            )
+            eq_(pipeline.__exit__.call_count, 1)
+            eq_([r.rowcount for r in results], [1, 1, 1, 2])
+            is_false(any(r.context._pipelined for r in results))
+            is_true(all(r._soft_closed for r in results))
+
+    def test_rowcount_syncs(self, pipeline_engine):
+        engine, pipeline = pipeline_engine
+        users = self.tables.users
+
+        with engine.connect() as conn:
+            conn.execution_options(pipeline=True)
+            result = conn.execute(
+                users.insert(), [{"user_id": 1}, {"user_id": 2}]
+            )
+            eq_(pipeline.__exit__.call_count, 0)
+            eq_(result.rowcount, 2)
+            eq_(pipeline.__exit__.call_count, 1)
+
+            conn.execute(users.delete())
+            eq_(pipeline.__enter__.call_count, 2)
+
+    def test_commit_syncs(self, pipeline_engine):
+        engine, pipeline = pipeline_engine
+        users = self.tables.users
+
+        with engine.connect() as conn:
+            conn.execution_options(pipeline=True)
+            conn.execute(users.insert(), {"user_id": 1})
+            conn.commit()
+            eq_(pipeline.__exit__.call_count, 1)
+
+        with engine.connect() as conn:
+            eq_(conn.scalar(select(func.count(users.c.user_id))), 1)
+
+    def test_commit_raises_pipeline_error(self, pipeline_engine):
+        engine, pipeline = pipeline_engine
+        users = self.tables.users
+
+        pipeline.__exit__.side_effect = SomeException("pipeline failed")
+        with engine.connect() as conn:
+            conn.execution_options(pipeline=True)
+            conn.execute(users.insert(), {"user_id": 1})
+            with expect_raises_message(SomeException, "pipeline failed"):
+                conn.commit()
+
+    def test_rollback_discards_pipeline_error(self, pipeline_engine):
+        engine, pipeline = pipeline_engine
+        users = self.tables.users
+
+        pipeline.__exit__.side_effect = SomeException("pipeline failed")
+        with engine.connect() as conn:
+            conn.execution_options(pipeline=True)
+            result = conn.execute(users.insert(), {"user_id": 1})
+            conn.rollback()
+            eq_(pipeline.__exit__.call_count, 1)
+            is_true(result._soft_closed)
+
+        with engine.connect() as conn:
+            eq_(conn.scalar(select(func.count(users.c.user_id))), 0)
+
+    def test_option_on_statement(self, pipeline_engine):
+        engine, pipeline = pipeline_engine
+        users = self.tables.users
+
+        with engine.connect() as conn:
+            conn.execute(users.insert(), {"user_id": 1})
+            eq_(pipeline.__enter__.call_count, 0)
+
+            conn.execute(
+                users.insert().execution_options(pipeline=True),
+                {"user_id": 2},
+            )
+            eq_(pipeline.__enter__.call_count, 1)
+
+    def test_not_supported(self, connection):
+        users = self.tables.users
+
+        connection.execution_options(pipeline=True)
+        result = connection.execute(users.insert(), {"user_id": 1})
+        if not connection.dialect.supports_pipeline:
+            is_false(result.context._pipelined)
+        eq_(result.rowcount, 1)
+
 
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
@@ -1898,6 +1898,438 @@ class QueuePoolTest(PoolTestBase):
         pc1.close()
 
 
+class QueuePoolMaintenanceTest(PoolTestBase):
+    def _queuepool_dbapi_fixture(self, _background=False, **kw):
+        dbapi, p = super()._queuepool_dbapi_fixture(**kw)
+        if not _background:
+            # maintenance is run explicitly by the test, rather than by a
+            # thread started upon first checkout
+            p._maintenance_pending = False
+        return dbapi, p
+
+    def _wait_for(self, fn):
+        deadline = time.time() + join_timeout
+        while not fn():
+            if time.time() > deadline:
+                assert False, "condition not met"
+            time.sleep(0.01)
+
+    def test_prewarm(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, prewarm=True)
+
+        p._run_maintenance(True)
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 3)
+        eq_(p.checkedout(), 0)
+
+        # subsequent runs don't prewarm
+        c1 = p.connect()
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 2)
+        c1.close()
+
+    def test_min_idle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, min_idle=2)
+
+        p._run_maintenance(True)
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 2)
+
+        c1, c2 = p.connect(), p.connect()
+        eq_(p.checkedin(), 0)
+
+        # only opens connections up to pool_size
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 1)
+        eq_(p.overflow(), 0)
+
+        c1.close()
+        c2.close()
+        eq_(p.checkedin(), 3)
+
+    @testing.combinations((True,), (False,), argnames="use_lifo")
+    def test_replace_ahead_of_recycle(self, use_lifo):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, recycle=30, maintenance_interval=5, use_lifo=use_lifo
+        )
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        dbapi_conns = [c.dbapi_connection for c in (c1, c2, c3)]
+        c2._connection_record.starttime -= 27
+        c3._connection_record.starttime -= 20
+        for c in (c1, c2, c3):
+            c.close()
+        records = list(p._pool.queue)
+
+        p._run_maintenance()
+
+        # c2 would pass the recycle time before the next run
+        eq_(dbapi.connect.call_count, 4)
+        is_true(dbapi_conns[1].close.called)
+        is_true(not dbapi_conns[0].close.called)
+        is_true(not dbapi_conns[2].close.called)
+
+        # replaced connection goes back last; the others keep their order
+        eq_(
+            list(p._pool.queue),
+            [records[0], records[2], records[1]],
+        )
+
+        c = p.connect()
+        eq_(dbapi.connect.call_count, 4)
+        c.close()
+
+    def test_replace_invalidated(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3)
+        c1 = p.connect()
+        c2 = p.connect()
+        dbapi_conn = c1.dbapi_connection
+        c1.invalidate()
+        c1.close()
+        c2.invalidate(soft=True)
+        c2.close()
+        eq_(dbapi.connect.call_count, 2)
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 4)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(dbapi.connect.call_count, 4)
+        is_not(c1.dbapi_connection, dbapi_conn)
+        c1.close()
+        c2.close()
+
+    def test_connect_failure(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, min_idle=2)
+        dbapi.shutdown(True)
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -3)
+
+        dbapi.shutdown(False)
+        p._run_maintenance()
+        eq_(p.checkedin(), 2)
+
+    def test_record_health(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3)
+        c1 = p.connect()
+        rec = c1._connection_record
+        eq_(rec.checkout_count, 1)
+        eq_(rec.error_count, 0)
+        is_true(rec.last_checkout_latency > 0)
+        c1.close()
+        checkin_time = rec.last_checkin_time
+        is_true(checkin_time >= rec.starttime)
+
+        c1 = p.connect()
+        is_(c1._connection_record, rec)
+        eq_(rec.checkout_count, 2)
+        c1.invalidate(Exception("disconnected"))
+        c1.close()
+
+        # error count is retained across reconnects
+        c1 = p.connect()
+        is_(c1._connection_record, rec)
+        eq_(rec.error_count, 1)
+        eq_(rec.checkout_count, 3)
+        c1.close()
+        is_true(rec.last_checkin_time >= checkin_time)
+
+    def test_idle_timeout(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=1, idle_timeout=60, use_lifo=True
+        )
+        conns = [p.connect() for i in range(5)]
+        records = [c._connection_record for c in conns]
+        dbapi_conns = [c.dbapi_connection for c in conns]
+        for c in conns:
+            c.close()
+        eq_(p.checkedin(), 5)
+
+        # nothing has been idle for long enough
+        p._run_maintenance()
+        eq_(p.checkedin(), 5)
+
+        for rec in records[1:4]:
+            rec.last_checkin_time -= 120
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), -3)
+        eq_(list(p._pool.queue), [records[0], records[4]])
+
+        for dbapi_conn in dbapi_conns[1:4]:
+            is_true(dbapi_conn.close.called)
+        is_true(not dbapi_conns[0].close.called)
+
+        # shrinks no further than min_idle
+        for rec in (records[0], records[4]):
+            rec.last_checkin_time -= 120
+        p._run_maintenance()
+        eq_(p.checkedin(), 1)
+        eq_(p.overflow(), -4)
+
+        # closed connections leave room for new ones
+        conns = [p.connect() for i in range(5)]
+        eq_(dbapi.connect.call_count, 9)
+        for c in conns:
+            c.close()
+
+    def test_idle_timeout_retires_least_healthy(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=4, min_idle=2, idle_timeout=60
+        )
+        conns = [p.connect() for i in range(4)]
+        records = [c._connection_record for c in conns]
+        for c in conns:
+            c.close()
+
+        for rec in records:
+            rec.last_checkin_time -= 120
+            rec.last_checkout_latency = 0.001
+        records[1].error_count = 2
+        records[2].last_checkout_latency = 0.5
+        records[3].error_count = 1
+
+        p._run_maintenance()
+        eq_(list(p._pool.queue), [records[0], records[2]])
+
+    def test_replace_leaves_idle_connections_available(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, timeout=0.1
+        )
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        stale_rec = c1._connection_record
+        c1.invalidate()
+        for c in (c1, c2, c3):
+            c.close()
+        eq_(dbapi.connect.call_count, 3)
+
+        checkouts = []
+        replace_connection = stale_rec._replace_connection
+
+        def _replace_connection():
+            # the other connections remain in the pool while a connection
+            # is being replaced
+            eq_(p.checkedin(), 2)
+            c = p.connect()
+            checkouts.append(c._connection_record)
+            c.close()
+            replace_connection()
+
+        with mock.patch.object(
+            stale_rec, "_replace_connection", _replace_connection
+        ):
+            p._run_maintenance()
+
+        eq_(len(checkouts), 1)
+        is_not(checkouts[0], stale_rec)
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+
+    def test_idle_timeout_skips_checked_out(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, idle_timeout=60
+        )
+        conns = [p.connect() for i in range(3)]
+        records = [c._connection_record for c in conns]
+        for c in conns:
+            c.close()
+        for rec in records:
+            rec.last_checkin_time -= 120
+
+        # a connection is checked out after the maintenance run has looked
+        # at the pool, but before it's retired
+        queued = p._pool.queued
+        checked_out = []
+
+        def _queued():
+            idle = queued()
+            checked_out.append(p.connect())
+            return idle
+
+        with mock.patch.object(p._pool, "queued", _queued):
+            p._run_maintenance()
+
+        c1 = checked_out[0]
+        is_(c1._connection_record, records[0])
+        is_true(not c1.dbapi_connection.close.called)
+        eq_(p.checkedin(), 0)
+        eq_(p.checkedout(), 1)
+        eq_(p.overflow(), -2)
+        c1.close()
+        eq_(p.checkedin(), 1)
+
+    @testing.requires.threading_with_mock
+    def test_background_thread(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3,
+            prewarm=True,
+            min_idle=1,
+            maintenance_interval=0.05,
+            _background=True,
+        )
+
+        # for a pool constructed directly, maintenance starts
+        # upon first checkout
+        is_none(p._maintenance)
+        c1 = p.connect()
+        is_not_none(p._maintenance)
+
+        self._wait_for(lambda: p.checkedin() == 2)
+        c2, c3 = p.connect(), p.connect()
+        self._wait_for(lambda: p.checkedin() == 0 and p.overflow() == 0)
+
+        for c in (c1, c2, c3):
+            c.close()
+
+        stop = p._maintenance
+        p.dispose()
+        is_true(stop.is_set())
+        is_none(p._maintenance)
+
+    @testing.requires.threading_with_mock
+    def test_engine_prewarm(self):
+        connects = []
+        e = tsa.create_engine(
+            "sqlite://",
+            poolclass=pool.QueuePool,
+            pool_size=2,
+            pool_prewarm=True,
+            pool_maintenance_interval=0.05,
+            pool_events=[(lambda *arg: connects.append(arg), "connect")],
+            connect_args={"check_same_thread": False},
+        )
+
+        p1 = e.pool
+        is_not_none(p1._maintenance)
+        self._wait_for(lambda: p1.checkedin() == 2)
+        eq_(len(connects), 2)
+
+        # dialect is initialized by the first connection
+        is_not_none(e.dialect.default_isolation_level)
+
+        with e.connect() as conn:
+            eq_(conn.scalar(select(1)), 1)
+
+        e.dispose()
+        p2 = e.pool
+        is_none(p1._maintenance)
+        is_not_none(p2._maintenance)
+        self._wait_for(lambda: p2.checkedin() == 2)
+        eq_(len(connects), 4)
+        e.dispose()
+
+
+class PoolMetricsTest(PoolTestBase):
+    def test_histogram(self):
+        h = pool.PoolHistogram(bounds=(0.1, 1, 10))
+        for value in (0.05, 0.1, 0.5, 2, 20):
+            h.observe(value)
+        eq_(h.count, 5)
+        eq_(h.sum, 22.65)
+        eq_(h.max, 20)
+        eq_(h.buckets(), [(0.1, 2), (1, 3), (10, 4), (float("inf"), 5)])
+
+    def test_checkout_checkin(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=2, max_overflow=1)
+        metrics = p.metrics
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(metrics.checkouts, 2)
+        eq_(metrics.connects, 2)
+        eq_(metrics.wait_time.count, 2)
+        eq_(metrics.hold_time.count, 0)
+        eq_(metrics.overflow_high_water, 0)
+
+        c3 = p.connect()
+        eq_(metrics.overflow_high_water, 1)
+
+        for c in (c1, c2, c3):
+            c.close()
+        eq_(metrics.hold_time.count, 3)
+
+        c1 = p.connect()
+        eq_(metrics.checkouts, 4)
+        eq_(metrics.connects, 3)
+        eq_(metrics.overflow_high_water, 1)
+        c1.close()
+        eq_(metrics.hold_time.count, 4)
+
+    def test_connect_failure(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=2)
+        dbapi.shutdown(True)
+        assert_raises(Exception, p.connect)
+        eq_(p.metrics.checkouts, 0)
+        eq_(p.metrics.connects, 1)
+        eq_(p.metrics.hold_time.count, 0)
+
+    def test_timeout(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=0.1)
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(p.metrics.timeouts, 1)
+        eq_(p.metrics.wait_time.count, 2)
+        is_true(p.metrics.wait_time.max >= 0.1)
+        c1.close()
+
+    def test_wait_time_overflow_retry(self):
+        """a checkout that's retried after another thread takes the last
+        overflow slot records a single wait_time sample."""
+
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1, max_overflow=1)
+        c1 = p.connect()
+        eq_(p.metrics.wait_time.count, 1)
+
+        inc_overflow = p._inc_overflow
+        lose_race = [True]
+
+        def _inc_overflow():
+            if lose_race:
+                lose_race.pop()
+                return False
+            return inc_overflow()
+
+        with mock.patch.object(p, "_inc_overflow", _inc_overflow):
+            c2 = p.connect()
+
+        eq_(lose_race, [])
+        eq_(p.metrics.checkouts, 2)
+        eq_(p.metrics.wait_time.count, 2)
+        c1.close()
+        c2.close()
+
+    @testing.requires.threading_with_mock
+    def test_wait_time(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        c1 = p.connect()
+
+        def checkin():
+            time.sleep(0.2)
+            c1.close()
+
+        t = threading.Thread(target=checkin)
+        t.start()
+        c2 = p.connect()
+        t.join(join_timeout)
+        is_true(p.metrics.wait_time.max >= 0.15)
+        is_true(p.metrics.hold_time.max >= 0.15)
+        eq_(p.metrics.timeouts, 0)
+        c2.close()
+
+    def test_recreate(self):
+        p = self._queuepool_fixture()
+        p.connect().close()
+        eq_(p.metrics.checkouts, 1)
+        p2 = p.recreate()
+        eq_(p2.metrics.checkouts, 0)
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
@@ -1,10 +1,13 @@
 from types import MappingProxyType
 
 from sqlalchemy import exc
+from sqlalchemy import testing
+from sqlalchemy.sql.compiler import SQLCompiler
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import mock
 from sqlalchemy.util import immutabledict
 
 
@@ -253,3 +256,79 @@ class CyDistillArgsTest(_DistillArgsTest):
         from sqlalchemy.cyextension import util
 
         cls.module = util
+
+
+class _ProcessParametersTest(fixtures.TestBase):
+    def _plan(self, positional, positiontup, processors):
+        compiler = mock.Mock(positional=positional)
+        return SQLCompiler._get_bind_processing_plan(
+            compiler, positiontup, processors
+        )
+
+    @testing.combinations(
+        ((), [(), ()]),
+        (("b",), [(2,), (12,)]),
+        (("b", "a", "c"), [(2, 1, 3), (12, 11, 13)]),
+        argnames="positiontup, expected",
+    )
+    def test_positional_no_processors(self, positiontup, expected):
+        getter, processors = self._plan(True, positiontup, {})
+        eq_(processors, ())
+        eq_(
+            self.module._process_positional_parameters(
+                [{"a": 1, "b": 2, "c": 3}, {"a": 11, "b": 12, "c": 13}],
+                getter,
+                processors,
+                tuple,
+            ),
+            expected,
+        )
+
+    def test_positional_processors(self):
+        getter, processors = self._plan(
+            True,
+            ("b", "a", "c"),
+            {"a": lambda value: value * 10, "c": str, "d": str},
+        )
+        eq_(
+            self.module._process_positional_parameters(
+                [{"a": 1, "b": 2, "c": 3}, {"a": 11, "b": None, "c": 13}],
+                getter,
+                processors,
+                list,
+            ),
+            [[2, 10, "3"], [None, 110, "13"]],
+        )
+
+    def test_named_processors(self):
+        getter, processors = self._plan(
+            False, None, {"a": lambda value: value * 10, "d": str}
+        )
+        compiled_parameters = [{"a": 1, "b": 2}, {"a": 11, "b": None}]
+        eq_(
+            self.module._process_named_parameters(
+                compiled_parameters, processors
+            ),
+            [{"a": 10, "b": 2}, {"a": 110, "b": None}],
+        )
+
+        # compiled parameters are not modified
+        eq_(compiled_parameters, [{"a": 1, "b": 2}, {"a": 11, "b": None}])
+
+
+class PyProcessParametersTest(_ProcessParametersTest):
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.engine import _py_util
+
+        cls.module = _py_util
+
+
+class CyProcessParametersTest(_ProcessParametersTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.cyextension import util
+
+        cls.module = util
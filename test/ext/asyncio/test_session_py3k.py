@@ -1,3 +1,5 @@
+import asyncio
+
 from sqlalchemy import Column
 from sqlalchemy import event
 from sqlalchemy import exc
@@ -12,6 +14,7 @@ from sqlalchemy import update
 from sqlalchemy.ext.asyncio import async_object_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio.base import ReversibleProxy
+from sqlalchemy.ext.horizontal_shard import AsyncShardedSession
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
@@ -23,6 +26,8 @@ from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import is_false
+from sqlalchemy.util.concurrency import await_only
+from sqlalchemy.util.concurrency import greenlet_spawn
 from .test_engine_py3k import AsyncFixture as _AsyncFixture
 from ...orm import _fixtures
 
@@ -878,3 +883,204 @@ class OverrideSyncSession(AsyncFixture):
 
         is_true(not isinstance(ass.sync_session, _MySession))
         is_(ass.sync_session_class, Session)
+
+
+class AsyncShardedSessionTest(AsyncFixture):
+    """Two shards against the same database, so that each shard returns
+    every row."""
+
+    @testing.fixture
+    def sharded_session(self, async_engine):
+        def shard_chooser(mapper, instance, clause=None):
+            return "high" if instance.id >= 9 else "low"
+
+        def id_chooser(query, ident):
+            return ["high"] if ident[0] >= 9 else ["low"]
+
+        def execute_chooser(orm_context):
+            return ["low", "high"]
+
+        return AsyncShardedSession(
+            shard_chooser=shard_chooser,
+            id_chooser=id_chooser,
+            execute_chooser=execute_chooser,
+            shards={
+                "low": async_engine,
+                "high": async_engine.execution_options(
+                    logging_token="high"
+                ),
+            },
+        )
+
+    def test_requires_async_engines(self, async_engine):
+        testing.assert_raises_message(
+            exc.ArgumentError,
+            "AsyncEngine expected, got Engine",
+            AsyncShardedSession,
+            shard_chooser=None,
+            id_chooser=None,
+            shards={"low": async_engine.sync_engine},
+        )
+
+    @async_test
+    async def test_get(self, sharded_session):
+        User = self.classes.User
+
+        u1 = await sharded_session.scalar(
+            select(User).where(User.id == 9),
+            bind_arguments={"shard_id": "high"},
+        )
+        eq_(u1.name, "fred")
+        eq_(inspect(u1).key[2], "high")
+
+        # located in the identity map using id_chooser
+        is_(await sharded_session.get(User, 9), u1)
+
+    @async_test
+    async def test_execute_all_shards(self, sharded_session):
+        User = self.classes.User
+
+        result = await sharded_session.execute(
+            select(User).order_by(User.id)
+        )
+        eq_(
+            [(u.id, inspect(u).key[2]) for u in result.scalars()],
+            [
+                (7, "low"),
+                (8, "low"),
+                (9, "low"),
+                (10, "low"),
+                (7, "high"),
+                (8, "high"),
+                (9, "high"),
+                (10, "high"),
+            ],
+        )
+
+    @async_test
+    async def test_execute_merge_key(self, sharded_session):
+        User = self.classes.User
+
+        result = await sharded_session.scalars(
+            select(User.id)
+            .order_by(User.id)
+            .execution_options(shard_merge_key=lambda row: row.id)
+        )
+        eq_(result.all(), [7, 7, 8, 8, 9, 9, 10, 10])
+
+    @async_test
+    async def test_execute_one_shard(self, sharded_session):
+        User = self.classes.User
+
+        result = await sharded_session.scalars(
+            select(User.id).order_by(User.id),
+            bind_arguments={"shard_id": "high"},
+        )
+        eq_(result.all(), [7, 8, 9, 10])
+
+    @async_test
+    async def test_stream(self, sharded_session):
+        User = self.classes.User
+
+        result = await sharded_session.stream_scalars(
+            select(User.id)
+            .order_by(User.id)
+            .execution_options(shard_merge_key=lambda row: row.id)
+        )
+        eq_(await result.all(), [7, 7, 8, 8, 9, 9, 10, 10])
+
+    @async_test
+    async def test_flush(self, sharded_session):
+        User = self.classes.User
+
+        u15 = User(id=15, name="u15")
+        sharded_session.add(u15)
+        await sharded_session.flush()
+
+        eq_(inspect(u15).key[2], "high")
+        is_(await sharded_session.get(User, 15), u15)
+        await sharded_session.rollback()
+
+    @testing.skip_if(
+        testing.requires._sqlite_memory_db,
+        "invalidating the connection discards the :memory: database",
+    )
+    @async_test
+    async def test_shard_timeout(self, sharded_session, async_engine):
+        User = self.classes.User
+
+        @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            if conn.get_execution_options().get("logging_token") == "high":
+                await_only(asyncio.sleep(5))
+
+        with testing.expect_raises_message(
+            exc.TimeoutError,
+            "Shard 'high' did not respond within 0.1 seconds",
+        ):
+            await sharded_session.execute(
+                select(User).execution_options(shard_timeout=0.1)
+            )
+
+        # the connection of the shard that timed out is invalidated
+        for shard_id, invalidated in (("low", False), ("high", True)):
+            conn = await sharded_session.connection(
+                bind_arguments={"shard_id": shard_id}
+            )
+            eq_(conn.invalidated, invalidated)
+
+        await sharded_session.close()
+
+    def _invoke_fixture(self, block=None, fail=None):
+        results = {shard_id: mock.Mock() for shard_id in ("low", "high")}
+
+        def invoke(shard_id):
+            if shard_id == block:
+                await_only(asyncio.sleep(5))
+            elif shard_id == fail:
+                raise ValueError("%s is down" % shard_id)
+            else:
+                await_only(asyncio.sleep(0))
+            return results[shard_id]
+
+        connections = {shard_id: mock.Mock() for shard_id in ("low", "high")}
+        return invoke, [connections["low"], connections["high"]], results
+
+    @async_test
+    async def test_shard_timeout_closes_results(self, sharded_session):
+        invoke, connections, results = self._invoke_fixture(block="high")
+
+        with testing.expect_raises_message(
+            exc.TimeoutError,
+            "Shard 'high' did not respond within 0.1 seconds",
+        ):
+            await greenlet_spawn(
+                sharded_session.sync_session._invoke_shards_concurrently,
+                ["low", "high"],
+                connections,
+                invoke,
+                0.1,
+            )
+
+        eq_(results["low"].close.mock_calls, [mock.call()])
+        eq_(results["high"].close.mock_calls, [])
+        eq_(
+            [conn.invalidate.mock_calls for conn in connections],
+            [[], [mock.call()]],
+        )
+
+    @async_test
+    async def test_shard_error_closes_results(self, sharded_session):
+        invoke, connections, results = self._invoke_fixture(fail="low")
+
+        with testing.expect_raises_message(ValueError, "low is down"):
+            await greenlet_spawn(
+                sharded_session.sync_session._invoke_shards_concurrently,
+                ["low", "high"],
+                connections,
+                invoke,
+                None,
+            )
+
+        eq_(results["low"].close.mock_calls, [])
+        eq_(results["high"].close.mock_calls, [mock.call()])
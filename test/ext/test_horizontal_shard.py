@@ -1,10 +1,13 @@
+import concurrent.futures
 import datetime
 import os
+import threading
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import delete
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import inspect
@@ -28,8 +31,11 @@ from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.sql import operators
 from sqlalchemy.sql import Select
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import provision
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.engines import testing_reaper
@@ -401,6 +407,48 @@ class ShardTest:
         t = bq(sess).with_post_criteria(lambda q: q.set_shard("asia")).one()
         eq_(t.city, tokyo.city)
 
+    def test_merge_key(self):
+        sess = self._fixture_data()
+
+        stmt = select(WeatherLocation).order_by(WeatherLocation.id)
+
+        eq_(
+            [loc.id for loc in sess.scalars(stmt)],
+            [2, 3, 1, 4, 5, 6, 7],
+        )
+        eq_(
+            [
+                loc.id
+                for loc in sess.scalars(
+                    stmt.execution_options(
+                        shard_merge_key=lambda row: row[0].id
+                    )
+                )
+            ],
+            [1, 2, 3, 4, 5, 6, 7],
+        )
+
+    def test_merge_key_desc(self):
+        sess = self._fixture_data()
+
+        stmt = (
+            select(WeatherLocation.id, WeatherLocation.continent)
+            .order_by(WeatherLocation.id.desc())
+            .execution_options(shard_merge_key=lambda row: -row.id)
+        )
+        eq_(
+            sess.execute(stmt).all(),
+            [
+                (7, "South America"),
+                (6, "South America"),
+                (5, "Europe"),
+                (4, "Europe"),
+                (3, "North America"),
+                (2, "North America"),
+                (1, "Asia"),
+            ],
+        )
+
     def test_shard_id_event(self):
         # this test is kind of important, it's testing that
         # when the load event is emitted for an ORM result,
@@ -717,6 +765,227 @@ class DistinctEngineShardTest(ShardTest, fixtures.MappedTest):
         )
 
 
+class ConcurrentShardTest(DistinctEngineShardTest):
+    """Run the shard tests with shards queried concurrently using a
+    thread pool."""
+
+    @classmethod
+    def setup_test_class(cls):
+        cls.executor = concurrent.futures.ThreadPoolExecutor(4)
+
+    @classmethod
+    def teardown_test_class(cls):
+        cls.executor.shutdown()
+
+    def _init_dbs(self):
+        # as in DistinctEngineShardTest, the first database uses
+        # SingletonThreadPool so that id_generator shares the connection
+        # in use by the session
+        self.dbs = [
+            testing_engine(
+                "sqlite:///shard%d_%s.db" % (i, provision.FOLLOWER_IDENT),
+                options=dict(
+                    connect_args={"check_same_thread": False},
+                    **(dict(poolclass=SingletonThreadPool) if i == 1 else {}),
+                ),
+            )
+            for i in range(1, 5)
+        ]
+        return self.dbs
+
+    @classmethod
+    def setup_session(cls):
+        super(ConcurrentShardTest, cls).setup_session()
+        sharded_session.configure(executor=cls.executor)
+
+    def test_statements_run_in_worker_threads(self):
+        sess = self._fixture_data()
+
+        threads = set()
+
+        for db in self.dbs:
+
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(conn, cursor, statement, *arg):
+                threads.add(threading.get_ident())
+
+        eq_(
+            sorted(sess.scalars(select(WeatherLocation.city))),
+            [
+                "Brasila",
+                "Dublin",
+                "London",
+                "New York",
+                "Quito",
+                "Tokyo",
+                "Toronto",
+            ],
+        )
+        assert threading.get_ident() not in threads
+
+    def test_shard_timeout(self):
+        sess = self._fixture_data()
+
+        proceed = threading.Event()
+
+        @event.listens_for(db3, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            proceed.wait(5)
+
+        with expect_raises_message(
+            exc.TimeoutError,
+            "Shard 'europe' did not respond within 0.1 seconds",
+        ):
+            sess.execute(
+                select(WeatherLocation).execution_options(shard_timeout=0.1)
+            )
+
+        # the connection of the shard that timed out is invalidated
+        shard_ids = ["north_america", "asia", "europe", "south_america"]
+        eq_(
+            {
+                shard_id: sess.connection(
+                    bind_arguments={"shard_id": shard_id}
+                ).invalidated
+                for shard_id in shard_ids
+            },
+            {
+                "north_america": False,
+                "asia": False,
+                "europe": True,
+                "south_america": False,
+            },
+        )
+
+        proceed.set()
+        self.executor.submit(lambda: None).result()
+        sess.close()
+
+    def test_shard_error(self):
+        sess = self._fixture_data()
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            raise ValueError("europe is down")
+
+        event.listen(db3, "before_cursor_execute", before_cursor_execute)
+
+        with expect_raises_message(ValueError, "europe is down"):
+            sess.execute(select(WeatherLocation))
+
+        event.remove(db3, "before_cursor_execute", before_cursor_execute)
+
+        eq_(
+            len(sess.execute(select(WeatherLocation)).all()),
+            7,
+        )
+
+    def _invoke_fixture(self, shard_ids, block=None, fail=None):
+        proceed = threading.Event()
+        results = {
+            shard_id: mock.Mock(name=shard_id) for shard_id in shard_ids
+        }
+
+        def invoke(shard_id):
+            if shard_id == block:
+                proceed.wait(5)
+            elif shard_id == fail:
+                raise ValueError("%s is down" % shard_id)
+            return results[shard_id]
+
+        connections = [
+            mock.Mock(name="%s_connection" % shard_id)
+            for shard_id in shard_ids
+        ]
+        return invoke, connections, results, proceed
+
+    def test_shard_timeout_closes_results(self):
+        sess = sharded_session()
+        invoke, connections, results, proceed = self._invoke_fixture(
+            ["asia", "europe", "north_america"], block="europe"
+        )
+
+        with expect_raises_message(
+            exc.TimeoutError,
+            "Shard 'europe' did not respond within 0.1 seconds",
+        ):
+            sess._invoke_shards_concurrently(
+                ["asia", "europe", "north_america"], connections, invoke, 0.1
+            )
+
+        # only the connection of the shard that timed out is invalidated
+        eq_(
+            [conn.invalidate.mock_calls for conn in connections],
+            [[], [mock.call()], []],
+        )
+
+        # results of the shards that responded are closed
+        eq_(results["asia"].close.mock_calls, [mock.call()])
+        eq_(results["north_america"].close.mock_calls, [mock.call()])
+
+        # the shard that timed out is closed when it completes, without
+        # being waited upon
+        closed = threading.Event()
+        results["europe"].close.side_effect = lambda: closed.set()
+        eq_(results["europe"].close.mock_calls, [])
+        proceed.set()
+        is_true(closed.wait(5))
+        eq_(results["europe"].close.mock_calls, [mock.call()])
+
+    def test_shard_error_closes_results(self):
+        sess = sharded_session()
+        invoke, connections, results, proceed = self._invoke_fixture(
+            ["asia", "europe", "north_america"], fail="europe"
+        )
+
+        with expect_raises_message(ValueError, "europe is down"):
+            sess._invoke_shards_concurrently(
+                ["asia", "europe", "north_america"], connections, invoke, None
+            )
+
+        eq_(results["asia"].close.mock_calls, [mock.call()])
+        eq_(results["europe"].close.mock_calls, [])
+        eq_(results["north_america"].close.mock_calls, [mock.call()])
+        eq_([conn.invalidate.mock_calls for conn in connections], [[], [], []])
+
+    def test_shard_timeout_deadline(self):
+        """the timeout applies to all of the shards together, rather than
+        to each one."""
+
+        sess = sharded_session()
+        shard_ids = ["asia", "europe", "north_america"]
+        invoke, connections, results, proceed = self._invoke_fixture(
+            shard_ids
+        )
+        now = [100.0]
+
+        def result(timeout):
+            now[0] += 0.25
+            return mock.Mock()
+
+        futures = [
+            mock.Mock(result=mock.Mock(side_effect=result))
+            for shard_id in shard_ids
+        ]
+        sess.executor = mock.Mock(submit=mock.Mock(side_effect=futures))
+
+        with mock.patch(
+            "sqlalchemy.ext.horizontal_shard.time",
+            mock.Mock(monotonic=lambda: now[0]),
+        ):
+            sess._invoke_shards_concurrently(
+                shard_ids, connections, invoke, 1
+            )
+
+        eq_(
+            [future.result.mock_calls for future in futures],
+            [
+                [mock.call(timeout=1)],
+                [mock.call(timeout=0.75)],
+                [mock.call(timeout=0.5)],
+            ],
+        )
+
+
 class AttachedFileShardTest(ShardTest, fixtures.MappedTest):
     """Use modern schema conventions along with SQLite ATTACH."""
 
@@ -1,13 +1,32 @@
+from sqlalchemy import case
 from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
 from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import defer
+from sqlalchemy.orm import immediateload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import lazyload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.assertions import is_
+from sqlalchemy.testing.assertions import is_false
+from sqlalchemy.testing.assertions import is_not
+from sqlalchemy.testing.assertions import is_true
 from sqlalchemy.testing.fixtures import fixture_session
+from sqlalchemy.testing.schema import Column
 from . import _fixtures
 
 # class GetFromIdentityTest(_fixtures.FixtureTest):
@@ -91,6 +110,323 @@ class InstancesTest(_fixtures.FixtureTest):
             q.from_statement(stmt).all,
         )
 
+    @testing.combinations(
+        (lambda User: select(User),),
+        (lambda User: select(User.id, User.name),),
+        (lambda User: select(User, User.name),),
+    )
+    def test_result_metadata_cached(self, stmt):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = testing.resolve_lambda(stmt, User=User)
+
+        r1 = s.execute(stmt.where(User.id == 7))
+        r2 = s.execute(stmt.where(User.id == 8))
+
+        is_(r1._metadata, r2._metadata)
+        is_(r1._attributes, r2._attributes)
+        eq_(r1.keys(), r2.keys())
+        eq_(len(r1.all()), 1)
+        eq_(len(r2.all()), 1)
+
+        r3 = s.execute(stmt.where(User.id == 9).execution_options(yield_per=5))
+        is_not(r1._metadata, r3._metadata)
+        eq_(r1.keys(), r3.keys())
+
+    def test_result_metadata_not_cached_for_raw_column(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        def go():
+            expr = case((User.id > 8, "x"), else_="y")
+            stmt = select(User.id, expr).where(User.id == 9)
+            row = s.execute(stmt).one()
+            eq_(row._mapping[expr], "x")
+            return row
+
+        r1, r2 = go(), go()
+        is_not(r1._parent, r2._parent)
+
+    def test_second_load_uses_cached_populators(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = select(User).where(User.id == 7)
+        u1 = s.execute(stmt).scalar_one()
+        s.expunge_all()
+        u2 = s.execute(stmt).scalar_one()
+
+        is_not(u1, u2)
+        eq_(u2.name, "jack")
+        eq_(
+            [a.email_address for a in u2.addresses],
+            ["jack@bean.com"],
+        )
+
+
+class ReadOnlyEntitiesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_basic(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = (
+            select(User)
+            .where(User.id.in_([7, 8]))
+            .order_by(User.id)
+            .execution_options(readonly_entities=True)
+        )
+        users = s.scalars(stmt).all()
+
+        eq_([(u.id, u.name) for u in users], [(7, "jack"), (8, "ed")])
+        for u in users:
+            is_true(isinstance(u, loading._ReadOnlyEntity))
+            is_false(isinstance(u, User))
+        eq_(len(s.identity_map), 0)
+
+        eq_(users[0]._asdict(), {"id": 7, "name": "jack"})
+        eq_(repr(users[0]), "User(id=7, name='jack')")
+
+        # the snapshot class is generated once per set of attributes
+        is_(type(s.scalars(stmt).first()), type(users[0]))
+
+    def test_read_only(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u = s.scalars(
+            select(User).where(User.id == 7),
+            execution_options={"readonly_entities": True},
+        ).one()
+
+        assert_raises_message(
+            AttributeError,
+            "User is a read-only snapshot of a User row",
+            setattr,
+            u,
+            "name",
+            "fred",
+        )
+        assert_raises(AttributeError, delattr, u, "name")
+        assert_raises(AttributeError, getattr, u, "addresses")
+        eq_(u.name, "jack")
+
+    def test_outerjoin_aliased(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        ua = aliased(User)
+        stmt = (
+            select(ua, Address)
+            .outerjoin(ua.addresses)
+            .where(ua.id.in_([9, 10]))
+            .order_by(ua.id, Address.id)
+            .execution_options(readonly_entities=True)
+        )
+        eq_(
+            [(u.id, a and a.email_address) for u, a in s.execute(stmt)],
+            [(9, "fred@fred.com"), (10, None)],
+        )
+        eq_(len(s.identity_map), 0)
+
+    def test_deferred_omitted(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u = s.scalars(
+            select(User)
+            .options(defer(User.name))
+            .where(User.id == 7)
+            .execution_options(readonly_entities=True)
+        ).one()
+        eq_(u._asdict(), {"id": 7})
+
+    @testing.combinations(selectinload, joinedload, argnames="loader")
+    def test_eager_loaders(self, loader):
+        User, Order = self.classes("User", "Order")
+
+        stmt = (
+            select(User)
+            .options(
+                loader(User.addresses),
+                loader(User.orders).options(loader(Order.items)),
+            )
+            .order_by(User.id)
+        )
+
+        def go(users):
+            return [
+                (
+                    u.id,
+                    [a.email_address for a in u.addresses],
+                    [(o.id, [i.id for i in o.items]) for o in u.orders],
+                )
+                for u in users
+            ]
+
+        expected = go(fixture_session().scalars(stmt).unique())
+
+        s = fixture_session()
+        users = (
+            s.scalars(stmt.execution_options(readonly_entities=True))
+            .unique()
+            .all()
+        )
+        eq_(go(users), expected)
+        eq_(len(s.identity_map), 0)
+
+        is_true(isinstance(users[0].addresses, tuple))
+        is_true(isinstance(users[0].addresses[0], loading._ReadOnlyEntity))
+        eq_(
+            sorted(users[0]._asdict()),
+            ["addresses", "id", "name", "orders"],
+        )
+
+    @testing.combinations(selectinload, joinedload, argnames="loader")
+    def test_eager_many_to_one(self, loader):
+        Address = self.classes.Address
+        s = fixture_session()
+
+        addresses = s.scalars(
+            select(Address)
+            .options(loader(Address.user))
+            .where(Address.id.in_([2, 3, 5]))
+            .order_by(Address.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+        eq_(
+            [(a.id, a.user.name) for a in addresses],
+            [(2, "ed"), (3, "ed"), (5, "fred")],
+        )
+        assert_raises(AttributeError, getattr, addresses[0], "dingaling")
+
+    @testing.combinations(subqueryload, immediateload)
+    def test_eager_loaders_raise(self, loader):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = select(User).execution_options(readonly_entities=True)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            r"Can't eagerly load User.addresses when the "
+            r"readonly_entities execution option is used; only the "
+            r"joinedload\(\) and selectinload\(\) strategies",
+            s.scalars,
+            stmt.options(loader(User.addresses)),
+        )
+
+        eq_(len(s.scalars(stmt.options(loader("*"), lazyload("*"))).all()), 4)
+
+
+class ReadOnlyEntitiesInheritanceTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class Employee(Base):
+            __tablename__ = "employee"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(50))
+            name = Column(String(50))
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "employee",
+            }
+
+        class Engineer(Employee):
+            __tablename__ = "engineer"
+            id = Column(ForeignKey("employee.id"), primary_key=True)
+            language = Column(String(50))
+
+            __mapper_args__ = {"polymorphic_identity": "engineer"}
+
+        class Manager(Employee):
+            status = Column(String(50))
+
+            __mapper_args__ = {"polymorphic_identity": "manager"}
+
+    @classmethod
+    def insert_data(cls, connection):
+        Employee, Engineer, Manager = cls.classes(
+            "Employee", "Engineer", "Manager"
+        )
+        with Session(connection) as s:
+            s.add_all(
+                [
+                    Engineer(id=1, name="e1", language="python"),
+                    Manager(id=2, name="m1", status="ok"),
+                    Employee(id=3, name="p1"),
+                ]
+            )
+            s.commit()
+
+    def test_polymorphic(self):
+        Employee = self.classes.Employee
+        s = fixture_session()
+
+        employees = s.scalars(
+            select(Employee)
+            .order_by(Employee.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+        eq_(
+            [(type(e).__name__, e.name) for e in employees],
+            [("Engineer", "e1"), ("Manager", "m1"), ("Employee", "p1")],
+        )
+
+        # columns local to a joined subclass table aren't in the row
+        eq_(
+            employees[0]._asdict(),
+            {"id": 1, "type": "engineer", "name": "e1"},
+        )
+
+    def test_with_polymorphic(self):
+        Employee = self.classes.Employee
+        s = fixture_session()
+
+        wp = with_polymorphic(Employee, "*")
+        employees = s.scalars(
+            select(wp)
+            .order_by(wp.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+        eq_(
+            [e._asdict() for e in employees],
+            [
+                {
+                    "id": 1,
+                    "type": "engineer",
+                    "name": "e1",
+                    "language": "python",
+                },
+                {"id": 2, "type": "manager", "name": "m1", "status": "ok"},
+                {"id": 3, "type": "employee", "name": "p1"},
+            ],
+        )
+
+    def test_subclass(self):
+        Manager = self.classes.Manager
+        s = fixture_session()
+
+        eq_(
+            [
+                e._asdict()
+                for e in s.scalars(
+                    select(Manager).execution_options(readonly_entities=True)
+                )
+            ],
+            [{"id": 2, "type": "manager", "name": "m1", "status": "ok"}],
+        )
+
 
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
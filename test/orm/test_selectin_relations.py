@@ -12,6 +12,7 @@ from sqlalchemy.orm import defaultload
 from sqlalchemy.orm import defer
 from sqlalchemy.orm import deferred
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import Load
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
@@ -2423,6 +2424,84 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             ),
         )
 
+    @testing.combinations(
+        (lambda A: selectinload(A.bs, chunksize=47),),
+        (lambda A: Load(A).selectinload(A.bs, chunksize=47),),
+        (lambda A: selectinload("*", chunksize=47),),
+    )
+    def test_chunksize_option(self, opt):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        opt = testing.resolve_lambda(opt, A=A)
+
+        def go():
+            q = session.query(A).options(opt).order_by(A.id)
+
+            for a in q:
+                a.bs
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id AS a_id FROM a ORDER BY a.id", {}),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                {"primary_keys": list(range(1, 48))},
+            ),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                {"primary_keys": list(range(48, 95))},
+            ),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                {"primary_keys": list(range(95, 101))},
+            ),
+        )
+
+    def test_chunksize_limited_by_dialect(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            with mock.patch.object(
+                testing.db.dialect, "insertmanyvalues_max_parameters", 60
+            ):
+                q = (
+                    session.query(A)
+                    .options(selectinload(A.bs, chunksize=1000))
+                    .order_by(A.id)
+                )
+
+                for a in q:
+                    a.bs
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id AS a_id FROM a ORDER BY a.id", {}),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                {"primary_keys": list(range(1, 61))},
+            ),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                {"primary_keys": list(range(61, 101))},
+            ),
+        )
+
     @testing.requires.independent_cursors
     def test_yield_per(self):
         # the docs make a lot of guarantees about yield_per
@@ -11,6 +11,7 @@ from sqlalchemy import Sequence
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import close_all_sessions
@@ -2043,6 +2044,7 @@ class SessionInterface(fixtures.MappedTest):
                     "bulk_update_mappings",
                     "bulk_insert_mappings",
                     "bulk_save_objects",
+                    "scalars_in_batches",
                 ]
             )
         )
@@ -2247,6 +2249,221 @@ class NewStyleExecutionTest(_fixtures.FixtureTest):
         is_(inspect(u1).session, None)
 
 
+class KeysetBatchesTest(fixtures.DeclarativeMappedTest):
+    run_setup_classes = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            data = Column(String(30))
+
+        class B(Base):
+            __tablename__ = "b"
+            x = Column(Integer, primary_key=True, autoincrement=False)
+            y = Column(Integer, primary_key=True, autoincrement=False)
+
+    @classmethod
+    def insert_data(cls, connection):
+        A, B = cls.classes("A", "B")
+
+        s = Session(connection)
+        s.add_all([A(id=i, data="d%d" % (i % 3)) for i in range(1, 11)])
+        s.add_all([B(x=x, y=y) for x in range(1, 4) for y in range(1, 4)])
+        s.commit()
+
+    @testing.combinations(1, 3, 5, 10, 15, argnames="batch_size")
+    def test_batches(self, batch_size):
+        A = self.classes.A
+
+        sess = fixture_session()
+        batches = list(
+            sess.scalars_in_batches(select(A), batch_size=batch_size)
+        )
+
+        eq_(
+            [[a.id for a in batch] for batch in batches],
+            [
+                list(range(1, 11))[i : i + batch_size]
+                for i in range(0, 10, batch_size)
+            ],
+        )
+
+    def test_where_criteria(self):
+        A = self.classes.A
+
+        sess = fixture_session()
+        eq_(
+            [
+                [a.id for a in batch]
+                for batch in sess.scalars_in_batches(
+                    select(A).where(A.data == "d1"), batch_size=2
+                )
+            ],
+            [[1, 4], [7, 10]],
+        )
+
+    @testing.combinations(1, 2, 4, argnames="batch_size")
+    def test_composite_primary_key(self, batch_size):
+        B = self.classes.B
+
+        sess = fixture_session()
+        result = [
+            [(b.x, b.y) for b in batch]
+            for batch in sess.scalars_in_batches(
+                select(B), batch_size=batch_size
+            )
+        ]
+        expected = [(x, y) for x in range(1, 4) for y in range(1, 4)]
+        eq_(
+            result,
+            [
+                expected[i : i + batch_size]
+                for i in range(0, len(expected), batch_size)
+            ],
+        )
+
+    def test_explicit_keyset(self):
+        A = self.classes.A
+
+        sess = fixture_session()
+        eq_(
+            [
+                [(a.data, a.id) for a in batch]
+                for batch in sess.scalars_in_batches(
+                    select(A), batch_size=4, keyset=(A.data, A.id)
+                )
+            ],
+            [
+                [("d0", 3), ("d0", 6), ("d0", 9), ("d1", 1)],
+                [("d1", 4), ("d1", 7), ("d1", 10), ("d2", 2)],
+                [("d2", 5), ("d2", 8)],
+            ],
+        )
+
+    def test_aliased_entity(self):
+        A = self.classes.A
+        a1 = aliased(A)
+
+        sess = fixture_session()
+        eq_(
+            [
+                [a.id for a in batch]
+                for batch in sess.scalars_in_batches(
+                    select(a1).where(a1.id > 5), batch_size=3
+                )
+            ],
+            [[6, 7, 8], [9, 10]],
+        )
+
+    def test_core_statement(self):
+        a = self.classes.A.__table__
+
+        sess = fixture_session()
+        eq_(
+            list(
+                sess.scalars_in_batches(
+                    select(a.c.data).where(a.c.id < 6),
+                    batch_size=2,
+                    keyset=[a.c.id],
+                )
+            ),
+            [["d1", "d2"], ["d0", "d1"], ["d2"]],
+        )
+
+    def test_core_statement_requires_keyset(self):
+        a = self.classes.A.__table__
+
+        sess = fixture_session()
+        with expect_raises_message(
+            sa.exc.ArgumentError, "keyset columns must be passed"
+        ):
+            sess.scalars_in_batches(select(a.c.data))
+
+    @testing.combinations(
+        lambda A: select(A).order_by(A.data),
+        lambda A: select(A).limit(5),
+        lambda A: select(A).offset(5),
+    )
+    def test_no_order_by_limit_offset(self, stmt):
+        A = self.classes.A
+
+        sess = fixture_session()
+        with expect_raises_message(
+            sa.exc.ArgumentError, "may not include ORDER BY, LIMIT or OFFSET"
+        ):
+            sess.scalars_in_batches(testing.resolve_lambda(stmt, A=A))
+
+    def test_statements_reuse_bound_parameters(self):
+        A = self.classes.A
+
+        sess = fixture_session()
+        with self.sql_execution_asserter(testing.db) as asserter:
+            for batch in sess.scalars_in_batches(select(A), batch_size=4):
+                pass
+
+        observed = asserter._final
+        eq_(len(observed), 3)
+
+        # the second and third batches make use of the same compiled
+        # statement, with different values for the keyset parameter
+        is_not(observed[0].context.compiled, observed[1].context.compiled)
+        is_(observed[1].context.compiled, observed[2].context.compiled)
+        eq_([obs.parameters[0]["keyset_0"] for obs in observed[1:]], [4, 8])
+
+    @testing.combinations(True, False, argnames="in_transaction")
+    def test_transaction_per_batch(self, in_transaction):
+        A = self.classes.A
+
+        sess = fixture_session()
+        commits = []
+        rollbacks = []
+        event.listen(sess, "after_commit", commits.append)
+        event.listen(sess, "after_rollback", rollbacks.append)
+
+        if in_transaction:
+            sess.begin()
+
+        for batch in sess.scalars_in_batches(select(A), batch_size=3):
+            is_true(sess.in_transaction())
+
+        eq_(len(commits), 0)
+        if in_transaction:
+            is_true(sess.in_transaction())
+            eq_(len(rollbacks), 0)
+        else:
+            is_false(sess.in_transaction())
+            eq_(len(rollbacks), 4)
+
+    @testing.combinations(True, False, argnames="commit")
+    def test_changes_not_committed_implicitly(self, commit):
+        A = self.classes.A
+
+        sess = fixture_session()
+        original = dict(sess.execute(select(A.id, A.data)).all())
+        sess.close()
+
+        for batch in sess.scalars_in_batches(select(A), batch_size=4):
+            for a in batch:
+                a.data = "changed"
+            if commit:
+                sess.commit()
+
+        sess.close()
+        if commit:
+            eq_(set(sess.scalars(select(A.data))), {"changed"})
+            for a in sess.scalars(select(A)):
+                a.data = original[a.id]
+            sess.commit()
+        else:
+            eq_(dict(sess.execute(select(A.id, A.data)).all()), original)
+
+
 class FlushWarningsTest(fixtures.MappedTest):
     run_setup_mappers = "each"
 
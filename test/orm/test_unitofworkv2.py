@@ -1,3 +1,4 @@
+from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -1817,6 +1818,65 @@ class BasicStaleChecksTest(fixtures.MappedTest):
             sess.flush,
         )
 
+    @testing.fixture
+    def pipeline_session(self):
+        dialect = config.db.dialect
+        pipeline = MagicMock()
+        with patch.object(dialect, "supports_pipeline", True), patch.object(
+            dialect, "do_pipeline", return_value=pipeline
+        ):
+            sess = fixture_session(
+                bind=config.db.execution_options(pipeline=True)
+            )
+            yield sess, pipeline
+
+    @testing.requires.sane_rowcount
+    def test_update_missing_pipelined(self, pipeline_session):
+        Parent, Child = self._fixture()
+        sess, pipeline = pipeline_session
+        p1 = Parent(id=1, data=2, child=Child(id=1, data=2))
+        sess.add(p1)
+        sess.flush()
+        sess.connection().exec_driver_sql("select 1")
+        pipeline.reset_mock()
+
+        sess.execute(self.tables.child.delete())
+        sess.execute(self.tables.parent.delete())
+
+        p1.data = 3
+        p1.child.data = 3
+
+        # the DELETE and UPDATE statements are sent in one pipeline; the
+        # rowcounts are checked once the flush actions are complete
+        assert_raises_message(
+            orm_exc.StaleDataError,
+            r"UPDATE statement on table 'parent' expected to "
+            r"update 1 row\(s\); 0 were matched.",
+            sess.flush,
+        )
+        eq_(pipeline.__enter__.call_count, 1)
+        eq_(pipeline.__exit__.call_count, 1)
+
+    @testing.requires.sane_multi_rowcount
+    def test_delete_multi_missing_warning_pipelined(self, pipeline_session):
+        Parent, Child = self._fixture()
+        sess, pipeline = pipeline_session
+        p1 = Parent(id=1, data=2, child=None)
+        p2 = Parent(id=2, data=3, child=None)
+        sess.add_all([p1, p2])
+        sess.flush()
+
+        sess.execute(self.tables.parent.delete())
+        sess.delete(p1)
+        sess.delete(p2)
+
+        assert_warns_message(
+            exc.SAWarning,
+            r"DELETE statement on table 'parent' expected to "
+            r"delete 2 row\(s\); 0 were matched.",
+            sess.flush,
+        )
+
     @testing.requires.sane_rowcount
     def test_update_single_missing_broken_multi_rowcount(self):
         @util.memoized_property
@@ -3209,6 +3269,113 @@ class EnsureCacheTest(UOWTest):
             eq_(len(inspect(User)._compiled_cache), 3)
 
 
+class DependencySortMemoTest(UOWTest):
+    def setup_test(self):
+        self._memo_patch = patch.object(
+            unitofwork, "_dependency_sort_memo", util.LRUCache(100)
+        )
+        self._memo_patch.start()
+
+    def teardown_test(self):
+        self._memo_patch.stop()
+        engines.testing_reaper.rollback_all()
+        with testing.db.begin() as conn:
+            conn.execute(self.tables.nodes.update().values(parent_id=None))
+
+    def _patch_topological(self):
+        topological = unitofwork.topological
+        return (
+            patch.object(
+                topological, "find_cycles", Mock(wraps=topological.find_cycles)
+            ),
+            patch.object(topological, "sort", Mock(wraps=topological.sort)),
+        )
+
+    def test_repeated_flush_memoized(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            User, users, properties={"addresses": relationship(Address)}
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+        sess = fixture_session()
+
+        def flush_user(name):
+            sess.add(
+                User(
+                    name=name,
+                    addresses=[Address(email_address="%s@x" % name)],
+                )
+            )
+            sess.flush()
+
+        flush_user("u1")
+
+        find_cycles_patch, sort_patch = self._patch_topological()
+        with find_cycles_patch as find_cycles, sort_patch as sort:
+            flush_user("u2")
+            flush_user("u3")
+
+            eq_(find_cycles.call_count, 0)
+            eq_(sort.call_count, 0)
+
+            # a flush with a different set of actions sorts again
+            sess.add(User(name="u4"))
+            sess.flush()
+
+            eq_(find_cycles.call_count, 1)
+            eq_(sort.call_count, 1)
+
+        sess.expunge_all()
+        eq_(
+            [
+                (u.name, [a.email_address for a in u.addresses])
+                for u in sess.query(User).order_by(User.id)
+            ],
+            [
+                ("u1", ["u1@x"]),
+                ("u2", ["u2@x"]),
+                ("u3", ["u3@x"]),
+                ("u4", []),
+            ],
+        )
+
+    def test_cycles_memoized(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        self.mapper_registry.map_imperatively(
+            Node, nodes, properties={"children": relationship(Node)}
+        )
+        sess = fixture_session()
+
+        def flush_node(data):
+            sess.add(Node(data=data, children=[Node(data="%s_c" % data)]))
+            sess.flush()
+
+        flush_node("n1")
+
+        find_cycles_patch, sort_patch = self._patch_topological()
+        with find_cycles_patch as find_cycles, sort_patch as sort:
+            flush_node("n2")
+
+            eq_(find_cycles.call_count, 0)
+            eq_(sort.call_count, 0)
+
+        sess.expunge_all()
+        eq_(
+            sorted(
+                (n.data, [c.data for c in n.children])
+                for n in sess.query(Node)
+            ),
+            [("n1", ["n1_c"]), ("n1_c", []), ("n2", ["n2_c"]), ("n2_c", [])],
+        )
+
+
 class ORMOnlyPrimaryKeyTest(fixtures.TestBase):
     @testing.requires.identity_columns
     @testing.requires.returning
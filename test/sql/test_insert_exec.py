@@ -1,16 +1,19 @@
 from sqlalchemy import and_
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import literal
+from sqlalchemy import select
 from sqlalchemy import Sequence
 from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import VARCHAR
 from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
@@ -645,3 +648,116 @@ class TableInsertTest(fixtures.TablesTest):
             (testing.db.dialect.default_sequence_base, "data", 5),
             inserted_primary_key=(),
         )
+
+
+class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
+    __backend__ = True
+    __requires__ = ("insert_executemany_returning",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", String(50)),
+            Column("z", Integer, server_default="5"),
+        )
+
+    def _capture_statements(self, connection):
+        statements = []
+
+        def go(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters, executemany))
+
+        self.event_listen(connection, "before_cursor_execute", go)
+        return statements
+
+    @testing.combinations(
+        (None, 1),
+        (5, 5),
+        (7, 4),
+        (10, 3),
+        (30, 1),
+        argnames="page_size, expected_batches",
+    )
+    def test_insert_returning_values(
+        self, connection, page_size, expected_batches
+    ):
+        t = self.tables.data
+
+        if page_size is not None:
+            connection = connection.execution_options(
+                insertmanyvalues_page_size=page_size
+            )
+
+        statements = self._capture_statements(connection)
+
+        data = [{"x": "x%d" % i, "y": "y%d" % i} for i in range(25)]
+        result = connection.execute(
+            t.insert().returning(t.c.x, t.c.y, t.c.z), data
+        )
+
+        eq_(
+            result.all(),
+            [("x%d" % i, "y%d" % i, 5) for i in range(25)],
+        )
+        eq_(len(statements), expected_batches)
+        for stmt, params, executemany in statements:
+            is_(executemany, False)
+
+        eq_(
+            connection.execute(
+                select(t.c.x, t.c.y).order_by(t.c.id)
+            ).all(),
+            [("x%d" % i, "y%d" % i) for i in range(25)],
+        )
+
+    def test_inserted_primary_key_rows(self, connection):
+        t = self.tables.data
+
+        result = connection.execute(
+            t.insert().return_defaults(),
+            [{"x": "x%d" % i, "y": "y%d" % i} for i in range(10)],
+        )
+        pks = [row[0] for row in result.inserted_primary_key_rows]
+        eq_(len(set(pks)), 10)
+
+        eq_(
+            connection.execute(
+                select(t.c.id, t.c.x).order_by(t.c.id)
+            ).all(),
+            [(pk, "x%d" % i) for i, pk in enumerate(pks)],
+        )
+
+    def test_no_returning_uses_executemany(self, connection):
+        t = self.tables.data
+
+        statements = self._capture_statements(connection)
+
+        connection.execute(
+            t.insert(), [{"x": "x%d" % i, "y": "y%d" % i} for i in range(10)]
+        )
+        if connection.dialect.use_insertmanyvalues_wo_returning:
+            eq_(len(statements), 1)
+            is_(statements[0][2], False)
+        else:
+            eq_(len(statements), 1)
+            is_(statements[0][2], True)
+
+    @testing.only_on("sqlite")
+    @testing.combinations(("qmark",), ("named",), argnames="style")
+    def test_paramstyles(self, style):
+        t = self.tables.data
+
+        eng = engines.testing_engine(options={"paramstyle": style})
+
+        with eng.begin() as conn:
+            t.create(conn, checkfirst=True)
+            conn = conn.execution_options(insertmanyvalues_page_size=4)
+            result = conn.execute(
+                t.insert().returning(t.c.x, t.c.y),
+                [{"x": "x%d" % i, "y": "y%d" % i} for i in range(10)],
+            )
+            eq_(result.all(), [("x%d" % i, "y%d" % i) for i in range(10)])
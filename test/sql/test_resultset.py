@@ -5,6 +5,7 @@ import csv
 from io import StringIO
 import operator
 import pickle
+import sys
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -2738,6 +2739,38 @@ class AlternateCursorResultTest(fixtures.TablesTest):
                     r = conn.execute(stmt)
                     eq_(r.scalar(), "HI THERE")
 
+    def test_resultprocessor_fused_cached(self):
+        class MyType(TypeDecorator):
+            impl = String()
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        with self.engine.connect() as conn:
+            cache = {}
+            conn = conn.execution_options(compiled_cache=cache)
+
+            stmt = select(
+                literal(1, type_=Integer()),
+                literal("THERE", type_=MyType()),
+                literal("x", type_=String()),
+                literal("YOU", type_=MyType()),
+            )
+            for i in range(2):
+                r = conn.execute(stmt)
+
+                # processors are fused into one callable for metadata that's
+                # cached on the compiled statement
+                is_true(r._metadata._row_processor)
+                eq_(r.all(), [(1, "HI THERE", "x", "HI YOU")])
+
+            (compiled,) = cache.values()
+            is_(
+                r._metadata._row_processor,
+                compiled._cached_metadata._row_processor,
+            )
+
     @testing.fixture
     def row_growth_fixture(self):
         with self._proxy_fixture(_cursor.BufferedRowCursorFetchStrategy):
@@ -2781,6 +2814,87 @@ class AlternateCursorResultTest(fixtures.TablesTest):
                 assertion[idx] = result.cursor_strategy._bufsize
             le_(len(result.cursor_strategy._rowbuffer), max_size)
 
+    @testing.combinations(
+        ("bytes", {"row_buffer_target_bytes": 1000000}),
+        ("time", {"row_buffer_target_time": 1000}),
+        argnames="options",
+        id_="ia",
+    )
+    def test_buffered_row_adaptive_unlimited(
+        self, row_growth_fixture, options
+    ):
+        """with a target set, the buffer isn't limited to 1000 rows"""
+
+        result = row_growth_fixture.execution_options(**options).execute(
+            self.table.select()
+        )
+        sizes = set()
+        for row in result:
+            sizes.add(result.cursor_strategy._bufsize)
+        is_true(max(sizes) > 1000)
+
+    def test_buffered_row_adaptive_bytes(self, row_growth_fixture):
+        result = row_growth_fixture.execution_options(
+            row_buffer_target_bytes=20000
+        ).execute(self.table.select())
+
+        for row in result:
+            le_(len(result.cursor_strategy._rowbuffer), 200)
+            le_(result.cursor_strategy._bufsize, 200)
+
+    def _adaptive_strategy(self, **options):
+        cursor = mock.Mock()
+        cursor.fetchmany.return_value = [(1, "some data")]
+        return _cursor.BufferedRowCursorFetchStrategy(cursor, options)
+
+    @testing.combinations(
+        # each row takes 1ms; grows by the growth factor at most
+        (10, 0.01, 50),
+        # target of 100 rows
+        (50, 0.05, 100),
+        (200, 0.2, 100),
+        # no measurable time; grows by the growth factor
+        (10, 0, 50),
+        argnames="size, elapsed, expected",
+    )
+    def test_adapt_bufsize_time(self, size, elapsed, expected):
+        strategy = self._adaptive_strategy(row_buffer_target_time=0.1)
+        eq_(
+            strategy._adapt_bufsize(
+                size, [(i, "some data") for i in range(size)], elapsed
+            ),
+            expected,
+        )
+
+    def test_adapt_bufsize_max_row_buffer(self):
+        strategy = self._adaptive_strategy(
+            row_buffer_target_time=0.1, max_row_buffer=30
+        )
+        eq_(strategy._adapt_bufsize(10, [(1, "x")] * 10, 0.001), 30)
+
+    def test_adapt_bufsize_bytes(self):
+        strategy = self._adaptive_strategy(
+            row_buffer_target_bytes=100000, row_buffer_target_time=0.1
+        )
+        row = (1, "x" * 10000)
+        row_size = (
+            sys.getsizeof(row) + sys.getsizeof(1) + sys.getsizeof(row[1])
+        )
+        eq_(
+            strategy._adapt_bufsize(10, [row] * 10, 0.001),
+            100000 // row_size,
+        )
+
+    def test_adapt_bufsize_yield_per(self, row_growth_fixture):
+        result = row_growth_fixture.execution_options(
+            row_buffer_target_bytes=100000
+        ).execute(self.table.select())
+        result = result.yield_per(15)
+
+        for row in result:
+            le_(len(result.cursor_strategy._rowbuffer), 15)
+            eq_(result.cursor_strategy._bufsize, 15)
+
     def test_buffered_fetchmany_fixed(self, row_growth_fixture):
         """The BufferedRow cursor strategy will defer to the fetchmany
         size passed when given rather than using the buffer growth
@@ -3259,3 +3373,105 @@ class GenerativeResultTest(fixtures.TablesTest):
             start += 20
 
         assert result._soft_closed
+
+    def _insert_columns_fixture(self, connection, num):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                {
+                    "user_id": i,
+                    "user_name": "user %s" % i if i % 3 else None,
+                    "x": i * 5,
+                    "y": i * 20,
+                }
+                for i in range(num)
+            ],
+        )
+        return users
+
+    @testing.combinations((None,), (1,), (7,), (500,), argnames="chunksize")
+    def test_columns_as_arrays(self, connection, chunksize):
+        users = self._insert_columns_fixture(connection, 100)
+
+        result = connection.execute(select(users).order_by(users.c.user_id))
+
+        eq_(
+            result.columns_as_arrays(chunksize=chunksize),
+            [
+                list(range(100)),
+                ["user %s" % i if i % 3 else None for i in range(100)],
+                [i * 5 for i in range(100)],
+                [i * 20 for i in range(100)],
+            ],
+        )
+        assert result._soft_closed
+
+    def test_columns_as_arrays_processors(self, connection):
+        users = self._insert_columns_fixture(connection, 10)
+
+        class AddFive(TypeDecorator):
+            impl = Integer
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return value + 5
+
+        result = connection.execute(
+            select(
+                type_coerce(users.c.x, AddFive), users.c.user_id
+            ).order_by(users.c.user_id)
+        )
+        eq_(
+            result.columns_as_arrays(),
+            [[i * 5 + 5 for i in range(10)], list(range(10))],
+        )
+
+    def test_columns_as_arrays_remaining_rows(self, connection):
+        users = self._insert_columns_fixture(connection, 10)
+
+        result = connection.execute(
+            select(users.c.user_id, users.c.y).order_by(users.c.user_id)
+        )
+        eq_(result.fetchmany(4), [(i, i * 20) for i in range(4)])
+        eq_(
+            result.columns_as_arrays(chunksize=3),
+            [list(range(4, 10)), [i * 20 for i in range(4, 10)]],
+        )
+
+    def test_columns_as_arrays_plus_columns(self, connection):
+        users = self._insert_columns_fixture(connection, 10)
+
+        result = connection.execute(select(users).order_by(users.c.user_id))
+
+        eq_(
+            result.columns("y", "user_id").columns_as_arrays(),
+            [[i * 20 for i in range(10)], list(range(10))],
+        )
+
+    def test_columns_as_arrays_no_rows(self, connection):
+        users = self.tables.users
+
+        result = connection.execute(select(users.c.user_id, users.c.x))
+        eq_(result.columns_as_arrays(), [[], []])
+
+    def test_columns_as_arrays_dml(self, connection):
+        users = self.tables.users
+
+        result = connection.execute(
+            users.insert(), {"user_id": 1, "user_name": "u1"}
+        )
+        with expect_raises_message(
+            exc.ResourceClosedError, "This result object does not return rows"
+        ):
+            result.columns_as_arrays()
+
+    def test_columns_as_arrays_unique(self, connection):
+        users = self._insert_columns_fixture(connection, 10)
+
+        result = connection.execute(select(users)).unique()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            r"Can't use columns_as_arrays\(\) with a uniquing result",
+        ):
+            result.columns_as_arrays()